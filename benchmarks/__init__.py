@@ -0,0 +1,6 @@
+"""Reproducible benchmarks for the NASA Sky Hub integration.
+
+Run from the repository root with the test requirements installed, e.g.
+``python -m benchmarks.pass_predictor``. Every benchmark uses synthetic
+data or a local server, never the real NASA or CelesTrak APIs.
+"""
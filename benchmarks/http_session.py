@@ -0,0 +1,137 @@
+"""Benchmark the shared HTTP session against a throwaway session per request.
+
+    python -m benchmarks.http_session [--requests 100]
+
+Both clients fetch a JSON body from a local HTTPS server with a
+self-signed certificate, so the cost of a fresh TCP and TLS handshake
+per request shows up without touching the real APIs.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import ssl
+import tempfile
+import time
+
+import aiohttp
+from aiohttp import web
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+from homeassistant.core import HomeAssistant
+
+from custom_components.nasa_sky_hub.api_client import create_client_session
+
+BODY = {"media_type": "image", "explanation": "x" * 20000}
+
+
+def self_signed_context(directory: Path) -> ssl.SSLContext:
+    """Return a server SSL context with a fresh certificate for localhost."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.now(timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(minutes=1))
+        .not_valid_after(now + timedelta(hours=1))
+        .sign(key, hashes.SHA256())
+    )
+    cert_file = directory / "cert.pem"
+    key_file = directory / "key.pem"
+    cert_file.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_file, key_file)
+    return context
+
+
+async def fetch_all(session_for_request, url: str, count: int) -> float:
+    """Make `count` sequential requests; return the mean latency in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(count):
+        async with session_for_request() as session:
+            async with session.get(url, ssl=False) as response:
+                await response.read()
+    return (time.perf_counter() - start) / count * 1000
+
+
+async def run(count: int) -> None:
+    """Serve the test endpoint and time both clients against it."""
+    peers: set[tuple] = set()
+
+    async def handler(request: web.Request) -> web.Response:
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.json_response(BODY)
+
+    app = web.Application()
+    app.router.add_get("/planetary/apod", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    with tempfile.TemporaryDirectory() as directory:
+        site = web.TCPSite(
+            runner, "127.0.0.1", 0, ssl_context=self_signed_context(Path(directory))
+        )
+        await site.start()
+    port = runner.addresses[0][1]
+    url = f"https://127.0.0.1:{port}/planetary/apod"
+
+    throwaway_ms = await fetch_all(aiohttp.ClientSession, url, count)
+    throwaway_connections = len(peers)
+
+    hass = HomeAssistant(tempfile.gettempdir())
+    shared = create_client_session(hass)
+
+    class Borrowed:
+        """Hand out the shared session without closing it."""
+
+        async def __aenter__(self) -> aiohttp.ClientSession:
+            return shared
+
+        async def __aexit__(self, *exc_info) -> None:
+            return None
+
+    peers.clear()
+    shared_ms = await fetch_all(Borrowed, url, count)
+    shared_connections = len(peers)
+
+    # The connector belongs to Home Assistant, which closes it on shutdown
+    connector = shared.connector
+    shared.detach()
+    await connector.close()
+    await runner.cleanup()
+
+    print(f"{count} sequential HTTPS requests")
+    print(
+        f"  throwaway session per request: {throwaway_ms:6.2f} ms/request, "
+        f"{throwaway_connections} connections"
+    )
+    print(
+        f"  shared session:                {shared_ms:6.2f} ms/request, "
+        f"{shared_connections} connections"
+    )
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark PassPredictor against Skyfield's find_events and the old stepping loop.
+
+    python -m benchmarks.pass_predictor [--satellites 30] [--hours 24]
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import timedelta
+import time
+
+from skyfield.api import EarthSatellite, wgs84
+
+from custom_components.nasa_sky_hub.ephemeris import get_timescale
+from custom_components.nasa_sky_hub.pass_predictor import PassPredictor
+from tests.common import REFERENCE_TIME, synthetic_tles
+
+
+def stepping_next_pass(satellite, observer, ts, start, hours):
+    """Find the first pass the way get_next_pass did: 6 min steps, then 1 min steps."""
+    difference = satellite - observer
+    end = start + timedelta(hours=hours)
+    current = start
+    while current < end:
+        if difference.at(ts.from_datetime(current)).altaz()[0].degrees > 0:
+            set_time = current
+            while set_time < end:
+                if difference.at(ts.from_datetime(set_time)).altaz()[0].degrees <= 0:
+                    break
+                set_time += timedelta(minutes=1)
+            return current, set_time
+        current += timedelta(hours=0.1)
+    return None
+
+
+def main() -> None:
+    """Time pass prediction for a synthetic catalog and compare pass counts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--satellites", type=int, default=30)
+    parser.add_argument("--hours", type=int, default=24)
+    args = parser.parse_args()
+
+    ts = get_timescale()
+    observer = wgs84.latlon(40.0, -75.0)
+    predictor = PassPredictor(ts, observer)
+    end = REFERENCE_TIME + timedelta(hours=args.hours)
+    t0 = ts.from_datetime(REFERENCE_TIME)
+    t1 = ts.from_datetime(end)
+    satellites = [
+        EarthSatellite(*lines, ts=ts)
+        for lines in synthetic_tles(args.satellites, seed=7).values()
+    ]
+
+    timings = {"predictor": 0.0, "skyfield": 0.0, "stepping": 0.0}
+    found = {"predictor": 0, "skyfield": 0, "stepping": 0}
+    for satellite in satellites:
+        start = time.perf_counter()
+        found["predictor"] += len(predictor.find_passes(satellite, REFERENCE_TIME, end))
+        timings["predictor"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        _, events = satellite.find_events(observer, t0, t1, altitude_degrees=0.0)
+        timings["skyfield"] += time.perf_counter() - start
+        found["skyfield"] += int((events == 2).sum())
+
+        start = time.perf_counter()
+        if stepping_next_pass(satellite, observer, ts, REFERENCE_TIME, args.hours):
+            found["stepping"] += 1
+        timings["stepping"] += time.perf_counter() - start
+
+    count = len(satellites)
+    print(f"{count} satellites, {args.hours} h window")
+    print(
+        f"  PassPredictor.find_passes (all passes): "
+        f"{timings['predictor'] / count * 1000:7.1f} ms/satellite, {found['predictor']} passes"
+    )
+    print(
+        f"  EarthSatellite.find_events (all sets):  "
+        f"{timings['skyfield'] / count * 1000:7.1f} ms/satellite, {found['skyfield']} sets"
+    )
+    print(
+        f"  old stepping loop (first pass only):    "
+        f"{timings['stepping'] / count * 1000:7.1f} ms/satellite, {found['stepping']} passes"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Benchmark rate limiter queueing latency for interactive and background requests.
+
+    python -m benchmarks.rate_limiter [--background 40] [--interactive 5]
+
+The limiter refills ten tokens a second with a burst of ten: requests
+queue the same way as at the real hourly rate, only faster, so every
+scenario finishes in seconds.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+
+from custom_components.nasa_sky_hub.const import RATE_LIMIT_INTERACTIVE_DEADLINE
+from custom_components.nasa_sky_hub.rate_limiter import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    RateLimiter,
+    RateLimitTimeout,
+    RequestTicket,
+    request_ticket,
+)
+
+# Ten requests a second
+LIMIT = 36000
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the `fraction` percentile of `values`."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def report(label: str, latencies: list[float]) -> None:
+    """Print the latency distribution of one request class."""
+    print(
+        f"  {label:32} n={len(latencies):3d} p50={percentile(latencies, 0.5):7.1f} ms "
+        f"p95={percentile(latencies, 0.95):7.1f} ms max={max(latencies):7.1f} ms"
+    )
+
+
+async def burst(background: int, interactive: int, interactive_priority: int) -> None:
+    """Queue a burst of polls, then service calls half a second later."""
+    limiter = RateLimiter(limit=LIMIT)
+    loop = asyncio.get_running_loop()
+    latencies: dict[str, list[float]] = {"background": [], "interactive": []}
+
+    async def request(kind: str, priority: int) -> None:
+        start = loop.time()
+        await limiter.acquire(priority=priority)
+        latencies[kind].append((loop.time() - start) * 1000)
+
+    tasks = [
+        asyncio.create_task(request("background", PRIORITY_BACKGROUND))
+        for _ in range(background)
+    ]
+    await asyncio.sleep(0.5)
+    tasks += [
+        asyncio.create_task(request("interactive", interactive_priority))
+        for _ in range(interactive)
+    ]
+    await asyncio.gather(*tasks)
+    report("background polls", latencies["background"])
+    report("service calls", latencies["interactive"])
+
+
+async def joiner(waiting: int, tighten: bool) -> float:
+    """Return how long a shared request waits once a service call joins it."""
+    limiter = RateLimiter(limit=LIMIT, burst=1)
+    loop = asyncio.get_running_loop()
+    await limiter.acquire()
+    polls = [
+        asyncio.create_task(limiter.acquire(priority=PRIORITY_BACKGROUND))
+        for _ in range(waiting)
+    ]
+    ticket = RequestTicket(PRIORITY_BACKGROUND, None)
+    token = request_ticket.set(ticket)
+    shared = asyncio.create_task(limiter.acquire())
+    request_ticket.reset(token)
+    await asyncio.sleep(0)
+
+    start = loop.time()
+    if tighten:
+        ticket.tighten(PRIORITY_INTERACTIVE, start + RATE_LIMIT_INTERACTIVE_DEADLINE)
+    await shared
+    waited = (loop.time() - start) * 1000
+    await asyncio.gather(*polls)
+    return waited
+
+
+async def deadline() -> float:
+    """Return how long a service call takes to fail during a 429 backoff."""
+    limiter = RateLimiter(limit=LIMIT)
+    await limiter.record_429()
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    try:
+        await limiter.acquire(
+            priority=PRIORITY_INTERACTIVE,
+            deadline=loop.time() + RATE_LIMIT_INTERACTIVE_DEADLINE,
+        )
+    except RateLimitTimeout:
+        pass
+    return (time.perf_counter() - start) * 1000
+
+
+async def run(background: int, interactive: int) -> None:
+    """Run every scenario and print the results."""
+    print(
+        f"Burst of {background} polls, {interactive} service calls 0.5 s later "
+        f"(10 requests/s, burst 10)"
+    )
+    print(" service calls at interactive priority:")
+    await burst(background, interactive, PRIORITY_INTERACTIVE)
+    print(" service calls at background priority, for comparison:")
+    await burst(background, interactive, PRIORITY_BACKGROUND)
+
+    print("Service call joining a request queued behind 20 polls")
+    print(f"  joiner tightens the request:     {await joiner(20, True):7.1f} ms")
+    print(f"  request keeps its priority:      {await joiner(20, False):7.1f} ms")
+
+    print("Service call during a 429 backoff")
+    print(f"  rejected after:                  {await deadline():7.3f} ms")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--background", type=int, default=40)
+    parser.add_argument("--interactive", type=int, default=5)
+    args = parser.parse_args()
+    # Keep the limiter's queueing and backoff logs out of the results
+    logging.getLogger("custom_components.nasa_sky_hub").setLevel(logging.ERROR)
+    asyncio.run(run(args.background, args.interactive))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark the vectorized visibility pass against the old per-satellite loop.
+
+    python -m benchmarks.satellite_propagation [--sizes 100 1000 10000] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from skyfield.api import EarthSatellite
+
+from custom_components.nasa_sky_hub.satellite_catalog import SatelliteCatalog
+from custom_components.nasa_sky_hub.satellite_tracker import SatelliteTracker
+from tests.common import REFERENCE_TIME, synthetic_tles
+
+
+def loop_positions(tracker, satellites, t) -> dict[int, tuple[float, float, float]]:
+    """Compute alt/az/distance one EarthSatellite at a time, as every poll used to."""
+    positions = {}
+    for norad_id, satellite in satellites.items():
+        altitude, azimuth, distance = (satellite - tracker.observer).at(t).altaz()
+        positions[norad_id] = (altitude.degrees, azimuth.degrees, distance.km)
+    return positions
+
+
+def best_of(repeat: int, func, *args):
+    """Return the fastest of `repeat` runs in seconds and the last result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    """Time one visibility pass per catalog size and check the results agree."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        tracker = SatelliteTracker(40.0, -75.0)
+        tracker.catalog = SatelliteCatalog.from_records(
+            [
+                (norad_id, f"SAT {norad_id}", line1, line2)
+                for norad_id, (line1, line2) in synthetic_tles(size).items()
+            ]
+        )
+        snapshot = asyncio.run(tracker.async_snapshot())
+        t = tracker.ts.from_datetime(REFERENCE_TIME)
+        satellites = {
+            norad_id: EarthSatellite(line1, line2, ts=tracker.ts)
+            for norad_id, _, line1, line2 in tracker.catalog.records()
+        }
+
+        loop_s, reference = best_of(args.repeat, loop_positions, tracker, satellites, t)
+        vector_s, (everything, _) = best_of(
+            args.repeat, tracker.compute_visible_satellites, snapshot, REFERENCE_TIME, -90.0
+        )
+        prefilter_s, (visible, prefilter) = best_of(
+            args.repeat, tracker.compute_visible_satellites, snapshot, REFERENCE_TIME
+        )
+
+        error = max(
+            max(
+                abs(sat["elevation"] - reference[sat["norad_id"]][0]),
+                abs((sat["azimuth"] - reference[sat["norad_id"]][1] + 180) % 360 - 180),
+                abs(sat["distance_km"] - reference[sat["norad_id"]][2]),
+            )
+            for sat in everything
+        )
+        expected = sum(1 for altitude, _, _ in reference.values() if altitude >= 0)
+        print(f"{len(snapshot.propagator)} satellites")
+        print(f"  per-satellite loop:            {loop_s * 1000:8.1f} ms")
+        print(
+            f"  vectorized, all objects:       {vector_s * 1000:8.1f} ms "
+            f"({loop_s / vector_s:.0f}x), max error {error:.1e}"
+        )
+        print(
+            f"  vectorized, above the horizon: {prefilter_s * 1000:8.1f} ms "
+            f"({loop_s / prefilter_s:.0f}x), {len(visible)}/{expected} visible, "
+            f"{prefilter['candidates']} candidates"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark the vectorized star catalog against the old per-star loop.
+
+    python -m benchmarks.star_catalog [--ephemeris de421.bsp] [--repeat 20]
+
+With an ephemeris the catalog's altitudes are also checked against
+Skyfield's apparent positions; without one only the timings are shown.
+"""
+from __future__ import annotations
+
+import argparse
+from math import asin, cos, degrees, radians, sin
+import time
+
+import numpy as np
+from skyfield.api import Star, load_file, wgs84
+
+from custom_components.nasa_sky_hub.ephemeris import get_timescale
+from custom_components.nasa_sky_hub.star_catalog import load_star_catalog
+from tests.common import REFERENCE_TIME
+
+LATITUDE = 40.0
+LONGITUDE = -75.0
+
+
+def loop_brightest(stars: list[dict[str, float]], lst_hours: float) -> float | None:
+    """Find the brightest star 10 deg up one star at a time, as get_brightest_object did."""
+    best = None
+    max_mag = float("inf")
+    lat_rad = radians(LATITUDE)
+    for star in stars:
+        ha_rad = radians((lst_hours - star["ra"]) * 15)
+        dec_rad = radians(star["dec"])
+        sin_alt = sin(dec_rad) * sin(lat_rad) + cos(dec_rad) * cos(lat_rad) * cos(ha_rad)
+        altitude = degrees(asin(max(-1.0, min(1.0, sin_alt))))
+        if altitude > 10 and star["mag"] < max_mag:
+            max_mag = star["mag"]
+            best = altitude
+    return best
+
+
+def best_of(repeat: int, func, *args) -> float:
+    """Return the fastest of `repeat` runs in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    """Time one all-sky star pass and the queries built on it."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ephemeris", help="JPL ephemeris file for the accuracy check")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    ts = get_timescale()
+    observer = wgs84.latlon(LATITUDE, LONGITUDE)
+    catalog = load_star_catalog()
+    t = ts.from_datetime(REFERENCE_TIME)
+    ra_hours = np.degrees(np.arctan2(catalog.unit_vectors[:, 1], catalog.unit_vectors[:, 0]))
+    ra_hours = ra_hours % 360 / 15
+    dec_deg = np.degrees(np.arcsin(catalog.unit_vectors[:, 2]))
+    stars = [
+        {"ra": ra, "dec": dec, "mag": mag}
+        for ra, dec, mag in zip(ra_hours, dec_deg, catalog.vmag)
+    ]
+    lst_hours = observer.lst_hours_at(t)
+
+    def vectorized() -> None:
+        positions = catalog.positions(observer.rotation_at(t))
+        catalog.brightest(positions, 1, min_altitude=10)
+        catalog.naked_eye_count(positions)
+
+    timings = {
+        "old loop, 8 stars": best_of(args.repeat, loop_brightest, stars[:8], lst_hours),
+        "old loop, whole catalog": best_of(args.repeat, loop_brightest, stars, lst_hours),
+        "vectorized pass + queries": best_of(args.repeat, vectorized),
+    }
+    print(f"{len(catalog)} stars")
+    for label, milliseconds in timings.items():
+        print(f"  {label + ':':31} {milliseconds:8.2f} ms")
+
+    if args.ephemeris:
+        eph = load_file(args.ephemeris)
+        positions = catalog.positions(observer.rotation_at(t))
+        altitude, _, _ = (
+            (eph["earth"] + observer)
+            .at(t)
+            .observe(Star(ra_hours=ra_hours, dec_degrees=dec_deg))
+            .apparent()
+            .altaz()
+        )
+        error = np.max(np.abs(altitude.degrees - positions.altitude_deg))
+        print(f"  {'max altitude error vs Skyfield:':31} {error:8.4f} deg")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,22 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 
-from .api_client import NASAApiClient
-from .const import DOMAIN
-from .rate_limiter import RateLimiter
+from .api_pool import async_acquire_pool, async_release_pool
+from .const import (
+    DOMAIN,
+    RATE_LIMIT_INTERACTIVE_DEADLINE,
+    TLE_STORAGE_KEY,
+    TLE_STORAGE_VERSION,
+)
+from .poll_scheduler import PollScheduler
+from .rate_limiter import (
+    PRIORITY_INTERACTIVE,
+    request_deadline_scope,
+    request_priority_scope,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,22 +74,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("  Enabled Modules: %s", enabled_modules)
     _LOGGER.info("  Profile: %s", profile)
 
-    # Initialize rate limiter
-    rate_limiter = RateLimiter(profile=profile)
-    _LOGGER.debug("Rate limiter initialized with profile: %s", profile)
+    # Rate limiter, response cache and API client, shared by entries with this key
+    pool = await async_acquire_pool(hass, entry)
+    rate_limiter = pool.rate_limiter
+    api_client = pool.api_client
+    _LOGGER.debug("API client pool %s ready", pool.key_id)
 
-    # Initialize API client
-    api_client = NASAApiClient(
-        api_key=api_key,
-        rate_limiter=rate_limiter,
-        hass=hass,
-    )
-    _LOGGER.debug("API client initialized")
+    # Stretches coordinator intervals as the API quota runs low, each entry
+    # polling within its fair share of the key's quota
+    poll_scheduler = PollScheduler(rate_limiter, share=pool.fair_share)
 
     # Store in hass.data
     hass.data[DOMAIN][entry.entry_id] = {
         "api_client": api_client,
         "rate_limiter": rate_limiter,
+        "api_pool": pool,
+        "poll_scheduler": poll_scheduler,
         "location": location,
         "enabled_modules": enabled_modules,
         "coordinators": {},  # Will be populated by platforms
@@ -107,12 +118,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         data = hass.data[DOMAIN].pop(entry.entry_id, {})
-        # Close API client session
-        if "api_client" in data:
-            await data["api_client"].async_close()
+        if "poll_scheduler" in data:
+            data["poll_scheduler"].stop()
+        # Close the API client session once no entry uses the key
+        await async_release_pool(hass, entry.entry_id)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the removed entry's TLE cache."""
+    await Store(
+        hass, TLE_STORAGE_VERSION, f"{TLE_STORAGE_KEY}.{entry.entry_id}"
+    ).async_remove()
+
+
 async def _register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Register custom services."""
     from .services import (
@@ -122,21 +141,34 @@ async def _register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
         async_calculate_satellite_passes,
     )
 
+    # Requests made on behalf of a service call go ahead of background polls
+    # and fail fast rather than keep the caller waiting
     async def refresh_all_service(call: Any) -> None:
         """Handle refresh_all service call."""
-        await async_refresh_all(hass, call)
+        with request_priority_scope(PRIORITY_INTERACTIVE), request_deadline_scope(
+            RATE_LIMIT_INTERACTIVE_DEADLINE
+        ):
+            await async_refresh_all(hass, call)
 
     async def refresh_module_service(call: Any) -> None:
         """Handle refresh_module service call."""
-        await async_refresh_module(hass, call)
+        with request_priority_scope(PRIORITY_INTERACTIVE), request_deadline_scope(
+            RATE_LIMIT_INTERACTIVE_DEADLINE
+        ):
+            await async_refresh_module(hass, call)
 
     async def prefetch_apod_range_service(call: Any) -> None:
         """Handle prefetch_apod_range service call."""
-        await async_prefetch_apod_range(hass, call)
+        # Each date gets its own deadline, see async_prefetch_apod_range
+        with request_priority_scope(PRIORITY_INTERACTIVE):
+            await async_prefetch_apod_range(hass, call)
 
     async def calculate_satellite_passes_service(call: Any) -> None:
         """Handle calculate_satellite_passes service call."""
-        await async_calculate_satellite_passes(hass, call)
+        with request_priority_scope(PRIORITY_INTERACTIVE), request_deadline_scope(
+            RATE_LIMIT_INTERACTIVE_DEADLINE
+        ):
+            await async_calculate_satellite_passes(hass, call)
 
     hass.services.async_register(DOMAIN, "refresh_all", refresh_all_service)
     hass.services.async_register(DOMAIN, "refresh_module", refresh_module_service)
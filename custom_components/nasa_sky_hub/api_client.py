@@ -1,13 +1,42 @@
 """NASA API client with rate limiting."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping
 from typing import Any
 
 import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
-from .const import EONET_API_BASE, NASA_API_BASE, SSD_API_BASE
-from .rate_limiter import RateLimiter
+from .circuit_breaker import STATE_CLOSED, STATE_OPEN, CircuitBreaker
+from .const import (
+    EONET_API_BASE,
+    HOST_EONET,
+    HOST_NASA_API,
+    HOST_RATE_LIMITS,
+    HOST_REQUEST_TIMEOUTS,
+    HOST_SSD,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+    HTTP_TOTAL_TIMEOUT,
+    NASA_API_BASE,
+    RATE_LIMIT_BACKGROUND_DEADLINE,
+    RESPONSE_CACHE_POLICIES,
+    SSD_API_BASE,
+)
+from .rate_limiter import (
+    PRIORITY_BACKGROUND,
+    RateLimiter,
+    RateLimitTimeout,
+    RequestTicket,
+    request_deadline,
+    request_priority,
+    request_ticket,
+)
+from .response_cache import CacheEntry, ResponseCache, cache_key
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,6 +44,44 @@ _LOGGER = logging.getLogger(__name__)
 class NASAApiError(Exception):
     """Base exception for NASA API errors."""
 
+    def __init__(self, message: str, status: int | None = None) -> None:
+        """Initialize the error with the HTTP status that caused it, if any."""
+        super().__init__(message)
+        self.status = status
+
+
+def _is_host_failure(err: BaseException) -> bool:
+    """Return whether `err` means the host is failing rather than the request being bad."""
+    if isinstance(err, NASAApiError):
+        if err.status is not None:
+            return err.status >= 500 or err.status == 429
+        err = err.__cause__
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status >= 500 or err.status == 429
+    return isinstance(err, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+def create_client_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Create the session shared by all of the integration's HTTP traffic.
+
+    Built on Home Assistant's pooled connector, which keeps connections
+    alive and caches DNS answers; requests carry HA's user agent and get
+    connect/read timeouts. Call detach() once the session is unused.
+    """
+    return async_create_clientsession(
+        hass,
+        auto_cleanup=False,
+        timeout=aiohttp.ClientTimeout(
+            total=HTTP_TOTAL_TIMEOUT,
+            connect=HTTP_CONNECT_TIMEOUT,
+            sock_read=HTTP_READ_TIMEOUT,
+        ),
+    )
+
+
+# (status, parsed JSON or None on 304, case-insensitive headers, body bytes)
+FetchResult = tuple[int, Any, Mapping[str, str], int]
+
 
 class NASAApiClient:
     """Client for NASA API requests."""
@@ -23,66 +90,336 @@ class NASAApiClient:
         self,
         api_key: str,
         rate_limiter: RateLimiter,
-        hass: Any,
+        hass: HomeAssistant,
+        cache: ResponseCache | None = None,
     ) -> None:
         """Initialize NASA API client."""
         self.api_key = api_key
         self.rate_limiter = rate_limiter
         self.hass = hass
+        self.cache = cache
         self._session: aiohttp.ClientSession | None = None
+        # Cache keys with a background revalidation in flight
+        self._revalidating: set[str] = set()
+        # Identical concurrent GETs share one task (single flight)
+        self._inflight: dict[str, tuple[asyncio.Future[Any], RequestTicket]] = {}
+        self._flight_stats = {"calls": 0, "coalesced": 0}
+        # Per-host limiters and circuit breakers; api.nasa.gov shares the
+        # limiter that tracks the key's quota
+        self.rate_limiters: dict[str, RateLimiter] = {HOST_NASA_API: rate_limiter}
+        for host, (limit, burst) in HOST_RATE_LIMITS.items():
+            self.rate_limiters[host] = RateLimiter(limit=limit, burst=burst)
+        self.breakers = {host: CircuitBreaker(host) for host in self.rate_limiters}
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None:
-            self._session = aiohttp.ClientSession()
+        """Get or create the pooled aiohttp session."""
+        if self._session is None or self._session.closed:
+            self._session = create_client_session(self.hass)
         return self._session
 
+    async def async_get_session(self) -> aiohttp.ClientSession:
+        """Return the client's pooled session for other integration traffic."""
+        return await self._get_session()
+
     async def async_close(self) -> None:
-        """Close the aiohttp session."""
+        """Release the aiohttp session; HA closes the shared connector itself."""
         if self._session:
-            await self._session.close()
+            self._session.detach()
             self._session = None
 
+    async def async_call_host(self, host: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run one request to `host` through its circuit breaker and rate limiter.
+
+        Raises NASAApiError at once while the host's circuit is open. Server
+        errors, 429s, timeouts and connection failures count against the
+        circuit; any other answer from the host closes it.
+        """
+        breaker = self.breakers[host]
+        # Anything let through a circuit that isn't closed is its probe
+        probe = breaker.state != STATE_CLOSED
+        if not breaker.allow():
+            raise NASAApiError(
+                f"{host} unavailable after repeated failures, "
+                f"retrying in {breaker.retry_after():.0f}s"
+            )
+        timeout = HOST_REQUEST_TIMEOUTS.get(host)
+        try:
+            await self.rate_limiters[host].acquire()
+            if timeout is None:
+                result = await call()
+            else:
+                result = await asyncio.wait_for(call(), timeout)
+        except RateLimitTimeout as err:
+            if probe:
+                breaker.release()
+            raise NASAApiError(f"Rate limited: {err}") from err
+        except asyncio.TimeoutError as err:
+            breaker.record_failure(err)
+            raise NASAApiError(f"{host} did not respond within {timeout}s") from err
+        except Exception as err:
+            if _is_host_failure(err):
+                breaker.record_failure(err)
+            else:
+                breaker.record_success()
+            raise
+        except BaseException:
+            if probe:
+                breaker.release()
+            raise
+        breaker.record_success()
+        return result
+
+    def get_host_diagnostics(self) -> dict[str, Any]:
+        """Return the circuit and rate limiter state of every upstream host."""
+        return {
+            host: {
+                "circuit": self.breakers[host].get_status(),
+                "rate_limiter": {
+                    key: value
+                    for key, value in self.rate_limiters[host].get_status().items()
+                    if key != "profile"
+                },
+            }
+            for host in self.breakers
+        }
+
+    async def _single_flight(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `call` once for all concurrent callers with the same key.
+
+        The request runs in its own task and callers await it through
+        asyncio.shield, so one caller being cancelled does not cancel the
+        request for the others. It is made at the highest priority and
+        the earliest deadline of its callers.
+        """
+        self._flight_stats["calls"] += 1
+        priority = request_priority.get()
+        deadline = request_deadline.get()
+        flight = self._inflight.get(key)
+        if flight is None:
+            ticket = RequestTicket(priority, deadline)
+            token = request_ticket.set(ticket)
+            try:
+                task = asyncio.ensure_future(call())
+            finally:
+                request_ticket.reset(token)
+            self._inflight[key] = (task, ticket)
+
+            def _done(finished: asyncio.Future[Any]) -> None:
+                current = self._inflight.get(key)
+                if current is not None and current[0] is finished:
+                    del self._inflight[key]
+                # Mark the exception retrieved even if every caller went away
+                if not finished.cancelled():
+                    finished.exception()
+
+            task.add_done_callback(_done)
+        else:
+            task, ticket = flight
+            ticket.tighten(priority, deadline)
+            self._flight_stats["coalesced"] += 1
+            _LOGGER.debug("Coalesced request for %s into the one in flight", key)
+        return await asyncio.shield(task)
+
+    def get_coalescing_stats(self) -> dict[str, int]:
+        """Return how many GETs were made and how many shared an in-flight request."""
+        return {**self._flight_stats, "in_flight": len(self._inflight)}
+
+    async def _cached(
+        self,
+        host: str,
+        url: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        fetch: Callable[[dict[str, str]], Awaitable[FetchResult]],
+    ) -> Any:
+        """Serve a GET to `host`, coalescing identical concurrent calls into one request."""
+        key = cache_key(url, params)
+        return await self._single_flight(
+            key,
+            lambda: self._cached_get(
+                key,
+                host,
+                endpoint,
+                lambda headers: self.async_call_host(host, lambda: fetch(headers)),
+            ),
+        )
+
+    async def _cached_get(
+        self,
+        key: str,
+        host: str,
+        endpoint: str,
+        fetch: Callable[[dict[str, str]], Awaitable[FetchResult]],
+    ) -> Any:
+        """Serve a GET from the response cache, fetching or revalidating as needed.
+
+        Fresh entries are returned directly. Expired entries still inside
+        their stale window are returned immediately while a background task
+        revalidates them with If-None-Match/If-Modified-Since. Anything else
+        is fetched, conditionally when an old copy exists. While the host's
+        circuit is open any cached copy is served, however old.
+        """
+        if self.cache is None or endpoint not in RESPONSE_CACHE_POLICIES:
+            _, data, _, _ = await fetch({})
+            return data
+
+        await self.cache.async_load()
+        entry = self.cache.get(key)
+        now = time.time()
+        if entry is not None and entry.is_fresh(now):
+            self.cache.record_hit(entry)
+            return entry.data
+        breaker = self.breakers[host]
+        if entry is not None and (entry.is_usable(now) or breaker.state != STATE_CLOSED):
+            self.cache.record_hit(entry, stale=True)
+            if breaker.state != STATE_CLOSED:
+                self.cache.stats["circuit_open_hits"] += 1
+            # A half-open circuit is probed by the background revalidation
+            if breaker.state != STATE_OPEN and key not in self._revalidating:
+                self._revalidating.add(key)
+                self.hass.async_create_task(
+                    self._async_revalidate(key, endpoint, fetch, entry)
+                )
+            return entry.data
+
+        self.cache.stats["misses"] += 1
+        try:
+            return await self._async_fetch_into_cache(key, endpoint, fetch, entry)
+        except NASAApiError:
+            # The failure may just have opened the circuit: fall back to the old copy
+            if entry is None or breaker.state == STATE_CLOSED:
+                raise
+            self.cache.record_hit(entry, stale=True)
+            self.cache.stats["circuit_open_hits"] += 1
+            return entry.data
+
+    async def _async_fetch_into_cache(
+        self,
+        key: str,
+        endpoint: str,
+        fetch: Callable[[dict[str, str]], Awaitable[FetchResult]],
+        entry: CacheEntry | None,
+    ) -> Any:
+        """Fetch `key` (conditionally if an old entry exists) and store the result."""
+        ttl, stale = RESPONSE_CACHE_POLICIES[endpoint]
+        status, data, headers, size = await fetch(
+            entry.conditional_headers() if entry is not None else {}
+        )
+        now = time.time()
+        if status == 304 and entry is not None:
+            _LOGGER.debug("Cached response for %s not modified", endpoint)
+            self.cache.stats["not_modified"] += 1
+            self.cache.touch(key, now + ttl, now + ttl + stale)
+            return entry.data
+        if status == 304:
+            raise NASAApiError(f"Unexpected 304 Not Modified for {endpoint}")
+
+        self.cache.stats["bytes_fetched"] += size
+        self.cache.put(
+            key,
+            CacheEntry(
+                data,
+                size,
+                expires=now + ttl,
+                stale_until=now + ttl + stale,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+            ),
+        )
+        return data
+
+    async def _async_revalidate(
+        self,
+        key: str,
+        endpoint: str,
+        fetch: Callable[[dict[str, str]], Awaitable[FetchResult]],
+        entry: CacheEntry,
+    ) -> None:
+        """Refresh a stale cache entry in the background."""
+        # Runs for nobody in particular, not for the caller that found it stale
+        request_ticket.set(None)
+        request_priority.set(PRIORITY_BACKGROUND)
+        request_deadline.set(asyncio.get_running_loop().time() + RATE_LIMIT_BACKGROUND_DEADLINE)
+        self.cache.stats["revalidations"] += 1
+        try:
+            await self._async_fetch_into_cache(key, endpoint, fetch, entry)
+        except NASAApiError as err:
+            _LOGGER.debug("Background revalidation of %s failed: %s", endpoint, err)
+        finally:
+            self._revalidating.discard(key)
+
     async def _request(
         self,
         method: str,
         endpoint: str,
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any] | list[Any]:
-        """Make an API request with rate limiting."""
-        _LOGGER.debug("Making API request: %s %s", method, endpoint)
-        await self.rate_limiter.acquire()
-
+        """Make an API request with rate limiting, through the response cache."""
         if params is None:
             params = {}
+        url = f"{NASA_API_BASE}{endpoint}"
+        if method != "GET":
+            _, data, _, _ = await self.async_call_host(
+                HOST_NASA_API, lambda: self._fetch(method, endpoint, params, {})
+            )
+            return data
+        return await self._cached(
+            HOST_NASA_API,
+            url,
+            endpoint,
+            params,
+            lambda headers: self._fetch(method, endpoint, dict(params), headers),
+        )
+
+    async def _fetch(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any],
+        headers: dict[str, str],
+    ) -> FetchResult:
+        """Make an api.nasa.gov request (rate limited by async_call_host)."""
+        _LOGGER.debug("Making API request: %s %s", method, endpoint)
+
         # Use actual API key for request, mask in logs
         params["api_key"] = self.api_key
         _LOGGER.debug("Request params: %s", {k: ("***" if k == "api_key" and v != "DEMO_KEY" else v) for k, v in params.items()})
 
         session = await self._get_session()
         url = f"{NASA_API_BASE}{endpoint}"
+        sent_at = asyncio.get_running_loop().time()
 
         try:
             _LOGGER.debug("Request URL: %s", url)
-            async with session.request(method, url, params=params) as response:
+            async with session.request(
+                method, url, params=params, headers=headers
+            ) as response:
                 _LOGGER.debug("Response status: %s", response.status)
                 # Record rate limit info
-                await self.rate_limiter.record_response(dict(response.headers))
+                await self.rate_limiter.record_response(
+                    response.headers, sent_at, response.status
+                )
                 _LOGGER.debug("Rate limit remaining: %s", self.rate_limiter.remaining)
 
                 if response.status == 429:
                     _LOGGER.warning("Rate limit 429 received for %s", endpoint)
                     await self.rate_limiter.record_429()
-                    raise NASAApiError("Rate limit exceeded")
+                    raise NASAApiError("Rate limit exceeded", 429)
+                if response.status == 304:
+                    return 304, None, response.headers, 0
 
                 response.raise_for_status()
                 data = await response.json()
                 _LOGGER.debug("Response received, data type: %s", type(data).__name__)
-                return data
+                return response.status, data, response.headers, len(await response.read())
 
         except aiohttp.ClientError as err:
             _LOGGER.error("NASA API request failed for %s: %s", endpoint, err)
-            raise NASAApiError(f"API request failed: {err}") from err
+            raise NASAApiError(
+                f"API request failed: {err}", getattr(err, "status", None)
+            ) from err
+        except NASAApiError:
+            raise
         except Exception as err:
             _LOGGER.exception("Unexpected error in API request to %s", endpoint)
             raise NASAApiError(f"Unexpected error: {err}") from err
@@ -126,20 +463,31 @@ class NASAApiClient:
         """
         params = {"days": days}
         # EONET uses a different base URL and doesn't require API key
-        session = await self._get_session()
         url = f"{EONET_API_BASE}/events"
-        
+        return await self._cached(
+            HOST_EONET, url, "/events", params, lambda headers: self._eonet_fetch(url, params, headers)
+        )
+
+    async def _eonet_fetch(
+        self, url: str, params: dict[str, Any], headers: dict[str, str]
+    ) -> FetchResult:
+        """Make an EONET request."""
+        session = await self._get_session()
         try:
             _LOGGER.debug("Making EONET API request: GET %s", url)
-            async with session.request("GET", url, params=params) as response:
+            async with session.request("GET", url, params=params, headers=headers) as response:
                 _LOGGER.debug("EONET response status: %s", response.status)
+                if response.status == 304:
+                    return 304, None, response.headers, 0
                 response.raise_for_status()
                 data = await response.json()
                 _LOGGER.debug("EONET response received, data type: %s", type(data).__name__)
-                return data
+                return response.status, data, response.headers, len(await response.read())
         except aiohttp.ClientError as err:
             _LOGGER.error("EONET API request failed: %s", err)
-            raise NASAApiError(f"EONET API request failed: {err}") from err
+            raise NASAApiError(
+                f"EONET API request failed: {err}", getattr(err, "status", None)
+            ) from err
         except Exception as err:
             _LOGGER.exception("Unexpected error in EONET API request")
             raise NASAApiError(f"Unexpected error: {err}") from err
@@ -157,35 +505,51 @@ class NASAApiClient:
         endpoint: str,
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Make a request to SSD/CNEOS API (no API key required)."""
-        _LOGGER.debug("Making SSD API request: GET %s", endpoint)
-        # SSD APIs don't use rate limiting (they're separate from api.nasa.gov)
-        # But we'll still use the session for connection pooling
-        
+        """Make a request to SSD/CNEOS API (no API key required), through the cache."""
         if params is None:
             params = {}
-        
+        url = f"{SSD_API_BASE}{endpoint}"
+        return await self._cached(
+            HOST_SSD, url, endpoint, params, lambda headers: self._ssd_fetch(endpoint, params, headers)
+        )
+
+    async def _ssd_fetch(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        headers: dict[str, str],
+    ) -> FetchResult:
+        """Make a request to SSD/CNEOS API."""
+        _LOGGER.debug("Making SSD API request: GET %s", endpoint)
+        # SSD has its own limiter and circuit, separate from api.nasa.gov's quota
         session = await self._get_session()
         url = f"{SSD_API_BASE}{endpoint}"
         
         try:
             _LOGGER.debug("SSD request URL: %s", url)
             _LOGGER.debug("SSD request params: %s", params)
-            async with session.request("GET", url, params=params) as response:
+            async with session.request("GET", url, params=params, headers=headers) as response:
                 _LOGGER.debug("SSD response status: %s", response.status)
                 
                 if response.status == 429:
                     _LOGGER.warning("Rate limit 429 received for %s", endpoint)
-                    raise NASAApiError("Rate limit exceeded")
+                    await self.rate_limiters[HOST_SSD].record_429()
+                    raise NASAApiError("Rate limit exceeded", 429)
+                if response.status == 304:
+                    return 304, None, response.headers, 0
                 
                 response.raise_for_status()
                 data = await response.json()
                 _LOGGER.debug("SSD response received, data type: %s", type(data).__name__)
-                return data
+                return response.status, data, response.headers, len(await response.read())
                 
         except aiohttp.ClientError as err:
             _LOGGER.error("SSD API request failed for %s: %s", endpoint, err)
-            raise NASAApiError(f"SSD API request failed: {err}") from err
+            raise NASAApiError(
+                f"SSD API request failed: {err}", getattr(err, "status", None)
+            ) from err
+        except NASAApiError:
+            raise
         except Exception as err:
             _LOGGER.exception("Unexpected error in SSD API request to %s", endpoint)
             raise NASAApiError(f"Unexpected error: {err}") from err
@@ -0,0 +1,124 @@
+"""API client, response cache and rate limiter shared by entries with one API key."""
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .api_client import NASAApiClient
+from .const import (
+    API_POOLS_KEY,
+    CONF_RESPONSE_CACHE_DISK,
+    DEFAULT_RESPONSE_CACHE_DISK,
+    RATE_LIMIT_STORAGE_KEY,
+    RATE_LIMIT_STORAGE_VERSION,
+    RESPONSE_CACHE_MAX_BYTES,
+    RESPONSE_CACHE_STORAGE_KEY,
+    RESPONSE_CACHE_STORAGE_VERSION,
+)
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache, StoreCacheBackend
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def api_key_id(api_key: str) -> str:
+    """Return a short, non-reversible ID for an API key, safe to log and persist."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+
+class ApiKeyPool:
+    """Client and limiter of one API key, shared by every entry that uses it.
+
+    The quota is per key, so entries share one rate limiter and see one
+    merged view of the X-RateLimit headers. Sharing the client also
+    shares its response cache and single-flight map, so location
+    independent requests (DONKI, APOD, Sentry, CAD, NeoWs, EONET) are
+    made once and fanned out to every entry.
+    """
+
+    def __init__(self, key_id: str, rate_limiter: RateLimiter, api_client: NASAApiClient) -> None:
+        """Initialize API key pool."""
+        self.key_id = key_id
+        self.rate_limiter = rate_limiter
+        self.api_client = api_client
+        self.entries: set[str] = set()
+
+    def fair_share(self) -> float:
+        """Return the fraction of the polling budget each entry may use."""
+        return 1 / max(len(self.entries), 1)
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return which entries share the key."""
+        return {
+            "key_id": self.key_id,
+            "entries": sorted(self.entries),
+            "fair_share": round(self.fair_share(), 3),
+        }
+
+
+async def async_acquire_pool(hass: HomeAssistant, entry: ConfigEntry) -> ApiKeyPool:
+    """Return the pool for the entry's API key, creating it for the first entry.
+
+    The first entry's profile and disk cache option apply to the pool. A
+    new pool restores the key's quota and backoff state from before the
+    last restart.
+    """
+    api_key = entry.data.get("api_key", "DEMO_KEY")
+    pools: dict[str, ApiKeyPool] = hass.data.setdefault(API_POOLS_KEY, {})
+    key_id = api_key_id(api_key)
+    pool = pools.get(key_id)
+    if pool is None:
+        rate_limiter = RateLimiter(
+            profile=entry.data.get("profile", "balanced"),
+            store=Store(
+                hass, RATE_LIMIT_STORAGE_VERSION, f"{RATE_LIMIT_STORAGE_KEY}.{key_id}"
+            ),
+        )
+
+        # Response cache, optionally persisted across restarts
+        cache_backend = None
+        if entry.options.get(CONF_RESPONSE_CACHE_DISK, DEFAULT_RESPONSE_CACHE_DISK):
+            cache_backend = StoreCacheBackend(
+                Store(
+                    hass,
+                    RESPONSE_CACHE_STORAGE_VERSION,
+                    f"{RESPONSE_CACHE_STORAGE_KEY}.{key_id}",
+                )
+            )
+        api_client = NASAApiClient(
+            api_key=api_key,
+            rate_limiter=rate_limiter,
+            hass=hass,
+            cache=ResponseCache(RESPONSE_CACHE_MAX_BYTES, cache_backend),
+        )
+        # Registered before loading so entries set up concurrently share it
+        pool = pools[key_id] = ApiKeyPool(key_id, rate_limiter, api_client)
+        _LOGGER.debug("Created API client pool %s", key_id)
+        await rate_limiter.async_load()
+    pool.entries.add(entry.entry_id)
+    if len(pool.entries) > 1:
+        _LOGGER.info(
+            "Entry %s shares API key %s with %s other entries",
+            entry.entry_id,
+            key_id,
+            len(pool.entries) - 1,
+        )
+    return pool
+
+
+async def async_release_pool(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove an entry from its pool, closing the client after the last one."""
+    pools: dict[str, ApiKeyPool] = hass.data.get(API_POOLS_KEY, {})
+    for key_id, pool in list(pools.items()):
+        if entry_id not in pool.entries:
+            continue
+        pool.entries.discard(entry_id)
+        if not pool.entries:
+            await pool.api_client.async_close()
+            del pools[key_id]
+            _LOGGER.debug("Closed API client pool %s", key_id)
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+import aiohttp
+
 from homeassistant.components.camera import Camera
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -34,16 +37,25 @@ async def async_setup_entry(
         return
 
     _LOGGER.info("Created APOD camera entity")
-    async_add_entities([APODCamera(coordinator)], update_before_add=False)
+    async_add_entities(
+        [APODCamera(coordinator, data["api_client"].async_get_session)],
+        update_before_add=False,
+    )
 
 
 class APODCamera(CoordinatorEntity, Camera):
     """Camera entity for Astronomy Picture of the Day."""
 
-    def __init__(self, coordinator: Any) -> None:
+    def __init__(
+        self,
+        coordinator: Any,
+        session_factory: Callable[[], Awaitable[aiohttp.ClientSession]],
+    ) -> None:
         """Initialize APOD camera."""
         CoordinatorEntity.__init__(self, coordinator)
         Camera.__init__(self)
+        # Pooled session of the API client, shared with all other requests
+        self._session_factory = session_factory
         self._attr_name = "NASA Sky Hub APOD"
         self._attr_unique_id = "nasa_sky_hub_apod"
         self._webrtc_provider = None  # Required by Camera base class
@@ -61,8 +73,6 @@ class APODCamera(CoordinatorEntity, Camera):
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return bytes of camera image."""
-        import aiohttp
-
         data = self.coordinator.data
         if data is None:
             return None
@@ -72,10 +82,10 @@ class APODCamera(CoordinatorEntity, Camera):
             return None
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    return await response.read()
+            session = await self._session_factory()
+            async with session.get(url) as response:
+                response.raise_for_status()
+                return await response.read()
         except Exception as err:
             _LOGGER.error("Failed to fetch APOD image: %s", err)
             return None
@@ -0,0 +1,129 @@
+"""Circuit breaker isolating the integration from a failing upstream host."""
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+
+from .const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_RECOVERY_TIMEOUT,
+    CIRCUIT_RECOVERY_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop calling a host after repeated failures and probe it before resuming.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests are refused without touching the network. Once the recovery
+    timeout passes it is half-open: a single probe request is let through,
+    closing the circuit on success or reopening it, with a doubled timeout,
+    on failure.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout: float = CIRCUIT_RECOVERY_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize circuit breaker."""
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_recovery_timeout = recovery_timeout
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self.last_error: str | None = None
+        self.last_failure: str | None = None
+        self.stats = {"opened": 0, "rejected": 0, "probes": 0}
+
+    @property
+    def state(self) -> str:
+        """Return closed, open, or half_open once the recovery timeout passed."""
+        if self._opened_at is None:
+            return STATE_CLOSED
+        if self._clock() - self._opened_at < self.recovery_timeout:
+            return STATE_OPEN
+        return STATE_HALF_OPEN
+
+    def allow(self) -> bool:
+        """Return whether a request may go out now, claiming the probe if half-open."""
+        state = self.state
+        if state == STATE_CLOSED:
+            return True
+        if state == STATE_HALF_OPEN and not self._probing:
+            self._probing = True
+            self.stats["probes"] += 1
+            _LOGGER.debug("Circuit for %s half-open, sending a probe request", self.name)
+            return True
+        self.stats["rejected"] += 1
+        return False
+
+    def retry_after(self) -> float:
+        """Return the seconds until the next probe may be sent."""
+        if self._opened_at is None:
+            return 0.0
+        return max(self._opened_at + self.recovery_timeout - self._clock(), 0.0)
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self._opened_at is not None:
+            _LOGGER.info("%s recovered, closing circuit", self.name)
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self.recovery_timeout = self.base_recovery_timeout
+
+    def record_failure(self, error: BaseException) -> None:
+        """Count a failed request, opening the circuit when the threshold is hit."""
+        self._failures += 1
+        self.last_error = str(error) or type(error).__name__
+        self.last_failure = datetime.now(timezone.utc).isoformat()
+        if self._probing:
+            # The probe failed: stay open, waiting longer before the next one
+            self._probing = False
+            self.recovery_timeout = min(self.recovery_timeout * 2, CIRCUIT_MAX_RECOVERY_TIMEOUT)
+            self._open()
+        elif self._opened_at is None and self._failures >= self.failure_threshold:
+            self._open()
+
+    def release(self) -> None:
+        """Give up the probe slot of a request that was cancelled."""
+        self._probing = False
+
+    def _open(self) -> None:
+        """Open the circuit from now."""
+        self._opened_at = self._clock()
+        self.stats["opened"] += 1
+        _LOGGER.warning(
+            "%s failed %s times (%s), pausing requests for %ss",
+            self.name,
+            self._failures,
+            self.last_error,
+            round(self.recovery_timeout),
+        )
+
+    def get_status(self) -> dict[str, Any]:
+        """Return the circuit state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "retry_after": round(self.retry_after(), 1),
+            "recovery_timeout": self.recovery_timeout,
+            "last_error": self.last_error,
+            "last_failure": self.last_failure,
+            **self.stats,
+        }
@@ -14,6 +14,11 @@ from homeassistant.helpers import config_validation as cv
 
 from .const import (
     ALL_MODULES,
+    CONF_DATA_DIR,
+    CONF_RESPONSE_CACHE_DISK,
+    CONF_SATELLITE_GROUPS,
+    DEFAULT_RESPONSE_CACHE_DISK,
+    DEFAULT_SATELLITE_GROUPS,
     DOMAIN,
     MODULE_APOD,
     MODULE_ASTEROIDS,
@@ -223,6 +228,24 @@ class NASASkyHubOptionsFlowHandler(config_entries.OptionsFlow):
                         "sky_interval",
                         default=300,
                     ): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
+                    vol.Optional(
+                        CONF_SATELLITE_GROUPS,
+                        default=self._config_entry.options.get(
+                            CONF_SATELLITE_GROUPS, ",".join(DEFAULT_SATELLITE_GROUPS)
+                        ),
+                    ): cv.string,
+                    vol.Optional(
+                        CONF_DATA_DIR,
+                        default=self._config_entry.options.get(
+                            CONF_DATA_DIR, self.hass.config.config_dir
+                        ),
+                    ): cv.string,
+                    vol.Optional(
+                        CONF_RESPONSE_CACHE_DISK,
+                        default=self._config_entry.options.get(
+                            CONF_RESPONSE_CACHE_DISK, DEFAULT_RESPONSE_CACHE_DISK
+                        ),
+                    ): cv.boolean,
                 }
             ),
         )
@@ -15,7 +15,85 @@ NEO_ENDPOINT = f"{NASA_API_BASE}/neo/rest/v1"
 
 # Celestrak endpoints
 CELESTRAK_BASE = "https://celestrak.org/NORAD/elements"
-CELESTRAK_TLE_URL = f"{CELESTRAK_BASE}/stations.txt"
+CELESTRAK_GROUP_URL = f"{CELESTRAK_BASE}/gp.php?GROUP={{group}}&FORMAT=tle"
+
+# CelesTrak groups merged into the tracked satellite catalog
+CONF_SATELLITE_GROUPS = "satellite_groups"
+DEFAULT_SATELLITE_GROUPS = ["stations"]
+
+# Local directory holding ephemeris kernels and IERS data (never downloaded)
+CONF_DATA_DIR = "data_dir"
+
+# On-disk TLE cache (HA storage helper), one per config entry since each
+# entry tracks its own satellite groups
+TLE_STORAGE_KEY = f"{DOMAIN}.tle_cache"
+TLE_STORAGE_VERSION = 1
+
+# Timeouts of the session shared by all outbound traffic (API, TLE downloads, camera)
+HTTP_CONNECT_TIMEOUT = 10
+HTTP_READ_TIMEOUT = 30
+HTTP_TOTAL_TIMEOUT = 60
+
+# Upstream hosts, each with its own rate limiter and circuit breaker
+HOST_NASA_API = "api.nasa.gov"
+HOST_SSD = "ssd-api.jpl.nasa.gov"
+HOST_EONET = "eonet.gsfc.nasa.gov"
+HOST_CELESTRAK = "celestrak.org"
+# (requests per hour, burst) for hosts without X-RateLimit headers;
+# api.nasa.gov follows the limits it reports
+HOST_RATE_LIMITS = {
+    HOST_SSD: (1800, 5),
+    HOST_EONET: (600, 5),
+    HOST_CELESTRAK: (120, 4),
+}
+# Per-request timeout (seconds), shorter than the session's total timeout
+HOST_REQUEST_TIMEOUTS = {
+    HOST_SSD: 20,
+    HOST_EONET: 20,
+    HOST_CELESTRAK: 30,
+}
+
+# Consecutive failures that open a host's circuit, and the wait (seconds)
+# before a half-open probe, doubled after each failed probe up to the max
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_RECOVERY_TIMEOUT = 60
+CIRCUIT_MAX_RECOVERY_TIMEOUT = 900
+
+# Per-endpoint timeout (seconds) for the concurrent DONKI requests
+DONKI_REQUEST_TIMEOUT = 20
+
+# DONKI events are kept for this many days; polls only fetch from the last
+# successful fetch minus an overlap, with a full-window resync now and then
+# to pick up late revisions of older events
+DONKI_WINDOW_DAYS = 3
+DONKI_FETCH_OVERLAP_HOURS = 12
+DONKI_RESYNC_HOURS = 6
+
+# API response cache: (TTL, extra seconds served stale while revalidating)
+# per endpoint path; endpoints not listed here always hit the network
+RESPONSE_CACHE_POLICIES = {
+    "/planetary/apod": (6 * 3600, 18 * 3600),
+    "/neo/rest/v1/feed": (3600, 6 * 3600),
+    "/sentry.api": (6 * 3600, 18 * 3600),
+    "/cad.api": (3 * 3600, 9 * 3600),
+    "/events": (1800, 3600),
+    # Short-lived so entries sharing an API key reuse each other's DONKI polls
+    "/DONKI/FLR": (300, 0),
+    "/DONKI/CME": (300, 0),
+    "/DONKI/GST": (300, 0),
+}
+RESPONSE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Keep the response cache on disk across restarts (HA storage helper),
+# written at most this many seconds after it changes to batch writes
+CONF_RESPONSE_CACHE_DISK = "response_cache_disk"
+DEFAULT_RESPONSE_CACHE_DISK = True
+RESPONSE_CACHE_STORAGE_KEY = f"{DOMAIN}.response_cache"
+RESPONSE_CACHE_STORAGE_VERSION = 1
+RESPONSE_CACHE_SAVE_DELAY = 60
+
+# hass.data key of the API clients shared per API key across entries
+API_POOLS_KEY = f"{DOMAIN}_api_pools"
 
 # SSD/CNEOS endpoints (JPL, no API key required)
 SSD_API_BASE = "https://ssd-api.jpl.nasa.gov"
@@ -75,6 +153,34 @@ DEFAULT_INTERVALS = {
 # Rate limit thresholds
 RATE_LIMIT_WARNING_THRESHOLD = 100
 RATE_LIMIT_DEGRADED_THRESHOLD = 50
+# Requests that may be made back to back before the hourly rate applies
+RATE_LIMIT_BURST = 10
+# Seconds a request may wait to be admitted: polls wait out the first 429
+# backoff, service calls fail fast instead of queueing behind polls
+RATE_LIMIT_BACKGROUND_DEADLINE = 150
+RATE_LIMIT_INTERACTIVE_DEADLINE = 15
+# Quota and 429 backoff state kept across restarts (HA storage helper), written
+# at most this many seconds after it changes
+RATE_LIMIT_STORAGE_KEY = f"{DOMAIN}.rate_limiter"
+RATE_LIMIT_STORAGE_VERSION = 1
+RATE_LIMIT_SAVE_DELAY = 10
+
+# api.nasa.gov requests made by one poll of each quota-consuming coordinator
+POLL_QUOTA_COSTS = {
+    MODULE_SPACE_WEATHER: 3,  # DONKI flares, CMEs and storms
+    MODULE_APOD: 1,
+    f"{MODULE_ASTEROIDS}_neows": 1,
+}
+# Relative share of a scarce quota; unlisted coordinators weigh 1
+POLL_PRIORITY_WEIGHTS = {
+    MODULE_SPACE_WEATHER: 3,
+    f"{MODULE_ASTEROIDS}_neows": 2,
+}
+# Polls never stretch beyond this multiple of the profile interval unless
+# the quota reset time is known and later
+POLL_MAX_STRETCH = 8
+# Quota kept back for service calls, at most this fraction of small limits
+POLL_RESERVE_FRACTION = 0.2
 
 # Space weather severity levels
 SEVERITY_QUIET = "quiet"
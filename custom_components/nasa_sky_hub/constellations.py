@@ -0,0 +1,95 @@
+"""Constellation visibility from an equal-area sky grid indexed by IAU boundary."""
+from __future__ import annotations
+
+import logging
+import math
+import threading
+
+import numpy as np
+from skyfield.api import load_constellation_map, load_constellation_names
+from skyfield.positionlib import position_of_radec
+
+_LOGGER = logging.getLogger(__name__)
+
+# Same cell count as a HEALPix nside=32 map (~3.4 square degrees per cell);
+# the smallest constellation, Crux, still spans about 20 cells
+GRID_CELLS = 12288
+
+_LOCK = threading.Lock()
+_grid: ConstellationGrid | None = None
+
+
+class ConstellationGrid:
+    """Equal-area sky cells, each tagged with the constellation containing it."""
+
+    def __init__(
+        self,
+        unit_vectors: np.ndarray,
+        cell_constellation: np.ndarray,
+        abbreviations: list[str],
+        names: list[str],
+    ) -> None:
+        """Initialize grid from precomputed cells."""
+        # ICRS unit vectors of the cell centres, shape (n, 3)
+        self.unit_vectors = unit_vectors
+        self.cell_constellation = cell_constellation
+        self.abbreviations = abbreviations
+        self.names = names
+        self._cell_counts = np.bincount(cell_constellation, minlength=len(names))
+
+    @classmethod
+    def build(cls, cells: int = GRID_CELLS) -> ConstellationGrid:
+        """Lay a Fibonacci lattice over the sky and classify each cell once."""
+        # Fibonacci lattice points have equal area to within a few percent
+        index = np.arange(cells) + 0.5
+        z = 1.0 - 2.0 * index / cells
+        lon = math.pi * (1.0 + math.sqrt(5.0)) * index
+        radius = np.sqrt(1.0 - z * z)
+        unit_vectors = np.column_stack([radius * np.cos(lon), radius * np.sin(lon), z])
+
+        constellation_at = load_constellation_map()
+        abbreviations, names = zip(*sorted(load_constellation_names()))
+        lookup = {abbreviation: idx for idx, abbreviation in enumerate(abbreviations)}
+        cell_abbreviations = constellation_at(position_of_radec(
+            np.degrees(lon) % 360.0 / 15.0, np.degrees(np.arcsin(z))
+        ))
+        cell_constellation = np.array(
+            [lookup[abbreviation] for abbreviation in cell_abbreviations], dtype=np.int16
+        )
+        return cls(unit_vectors, cell_constellation, list(abbreviations), list(names))
+
+    def fraction_above(
+        self, rotation: np.ndarray, min_altitude: float = 0.0
+    ) -> np.ndarray:
+        """Return, per constellation, the fraction of its area above `min_altitude`.
+
+        `rotation` is the observer's GCRS -> horizon matrix
+        (`observer.rotation_at(t)`).
+        """
+        # Only the vertical component of the horizon rotation is needed
+        up = self.unit_vectors @ rotation[2]
+        above = up > math.sin(math.radians(min_altitude))
+        counts = np.bincount(
+            self.cell_constellation[above], minlength=len(self.names)
+        )
+        return counts / self._cell_counts
+
+    def visibility(
+        self, rotation: np.ndarray, min_altitude: float = 0.0
+    ) -> dict[str, float]:
+        """Return every constellation name with its area fraction above `min_altitude`."""
+        fractions = self.fraction_above(rotation, min_altitude)
+        return {
+            name: round(float(fraction), 3)
+            for name, fraction in zip(self.names, fractions)
+        }
+
+
+def load_constellation_grid() -> ConstellationGrid:
+    """Return the process-wide constellation grid (blocking on first call, run in executor)."""
+    global _grid
+    with _LOCK:
+        if _grid is None:
+            _grid = ConstellationGrid.build()
+            _LOGGER.debug("Built constellation grid with %s cells", len(_grid.cell_constellation))
+        return _grid
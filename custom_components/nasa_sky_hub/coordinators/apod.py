@@ -9,7 +9,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from ..api_client import NASAApiClient, NASAApiError
-from ..const import MODULE_APOD
+from ..const import MODULE_APOD, RATE_LIMIT_BACKGROUND_DEADLINE
+from ..rate_limiter import request_deadline_scope
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,7 +46,8 @@ class APODCoordinator(DataUpdateCoordinator):
         }
         
         try:
-            data = await self.api_client.get_apod()
+            with request_deadline_scope(RATE_LIMIT_BACKGROUND_DEADLINE):
+                data = await self.api_client.get_apod()
             return {
                 "title": data.get("title", ""),
                 "date": data.get("date", ""),
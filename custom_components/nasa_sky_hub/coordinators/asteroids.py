@@ -9,7 +9,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from ..api_client import NASAApiClient, NASAApiError
-from ..const import MODULE_ASTEROIDS
+from ..const import MODULE_ASTEROIDS, RATE_LIMIT_BACKGROUND_DEADLINE
+from ..rate_limiter import request_deadline_scope
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,7 +39,8 @@ class SentryCoordinator(DataUpdateCoordinator):
         try:
             # Get summary of all Sentry-tracked objects (Mode S)
             # Filter to objects with Palermo Scale >= -3 (moderate risk or higher)
-            data = await self.api_client.get_sentry_summary(ps_min=-3)
+            with request_deadline_scope(RATE_LIMIT_BACKGROUND_DEADLINE):
+                data = await self.api_client.get_sentry_summary(ps_min=-3)
             
             now_utc = datetime.now(timezone.utc)
             
@@ -120,14 +122,15 @@ class CADCoordinator(DataUpdateCoordinator):
             # Get approaches within 10 lunar distances (about 0.025 AU)
             dist_max = "10LD"
             
-            data = await self.api_client.get_cad_close_approaches(
-                date_min=date_min,
-                date_max=date_max,
-                dist_max=dist_max,
-                body="Earth",
-                neo=True,
-                limit=50,  # Limit to top 50 closest approaches
-            )
+            with request_deadline_scope(RATE_LIMIT_BACKGROUND_DEADLINE):
+                data = await self.api_client.get_cad_close_approaches(
+                    date_min=date_min,
+                    date_max=date_max,
+                    dist_max=dist_max,
+                    body="Earth",
+                    neo=True,
+                    limit=50,  # Limit to top 50 closest approaches
+                )
             
             # Process CAD data
             approaches = []
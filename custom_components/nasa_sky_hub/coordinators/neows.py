@@ -9,7 +9,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from ..api_client import NASAApiClient, NASAApiError
-from ..const import MODULE_ASTEROIDS
+from ..const import MODULE_ASTEROIDS, RATE_LIMIT_BACKGROUND_DEADLINE
+from ..rate_limiter import request_deadline_scope
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -52,7 +53,8 @@ class NeoWsCoordinator(DataUpdateCoordinator):
             end_date = (now_utc + timedelta(days=self.days_ahead)).strftime("%Y-%m-%d")
             
             _LOGGER.info("Fetching NeoWs feed from %s to %s", start_date, end_date)
-            data = await self.api_client.get_neo_feed(start_date, end_date)
+            with request_deadline_scope(RATE_LIMIT_BACKGROUND_DEADLINE):
+                data = await self.api_client.get_neo_feed(start_date, end_date)
             
             # Process the feed data
             element_count = data.get("element_count", 0)
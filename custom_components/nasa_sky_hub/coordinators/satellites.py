@@ -2,15 +2,31 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from ..api_client import NASAApiClient
-from ..const import CELESTRAK_TLE_URL, ISS_NORAD_ID, MODULE_SATELLITES
-from ..satellite_tracker import SatelliteTracker
+from ..const import (
+    HOST_CELESTRAK,
+    ISS_NORAD_ID,
+    MODULE_SATELLITES,
+    RATE_LIMIT_BACKGROUND_DEADLINE,
+    TLE_STORAGE_KEY,
+    TLE_STORAGE_VERSION,
+)
+from ..rate_limiter import request_deadline_scope
+from ..satellite_tracker import (
+    ComputationCancelled,
+    SatelliteSnapshot,
+    SatelliteTracker,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,7 +39,10 @@ class SatelliteCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         api_client: NASAApiClient,
         location: dict[str, float],
+        entry_id: str,
         update_interval: int = 180,
+        groups: list[str] | None = None,
+        data_dir: str | None = None,
     ) -> None:
         """Initialize satellite coordinator."""
         super().__init__(
@@ -37,19 +56,46 @@ class SatelliteCoordinator(DataUpdateCoordinator):
         self.tracker = SatelliteTracker(
             latitude=location.get("latitude", 0),
             longitude=location.get("longitude", 0),
+            hass=hass,
+            session_factory=api_client.async_get_session,
+            request_guard=partial(api_client.async_call_host, HOST_CELESTRAK),
+            store=Store(hass, TLE_STORAGE_VERSION, f"{TLE_STORAGE_KEY}.{entry_id}"),
+            groups=groups,
+            data_dir=data_dir,
         )
+        # Cancellation token of the computation currently in the executor
+        self._inflight_cancel: threading.Event | None = None
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch satellite tracking data."""
+        # A new poll supersedes any computation still running in the executor
+        if self._inflight_cancel is not None:
+            self._inflight_cancel.set()
+        cancel = threading.Event()
+        self._inflight_cancel = cancel
+        poll_start = time.perf_counter()
+
         try:
             # Ensure ephemeris is loaded (in executor to avoid blocking)
             await self.tracker._ensure_eph_loaded(self.hass)
             # Update TLEs if needed (cache for 24 hours)
-            await self.tracker.update_tles_if_needed()
+            with request_deadline_scope(RATE_LIMIT_BACKGROUND_DEADLINE):
+                await self.tracker.update_tles_if_needed()
 
+            # One catalog snapshot for the whole refresh cycle
+            snapshot = await self.tracker.async_snapshot()
+            prepare_ms = (time.perf_counter() - poll_start) * 1000
             # Get current satellite positions (use UTC for consistency)
             now = datetime.now(timezone.utc)
-            satellites = await self.tracker.get_visible_satellites(now)
+
+            wait_start = time.perf_counter()
+            worker_result = await self.hass.async_add_executor_job(
+                self._compute, snapshot, now, cancel
+            )
+            wait_ms = (time.perf_counter() - wait_start) * 1000
+
+            satellites = worker_result["satellites"]
+            next_pass = worker_result["next_pass"]
 
             # Find ISS specifically
             iss_data = None
@@ -58,27 +104,80 @@ class SatelliteCoordinator(DataUpdateCoordinator):
                     iss_data = sat
                     break
 
-            # Find next pass
-            next_pass = await self.tracker.get_next_pass(ISS_NORAD_ID, now)
+            cache_stats = self.tracker.pop_cache_stats()
+            _LOGGER.debug(
+                "Satellite cache: %s TLEs parsed, %s parses saved this poll",
+                cache_stats["parsed_last_poll"],
+                cache_stats["parses_saved_last_poll"],
+            )
+
+            prefilter = worker_result["prefilter"]
+            _LOGGER.debug(
+                "Satellite pre-filter kept %s of %s objects (prune ratio %.2f)",
+                prefilter.get("candidates"),
+                prefilter.get("catalog"),
+                prefilter.get("prune_ratio", 0.0),
+            )
+
+            total_ms = (time.perf_counter() - poll_start) * 1000
+            timings = {
+                "worker_ms": round(worker_result["worker_ms"], 3),
+                "executor_wait_ms": round(wait_ms, 3),
+                # Everything outside the executor job; includes prepare_ms
+                "loop_ms": round(total_ms - wait_ms, 3),
+                # Ephemeris, TLE and snapshot checks; only polls that load
+                # or rebuild one of them await I/O or the executor here
+                "prepare_ms": round(prepare_ms, 3),
+                "total_ms": round(total_ms, 3),
+            }
+            _LOGGER.debug(
+                "Satellite poll: %.1f ms in worker, %.1f ms on event loop",
+                timings["worker_ms"],
+                timings["loop_ms"],
+            )
 
             return {
                 "satellites_overhead": len(satellites),
                 "satellites": satellites,
+                "satellites_observable": sum(
+                    1 for sat in satellites if sat.get("observable")
+                ),
                 "iss_overhead": iss_data is not None,
                 "iss_data": iss_data,
                 "next_pass": next_pass,
+                "satellite_cache": cache_stats,
+                "prefilter": prefilter,
+                "timings": timings,
                 "last_update": now.isoformat(),
             }
 
+        except ComputationCancelled:
+            _LOGGER.debug("Satellite computation superseded by a newer poll")
+            return self.data
+
         except Exception as err:
             _LOGGER.error("Error fetching satellite data: %s", err, exc_info=True)
             # Return default data instead of raising to allow retries
             return {
                 "satellites_overhead": 0,
                 "satellites": [],
+                "satellites_observable": 0,
                 "iss_overhead": False,
                 "iss_data": None,
                 "next_pass": None,
                 "last_update": datetime.now(timezone.utc).isoformat(),
                 "error": str(err),
             }
+
+        finally:
+            if self._inflight_cancel is cancel:
+                self._inflight_cancel = None
+
+    def _compute(
+        self, snapshot: SatelliteSnapshot, now: datetime, cancel: threading.Event
+    ) -> dict[str, Any]:
+        """Run the tracker's CPU-bound work in the executor and time it."""
+        start = time.perf_counter()
+        result = self.tracker.compute_poll(snapshot, now, cancel)
+        result["worker_ms"] = (time.perf_counter() - start) * 1000
+        return result
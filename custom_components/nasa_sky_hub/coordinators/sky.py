@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -9,6 +10,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from ..const import MODULE_SKY
+from ..ephemeris import EphemerisError
 from ..sky_calculator import SkyCalculator
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,6 +24,7 @@ class SkyCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         location: dict[str, float],
         update_interval: int = 300,
+        data_dir: str | None = None,
     ) -> None:
         """Initialize sky coordinator."""
         super().__init__(
@@ -34,19 +37,29 @@ class SkyCoordinator(DataUpdateCoordinator):
         self.calculator = SkyCalculator(
             latitude=location.get("latitude", 0),
             longitude=location.get("longitude", 0),
+            data_dir=data_dir,
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Calculate sky visibility data."""
         now = datetime.now(timezone.utc)
+        poll_start = time.perf_counter()
         
         # Return default values if calculator fails
         default_data = {
             "astronomical_night": False,
             "darkness_level": 0.0,
+            "moonlight": 0.0,
+            "moon": {},
+            "planets": [],
             "visible_constellations": [],
+            "constellation_visibility": {},
             "brightest_object": {"name": "Unknown", "type": "none", "magnitude": 0},
+            "brightest_stars": [],
+            "naked_eye_stars": 0,
             "sidereal_time": "00:00:00",
+            "upcoming_transitions": [],
+            "next_transitions": {},
             "good_stargazing": False,
             "last_update": now.isoformat(),
         }
@@ -59,56 +72,110 @@ class SkyCoordinator(DataUpdateCoordinator):
                 _LOGGER.warning("Ephemeris not loaded, returning default sky data")
                 return default_data
 
-            # Calculate various sky conditions with error handling
+            wait_start = time.perf_counter()
+            result = await self.hass.async_add_executor_job(self._compute, now)
+            timings = {
+                **result.pop("timings"),
+                "executor_wait_ms": round((time.perf_counter() - wait_start) * 1000, 3),
+                "total_ms": round((time.perf_counter() - poll_start) * 1000, 3),
+            }
+            _LOGGER.debug("Sky poll stage timings (ms): %s", timings)
+            return {**result, "timings": timings, "last_update": now.isoformat()}
+
+        except EphemerisError as err:
+            _LOGGER.error("Sky data unavailable, no usable ephemeris: %s", err)
+            return {**default_data, "error": str(err)}
+
+        except Exception as err:
+            _LOGGER.error("Error in sky coordinator update: %s", err, exc_info=True)
+            # Return default data instead of raising UpdateFailed
+            # This allows entities to register and show as unavailable rather than not existing
+            return default_data
+
+    def _compute(self, now: datetime) -> dict[str, Any]:
+        """Derive all sky data from one shared snapshot (runs in the executor)."""
+        calculator = self.calculator
+
+        # Time, observer, sidereal time and Sun/Moon positions, evaluated once
+        snapshot = calculator.snapshot(now)
+
+        # Twilight and moon events are root-found about once a day
+        with snapshot.stage("twilight"):
             try:
-                is_astronomical_night = self.calculator.is_astronomical_night(now)
+                calculator.update_twilight_schedule(snapshot.time)
+            except Exception as err:
+                _LOGGER.warning("Error computing twilight schedule: %s", err)
+            try:
+                is_astronomical_night = calculator.is_astronomical_night(snapshot)
             except Exception as err:
                 _LOGGER.warning("Error calculating astronomical night: %s", err)
                 is_astronomical_night = False
-                
             try:
-                darkness_level = self.calculator.get_darkness_level(now)
+                darkness_level = calculator.get_darkness_level(snapshot)
+                moonlight = calculator.get_moonlight(snapshot)
             except Exception as err:
                 _LOGGER.warning("Error calculating darkness level: %s", err)
                 darkness_level = 0.0
-                
+                moonlight = 0.0
+
+        with snapshot.stage("moon_planets"):
+            try:
+                moon = calculator.get_moon(snapshot)
+                planets = calculator.get_visible_planets(snapshot)
+            except Exception as err:
+                _LOGGER.warning("Error calculating moon and planets: %s", err)
+                moon = {}
+                planets = []
+
+        with snapshot.stage("constellations"):
             try:
-                visible_constellations = self.calculator.get_visible_constellations(now)
+                constellation_visibility = calculator.get_constellation_visibility(snapshot)
+                visible_constellations = calculator.get_visible_constellations(
+                    constellation_visibility
+                )
             except Exception as err:
                 _LOGGER.warning("Error calculating visible constellations: %s", err)
+                constellation_visibility = {}
                 visible_constellations = []
-                
+
+        with snapshot.stage("stars"):
             try:
-                brightest_object = self.calculator.get_brightest_object(now)
+                star_positions = calculator.get_star_positions(snapshot)
+                brightest_stars = calculator.get_brightest_stars(star_positions)
+                naked_eye_stars = calculator.get_naked_eye_star_count(star_positions)
             except Exception as err:
-                _LOGGER.warning("Error calculating brightest object: %s", err)
-                brightest_object = {"name": "Unknown", "type": "none", "magnitude": 0}
-                
+                _LOGGER.warning("Error calculating star positions: %s", err)
+                star_positions = None
+                brightest_stars = []
+                naked_eye_stars = 0
             try:
-                sidereal_time = self.calculator.get_sidereal_time(now)
+                brightest_object = calculator.get_brightest_object(
+                    snapshot, star_positions, planets
+                )
             except Exception as err:
-                _LOGGER.warning("Error calculating sidereal time: %s", err)
-                sidereal_time = "00:00:00"
-
-            # Determine if conditions are good for stargazing
-            good_conditions = (
-                is_astronomical_night
-                and darkness_level > 0.7
-                and len(visible_constellations) > 5
-            )
-
-            return {
-                "astronomical_night": is_astronomical_night,
-                "darkness_level": darkness_level,
-                "visible_constellations": visible_constellations,
-                "brightest_object": brightest_object,
-                "sidereal_time": sidereal_time,
-                "good_stargazing": good_conditions,
-                "last_update": now.isoformat(),
-            }
+                _LOGGER.warning("Error calculating brightest object: %s", err)
+                brightest_object = {"name": "Unknown", "type": "none", "magnitude": 0}
 
-        except Exception as err:
-            _LOGGER.error("Error in sky coordinator update: %s", err, exc_info=True)
-            # Return default data instead of raising UpdateFailed
-            # This allows entities to register and show as unavailable rather than not existing
-            return default_data
+        # Good stargazing: astronomical night with the Moon too faint or low
+        # to brighten the sky much (darkness is dimmed by moonlight). The
+        # visible constellation count is not a condition: every location
+        # always has dozens of constellations up
+        good_conditions = is_astronomical_night and darkness_level > 0.7
+
+        return {
+            "astronomical_night": is_astronomical_night,
+            "darkness_level": darkness_level,
+            "moonlight": round(moonlight, 3),
+            "moon": moon,
+            "planets": planets,
+            "visible_constellations": visible_constellations,
+            "constellation_visibility": constellation_visibility,
+            "brightest_object": brightest_object,
+            "brightest_stars": brightest_stars,
+            "naked_eye_stars": naked_eye_stars,
+            "sidereal_time": calculator.get_sidereal_time(snapshot),
+            "upcoming_transitions": calculator.get_upcoming_transitions(snapshot),
+            "next_transitions": calculator.get_next_transitions(snapshot),
+            "good_stargazing": good_conditions,
+            "timings": dict(snapshot.timings),
+        }
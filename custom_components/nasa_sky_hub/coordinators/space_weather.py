@@ -1,7 +1,10 @@
 """Space Weather coordinator."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -9,10 +12,38 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from ..api_client import NASAApiClient, NASAApiError
-from ..const import MODULE_SPACE_WEATHER, SEVERITY_ELEVATED, SEVERITY_QUIET, SEVERITY_SEVERE, SEVERITY_STORM
+from ..const import (
+    DONKI_FETCH_OVERLAP_HOURS,
+    DONKI_REQUEST_TIMEOUT,
+    DONKI_RESYNC_HOURS,
+    DONKI_WINDOW_DAYS,
+    MODULE_SPACE_WEATHER,
+    SEVERITY_ELEVATED,
+    SEVERITY_QUIET,
+    SEVERITY_SEVERE,
+    SEVERITY_STORM,
+)
+from ..rate_limiter import request_deadline_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# Unique ID and event time field of each DONKI endpoint's records
+DONKI_EVENT_FIELDS = {
+    "flares": ("flrID", "beginTime"),
+    "cmes": ("activityID", "startTime"),
+    "storms": ("gstID", "startTime"),
+}
+
+
+def _parse_donki_time(value: str | None) -> datetime | None:
+    """Parse a DONKI timestamp such as 2024-05-10T06:27Z."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
 
 class SpaceWeatherCoordinator(DataUpdateCoordinator):
     """Coordinator for space weather data."""
@@ -31,6 +62,134 @@ class SpaceWeatherCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=update_interval),
         )
         self.api_client = api_client
+        # DONKI endpoint fetchers, keyed by the data field they fill
+        self._endpoints: dict[str, Callable[[str, str], Awaitable[list[dict[str, Any]]]]] = {
+            "flares": api_client.get_donki_flr,
+            "cmes": api_client.get_donki_cme,
+            "storms": api_client.get_donki_gst,
+        }
+        # Events per endpoint keyed by their DONKI ID; kept when a fetch fails
+        self._events: dict[str, dict[str, dict[str, Any]]] = {}
+        # End of the last successful fetch and last full-window fetch per endpoint
+        self._high_water: dict[str, datetime] = {}
+        self._last_resync: dict[str, datetime] = {}
+        self._endpoint_stats: dict[str, dict[str, Any]] = {
+            name: {"requests": 0, "failures": 0} for name in self._endpoints
+        }
+
+    async def _async_fetch_endpoint(
+        self, name: str, start_date: str, end_date: str
+    ) -> list[dict[str, Any]]:
+        """Fetch one DONKI endpoint under its own timeout and record its latency."""
+        stats = self._endpoint_stats[name]
+        stats["requests"] += 1
+        start = time.perf_counter()
+        try:
+            # Fail fast in the rate limiter rather than queue past the timeout
+            with request_deadline_scope(DONKI_REQUEST_TIMEOUT):
+                events = await asyncio.wait_for(
+                    self._endpoints[name](start_date, end_date), DONKI_REQUEST_TIMEOUT
+                )
+        except asyncio.TimeoutError as err:
+            stats["failures"] += 1
+            stats["last_error"] = f"Timed out after {DONKI_REQUEST_TIMEOUT}s"
+            raise NASAApiError(f"DONKI {name} request timed out") from err
+        except Exception as err:
+            stats["failures"] += 1
+            stats["last_error"] = str(err)
+            raise
+        finally:
+            stats["latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        stats["last_success"] = datetime.now(timezone.utc).isoformat()
+        return events or []
+
+    def _fetch_start(self, name: str, now: datetime) -> datetime:
+        """Return where the next fetch of `name` starts: incremental or full window."""
+        window_start = now - timedelta(days=DONKI_WINDOW_DAYS)
+        high_water = self._high_water.get(name)
+        last_resync = self._last_resync.get(name)
+        if (
+            high_water is None
+            or last_resync is None
+            or now - last_resync >= timedelta(hours=DONKI_RESYNC_HOURS)
+        ):
+            return window_start
+        return max(high_water - timedelta(hours=DONKI_FETCH_OVERLAP_HOURS), window_start)
+
+    def _merge_events(
+        self,
+        name: str,
+        received: list[dict[str, Any]],
+        now: datetime,
+        start: datetime,
+    ) -> None:
+        """Merge fetched events into the index by ID and expire ones outside the window.
+
+        A full-window fetch replaces the index, so events DONKI retracted
+        since the last resync are dropped too.
+        """
+        id_field, time_field = DONKI_EVENT_FIELDS[name]
+        full_window = start <= now - timedelta(days=DONKI_WINDOW_DAYS)
+        previous_events = self._events.get(name, {})
+        events = {} if full_window else previous_events
+        new = updated = 0
+        for event in received:
+            event_id = event.get(id_field) or f"{event.get(time_field)}"
+            previous = previous_events.get(event_id)
+            if previous is None:
+                new += 1
+            elif previous != event:
+                updated += 1
+            events[event_id] = event
+        removed = len(previous_events.keys() - events.keys())
+        self._events[name] = events
+
+        # DONKI windows are whole UTC days, so expire by date like the query does
+        cutoff = (now - timedelta(days=DONKI_WINDOW_DAYS)).date()
+        expired = [
+            event_id
+            for event_id, event in events.items()
+            if (event_time := _parse_donki_time(event.get(time_field))) is None
+            or event_time.date() < cutoff
+        ]
+        for event_id in expired:
+            del events[event_id]
+
+        self._high_water[name] = now
+        if full_window:
+            self._last_resync[name] = now
+        self._endpoint_stats[name].update(
+            {
+                "fetch_start": start.strftime("%Y-%m-%d"),
+                "full_window": full_window,
+                "received": len(received),
+                "new": new,
+                "updated": updated,
+                "expired": len(expired),
+                "removed": removed,
+            }
+        )
+
+    def _sorted_events(self, name: str) -> list[dict[str, Any]]:
+        """Return the indexed events of `name` in time order."""
+        _, time_field = DONKI_EVENT_FIELDS[name]
+        return sorted(
+            self._events.get(name, {}).values(),
+            key=lambda event: event.get(time_field) or "",
+        )
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return per-endpoint DONKI latency, failures and indexed event counts."""
+        return {
+            name: {
+                **stats,
+                "cached_events": len(self._events[name]) if name in self._events else None,
+                "high_water": (
+                    self._high_water[name].isoformat() if name in self._high_water else None
+                ),
+            }
+            for name, stats in self._endpoint_stats.items()
+        }
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch space weather data."""
@@ -46,23 +205,41 @@ class SpaceWeatherCoordinator(DataUpdateCoordinator):
         }
         try:
             end_date = datetime.now(timezone.utc)
-            start_date = end_date - timedelta(days=3)
-            _LOGGER.debug("Fetching data from %s to %s", start_date.date(), end_date.date())
-
-            # Fetch flares, CMEs, and geomagnetic storms
-            flares = await self.api_client.get_donki_flr(
-                start_date.strftime("%Y-%m-%d"),
-                end_date.strftime("%Y-%m-%d"),
+            names = list(self._endpoints)
+            starts = {name: self._fetch_start(name, end_date) for name in names}
+            _LOGGER.debug(
+                "Fetching DONKI data until %s from %s",
+                end_date.date(),
+                {name: start.date().isoformat() for name, start in starts.items()},
             )
-            cmes = await self.api_client.get_donki_cme(
-                start_date.strftime("%Y-%m-%d"),
-                end_date.strftime("%Y-%m-%d"),
-            )
-            storms = await self.api_client.get_donki_gst(
-                start_date.strftime("%Y-%m-%d"),
-                end_date.strftime("%Y-%m-%d"),
+
+            # Fetch flares, CMEs, and geomagnetic storms concurrently
+            results = await asyncio.gather(
+                *(
+                    self._async_fetch_endpoint(
+                        name,
+                        starts[name].strftime("%Y-%m-%d"),
+                        end_date.strftime("%Y-%m-%d"),
+                    )
+                    for name in names
+                ),
+                return_exceptions=True,
             )
 
+            # A failed endpoint keeps its indexed events instead of resetting
+            errors = {}
+            for name, result in zip(names, results):
+                if isinstance(result, BaseException):
+                    _LOGGER.warning("DONKI %s fetch failed, keeping last data: %s", name, result)
+                    errors[name] = str(result)
+                else:
+                    self._merge_events(name, result, end_date, starts[name])
+            if not self._events:
+                raise NASAApiError("; ".join(f"{name}: {err}" for name, err in errors.items()))
+            flares = self._sorted_events("flares")
+            cmes = self._sorted_events("cmes")
+            storms = self._sorted_events("storms")
+
             # Process flares
             now_utc = datetime.now(timezone.utc)
             recent_flares = [
@@ -97,6 +274,8 @@ class SpaceWeatherCoordinator(DataUpdateCoordinator):
                 "storms": active_storms,
                 "last_update": now_utc.isoformat(),
             }
+            if errors:
+                result["errors"] = errors
             _LOGGER.info("Space weather data fetched: severity=%s, flares_24h=%s", severity, len(recent_flares))
             return result
 
@@ -8,7 +8,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 
-from .const import DOMAIN
+from . import ephemeris
+from .const import DOMAIN, MODULE_SATELLITES, MODULE_SKY, MODULE_SPACE_WEATHER
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -81,12 +82,36 @@ async def async_get_config_entry_diagnostics(
     if "rate_limiter" in data:
         diagnostics["rate_limiter"] = data["rate_limiter"].get_status()
 
+    if "api_pool" in data:
+        diagnostics["api_key_pool"] = data["api_pool"].get_diagnostics()
+
+    if "poll_scheduler" in data:
+        diagnostics["poll_schedule"] = data["poll_scheduler"].get_diagnostics()
+
     if "api_client" in data:
         diagnostics["api_status"] = {
             "api_key_set": bool(entry.data.get("api_key")),
             "api_key_is_demo": entry.data.get("api_key") == "DEMO_KEY",
             "session_active": data["api_client"]._session is not None,
         }
+        diagnostics["request_coalescing"] = data["api_client"].get_coalescing_stats()
+        diagnostics["hosts"] = data["api_client"].get_host_diagnostics()
+        if data["api_client"].cache is not None:
+            diagnostics["response_cache"] = data["api_client"].cache.get_diagnostics()
+
+    diagnostics["ephemeris"] = ephemeris.get_diagnostics()
+
+    satellites = data.get("coordinators", {}).get(MODULE_SATELLITES)
+    if satellites is not None:
+        diagnostics["satellite_catalog"] = satellites.tracker.get_diagnostics()
+
+    space_weather = data.get("coordinators", {}).get(MODULE_SPACE_WEATHER)
+    if space_weather is not None:
+        diagnostics["donki_endpoints"] = space_weather.get_diagnostics()
+
+    sky = data.get("coordinators", {}).get(MODULE_SKY)
+    if sky is not None and isinstance(sky.data, dict):
+        diagnostics["sky_timings"] = sky.data.get("timings", {})
 
     _LOGGER.info("Diagnostics generated: %s entities found", len(entities))
     return diagnostics
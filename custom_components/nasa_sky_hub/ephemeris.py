@@ -0,0 +1,241 @@
+"""Process-wide ephemeris and timescale shared by every coordinator.
+
+Everything is read from a local data directory; nothing is downloaded at
+runtime. Drop one or more JPL SPK kernels (``*.bsp``) and optionally an
+IERS ``finals2000A.all`` into the directory. Known JPL kernels are checked
+against built-in SHA-256 digests; a ``SHA256SUMS`` file in ``sha256sum``
+format adds digests for any other file.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from jplephem.spk import SPK
+from skyfield.api import Loader, load, load_file
+
+_LOGGER = logging.getLogger(__name__)
+
+CHECKSUM_FILE = "SHA256SUMS"
+IERS_FINALS_FILE = "finals2000A.all"
+
+# SHA-256 of the JPL kernels distributed by NAIF (the same files Skyfield
+# downloads); SHA256SUMS can add entries but never replace these
+KNOWN_KERNEL_SHA256 = {
+    "de421.bsp": "a20a7139da04cbc462454634918e9a9ca69127044e2cc9d4f9c16e238d2deedc",
+}
+
+# A kernel must cover this window from today to be picked
+EPHEMERIS_COVERAGE_DAYS = 730
+
+# (center, target) segments needed for the Sun, Earth and Moon
+REQUIRED_SEGMENTS = {(0, 3), (0, 10), (3, 301), (3, 399)}
+
+JD_UNIX_EPOCH = 2440587.5
+
+_LOCK = threading.Lock()
+# Timescales keyed by data directory (None for Skyfield's built-in tables)
+_timescales: dict[str | None, Any] = {}
+# Loaded kernels and their load statistics, keyed by absolute path
+_ephemerides: dict[str, Any] = {}
+_selected: dict[str, tuple[str, str]] = {}
+_load_stats: dict[str, dict[str, Any]] = {}
+
+
+class EphemerisError(Exception):
+    """Raised when no usable ephemeris is available in the data directory."""
+
+
+def _resident_bytes() -> int | None:
+    """Return the process resident set size, where the platform exposes it."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _julian_date(moment: datetime) -> float:
+    """Return the (UTC) Julian date of a timezone-aware datetime."""
+    return JD_UNIX_EPOCH + moment.timestamp() / 86400.0
+
+
+def _read_checksums(data_dir: str) -> dict[str, str]:
+    """Return the built-in kernel digests extended by the directory's SHA256SUMS."""
+    checksums = {}
+    path = os.path.join(data_dir, CHECKSUM_FILE)
+    if os.path.isfile(path):
+        with open(path, encoding="utf-8") as checksum_file:
+            for line in checksum_file:
+                parts = line.split()
+                if len(parts) == 2:
+                    checksums[parts[1].lstrip("*")] = parts[0].lower()
+    checksums.update(KNOWN_KERNEL_SHA256)
+    return checksums
+
+
+def _verify(path: str, checksums: dict[str, str]) -> str:
+    """Check a data file against its known digest and return the verification state."""
+    expected = checksums.get(os.path.basename(path))
+    if expected is None:
+        _LOGGER.warning(
+            "Cannot verify %s: not a known JPL kernel and not listed in %s",
+            path,
+            CHECKSUM_FILE,
+        )
+        return "unverified"
+    digest = hashlib.sha256()
+    with open(path, "rb") as data_file:
+        for chunk in iter(lambda: data_file.read(1 << 20), b""):
+            digest.update(chunk)
+    if digest.hexdigest() != expected:
+        raise EphemerisError(f"Checksum mismatch for {path}")
+    return "verified"
+
+
+def _kernel_coverage(path: str) -> tuple[float, float] | None:
+    """Return the Julian date range covered by the Sun/Earth/Moon segments."""
+    kernel = SPK.open(path)
+    try:
+        spans: dict[tuple[int, int], tuple[float, float]] = {}
+        for segment in kernel.segments:
+            key = (segment.center, segment.target)
+            if key in REQUIRED_SEGMENTS:
+                start, end = spans.get(key, (segment.start_jd, segment.end_jd))
+                spans[key] = (min(start, segment.start_jd), max(end, segment.end_jd))
+    finally:
+        kernel.close()
+    if set(spans) != REQUIRED_SEGMENTS:
+        return None
+    return max(s for s, _ in spans.values()), min(e for _, e in spans.values())
+
+
+def select_ephemeris(data_dir: str) -> tuple[str, str]:
+    """Return the smallest kernel in `data_dir` covering the coming years.
+
+    Returns the kernel path and its checksum verification state.
+    """
+    now = datetime.now(timezone.utc)
+    start_jd = _julian_date(now - timedelta(days=1))
+    end_jd = _julian_date(now + timedelta(days=EPHEMERIS_COVERAGE_DAYS))
+    checksums = _read_checksums(data_dir)
+
+    try:
+        names = os.listdir(data_dir)
+    except OSError as err:
+        raise EphemerisError(f"Cannot read ephemeris directory {data_dir}: {err}") from err
+    kernels = sorted(
+        (os.path.join(data_dir, name) for name in names if name.lower().endswith(".bsp")),
+        key=os.path.getsize,
+    )
+
+    for path in kernels:
+        try:
+            coverage = _kernel_coverage(path)
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Skipping unreadable ephemeris %s: %s", path, err)
+            continue
+        if coverage is None or coverage[0] > start_jd or coverage[1] < end_jd:
+            _LOGGER.debug("Ephemeris %s does not cover the required range", path)
+            continue
+        try:
+            return path, _verify(path, checksums)
+        except EphemerisError as err:
+            _LOGGER.error("%s", err)
+
+    raise EphemerisError(
+        f"No verified ephemeris covering the next {EPHEMERIS_COVERAGE_DAYS} days "
+        f"in {data_dir}; copy a JPL kernel such as de421.bsp there"
+    )
+
+
+def _build_timescale(data_dir: str | None) -> Any:
+    """Build a timescale from the directory's IERS data or the bundled tables."""
+    if data_dir is not None:
+        finals = os.path.join(data_dir, IERS_FINALS_FILE)
+        if os.path.isfile(finals):
+            try:
+                _verify(finals, _read_checksums(data_dir))
+                # The file exists, so the loader reads it instead of downloading
+                return Loader(data_dir, verbose=False).timescale(builtin=False)
+            except (EphemerisError, OSError, ValueError) as err:
+                _LOGGER.error("Ignoring %s: %s", finals, err)
+    return load.timescale(builtin=True)
+
+
+def get_timescale(data_dir: str | None = None) -> Any:
+    """Return the shared timescale for `data_dir` (blocking when reading IERS data).
+
+    Uses the directory's finals2000A.all when present and verified, and
+    Skyfield's bundled Delta T and leap-second tables otherwise.
+    """
+    with _LOCK:
+        if data_dir not in _timescales:
+            _timescales[data_dir] = _build_timescale(data_dir)
+        return _timescales[data_dir]
+
+
+def load_ephemeris(data_dir: str) -> Any:
+    """Load the best kernel of `data_dir` once per process (blocking, run in executor).
+
+    Skyfield opens SPK kernels through jplephem, which memory-maps the
+    segments, so every coordinator shares the same pages.
+    """
+    with _LOCK:
+        if data_dir not in _selected:
+            _selected[data_dir] = select_ephemeris(data_dir)
+        path, checksum = _selected[data_dir]
+        eph = _ephemerides.get(path)
+        if eph is not None:
+            return eph
+
+        rss_before = _resident_bytes()
+        start = time.perf_counter()
+        eph = load_file(path)
+        load_ms = (time.perf_counter() - start) * 1000
+        rss_after = _resident_bytes()
+
+        _ephemerides[path] = eph
+        _load_stats[path] = {
+            "file_bytes": os.path.getsize(path),
+            "coverage_jd": _kernel_coverage(path),
+            "checksum": checksum,
+            "load_ms": round(load_ms, 1),
+            "resident_delta_bytes": (
+                rss_after - rss_before
+                if rss_before is not None and rss_after is not None
+                else None
+            ),
+        }
+        _LOGGER.debug("Loaded ephemeris %s in %.1f ms", path, load_ms)
+        return eph
+
+
+async def async_get_ephemeris(hass: Any, data_dir: str) -> Any:
+    """Return the shared ephemeris, loading it in the executor if needed."""
+    if data_dir in _selected and _selected[data_dir][0] in _ephemerides:
+        return _ephemerides[_selected[data_dir][0]]
+    return await hass.async_add_executor_job(load_ephemeris, data_dir)
+
+
+async def async_get_timescale(hass: Any, data_dir: str) -> Any:
+    """Return the shared timescale for `data_dir`, reading files in the executor."""
+    if data_dir in _timescales:
+        return _timescales[data_dir]
+    return await hass.async_add_executor_job(get_timescale, data_dir)
+
+
+def get_diagnostics() -> dict[str, Any]:
+    """Return load time and memory footprint of every shared ephemeris."""
+    return {
+        "timescales": [
+            "builtin" if data_dir is None else data_dir for data_dir in _timescales
+        ],
+        "ephemerides": {path: dict(stats) for path, stats in _load_stats.items()},
+        "process_resident_bytes": _resident_bytes(),
+    }
@@ -0,0 +1,210 @@
+"""Satellite pass prediction using a coarse altitude grid and root refinement."""
+from __future__ import annotations
+
+import logging
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import numpy as np
+from skyfield.sgp4lib import theta_GMST1982
+
+_LOGGER = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400.0
+GOLDEN_RATIO = (math.sqrt(5.0) - 1.0) / 2.0
+
+# Sample peaks this far below the horizon are refined in case a short pass
+# crests the horizon between two grid points
+PEAK_SEARCH_MARGIN_DEG = 5.0
+
+
+class PassPredictor:
+    """Predict rise, culmination and set times of satellite passes."""
+
+    def __init__(
+        self,
+        ts: Any,
+        observer: Any,
+        step_seconds: float = 60.0,
+        tolerance_seconds: float = 0.01,
+    ) -> None:
+        """Initialize pass predictor."""
+        self.ts = ts
+        self.observer = observer
+        self.step_seconds = step_seconds
+        self.tolerance_seconds = tolerance_seconds
+        self._observer_itrs_km = observer.itrs_xyz.km
+        lat = observer.latitude.radians
+        lon = observer.longitude.radians
+        # Local "up" unit vector in the Earth-fixed frame
+        self._zenith = np.array([
+            math.cos(lat) * math.cos(lon),
+            math.cos(lat) * math.sin(lon),
+            math.sin(lat),
+        ])
+
+    def _altitude(
+        self, satrec: Any, t0: Any, offsets: np.ndarray
+    ) -> np.ndarray:
+        """Return altitude in degrees at `offsets` seconds after `t0`.
+
+        Works in the Earth-fixed frame: rotating TEME by GMST1982 gives the
+        same topocentric vector as Skyfield's GCRS route (the precession,
+        nutation and GAST terms cancel) at a fraction of the cost.
+        """
+        days = offsets / SECONDS_PER_DAY
+        whole = np.full(offsets.shape, t0.whole)
+        # SGP4 takes UTC Julian dates, the Earth rotation angle takes UT1
+        utc_fraction = t0.tai_fraction - t0._leap_seconds() / SECONDS_PER_DAY + days
+        errors, teme_km, _ = satrec.sgp4_array(whole, utc_fraction)
+        theta, _ = theta_GMST1982(whole, t0.ut1_fraction + days)
+        cos_t = np.cos(theta)
+        sin_t = np.sin(theta)
+        x, y, z = teme_km[:, 0], teme_km[:, 1], teme_km[:, 2]
+        dx = cos_t * x + sin_t * y - self._observer_itrs_km[0]
+        dy = -sin_t * x + cos_t * y - self._observer_itrs_km[1]
+        dz = z - self._observer_itrs_km[2]
+        distance = np.sqrt(dx * dx + dy * dy + dz * dz)
+        up = dx * self._zenith[0] + dy * self._zenith[1] + dz * self._zenith[2]
+        alt = np.degrees(np.arcsin(np.clip(up / distance, -1.0, 1.0)))
+        # Decayed or otherwise failed propagations never count as visible
+        return np.where(errors == 0, alt, -90.0)
+
+    def _bisect_crossings(
+        self,
+        altitude: Any,
+        lo: np.ndarray,
+        hi: np.ndarray,
+        lo_above: np.ndarray,
+    ) -> np.ndarray:
+        """Refine every horizon crossing bracket at once by bisection."""
+        while lo.size and np.max(hi - lo) > self.tolerance_seconds:
+            mid = (lo + hi) / 2.0
+            mid_above = altitude(mid) > 0.0
+            same_side = mid_above == lo_above
+            lo = np.where(same_side, mid, lo)
+            hi = np.where(same_side, hi, mid)
+        return (lo + hi) / 2.0
+
+    def _maximize(
+        self, altitude: Any, lo: np.ndarray, hi: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Locate the altitude maximum inside every bracket by golden-section search."""
+        a = lo.copy()
+        b = hi.copy()
+        c = b - GOLDEN_RATIO * (b - a)
+        d = a + GOLDEN_RATIO * (b - a)
+        fc = altitude(c)
+        fd = altitude(d)
+        while a.size and np.max(b - a) > self.tolerance_seconds:
+            left = fc > fd
+            a = np.where(left, a, c)
+            b = np.where(left, d, b)
+            x = np.where(left, b - GOLDEN_RATIO * (b - a), a + GOLDEN_RATIO * (b - a))
+            fx = altitude(x)
+            c, d = np.where(left, x, d), np.where(left, c, x)
+            fc, fd = np.where(left, fx, fd), np.where(left, fc, fx)
+        best = np.where(fc > fd, c, d)
+        return best, np.maximum(fc, fd)
+
+    def find_passes(
+        self,
+        satellite: Any,
+        start_time: datetime,
+        end_time: datetime,
+        min_altitude: float = 0.0,
+    ) -> list[dict[str, Any]]:
+        """Return every pass of `satellite` above `min_altitude` in the window.
+
+        A pass already in progress at `start_time` starts at the window start,
+        and one still in progress at `end_time` ends at the window end.
+        """
+        if start_time.tzinfo is None:
+            start_time = start_time.replace(tzinfo=timezone.utc)
+        if end_time.tzinfo is None:
+            end_time = end_time.replace(tzinfo=timezone.utc)
+        window = (end_time - start_time).total_seconds()
+        if window <= 0:
+            return []
+
+        t0 = self.ts.from_datetime(start_time)
+        satrec = satellite.model
+
+        def altitude(offsets: np.ndarray) -> np.ndarray:
+            if not offsets.size:
+                return offsets
+            return self._altitude(satrec, t0, offsets) - min_altitude
+
+        samples = int(math.ceil(window / self.step_seconds))
+        offsets = np.linspace(0.0, window, samples + 1)
+        alt = altitude(offsets)
+
+        # Short passes can crest the horizon between two samples; refine
+        # sampled local maxima that stay below it and keep the ones that clear it
+        inner = alt[1:-1]
+        peaks = np.flatnonzero(
+            (inner > alt[:-2])
+            & (inner >= alt[2:])
+            & (inner <= 0.0)
+            & (inner > -PEAK_SEARCH_MARGIN_DEG)
+        ) + 1
+        if peaks.size:
+            peak_t, peak_alt = self._maximize(altitude, offsets[peaks - 1], offsets[peaks + 1])
+            hidden = peak_alt > 0.0
+            offsets = np.concatenate([offsets, peak_t[hidden]])
+            alt = np.concatenate([alt, peak_alt[hidden]])
+            order = np.argsort(offsets, kind="stable")
+            offsets = offsets[order]
+            alt = alt[order]
+
+        above = alt > 0.0
+        crossings = np.flatnonzero(above[:-1] != above[1:])
+        roots = self._bisect_crossings(
+            altitude, offsets[crossings], offsets[crossings + 1], above[crossings]
+        )
+        rising = ~above[crossings]
+
+        # Pair rises with sets, clipping passes at the window edges
+        passes: list[tuple[float, float]] = []
+        rise = 0.0 if above[0] else None
+        for root, is_rise in zip(roots, rising):
+            if is_rise:
+                rise = float(root)
+            elif rise is not None:
+                passes.append((rise, float(root)))
+                rise = None
+        if rise is not None:
+            passes.append((rise, window))
+        if not passes:
+            return []
+
+        # Seed culmination search from the highest sample inside each pass
+        seeds = []
+        for rise, set_ in passes:
+            inside = np.flatnonzero((offsets >= rise) & (offsets <= set_))
+            if inside.size:
+                seeds.append(offsets[inside[np.argmax(alt[inside])]])
+            else:
+                seeds.append((rise + set_) / 2.0)
+        seeds_arr = np.asarray(seeds)
+        rises = np.array([p[0] for p in passes])
+        sets = np.array([p[1] for p in passes])
+        lo = np.maximum(rises, seeds_arr - self.step_seconds)
+        hi = np.minimum(sets, seeds_arr + self.step_seconds)
+        culm_t, culm_alt = self._maximize(altitude, lo, hi)
+
+        results = []
+        for rise, set_, peak_t, peak_alt in zip(rises, sets, culm_t, culm_alt):
+            rise_dt = start_time + timedelta(seconds=float(rise))
+            set_dt = start_time + timedelta(seconds=float(set_))
+            results.append({
+                "rise_time": rise_dt.isoformat(),
+                "set_time": set_dt.isoformat(),
+                "max_elevation": float(peak_alt + min_altitude),
+                "max_elevation_time": (
+                    start_time + timedelta(seconds=float(peak_t))
+                ).isoformat(),
+                "duration_minutes": int((set_ - rise) / 60),
+            })
+        return results
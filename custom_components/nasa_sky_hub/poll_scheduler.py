@@ -0,0 +1,175 @@
+"""Quota-aware polling intervals for the integration's coordinators."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from .const import (
+    POLL_MAX_STRETCH,
+    POLL_PRIORITY_WEIGHTS,
+    POLL_QUOTA_COSTS,
+    POLL_RESERVE_FRACTION,
+    RATE_LIMIT_DEGRADED_THRESHOLD,
+)
+from .rate_limiter import RateLimiter
+
+_LOGGER = logging.getLogger(__name__)
+
+# Quota window assumed when the server doesn't report a reset time
+QUOTA_WINDOW = 3600
+
+# Relative interval change below which a coordinator is left alone
+INTERVAL_HYSTERESIS = 0.1
+
+
+def allocate(demands: dict[str, tuple[float, float]], budget: float) -> dict[str, float]:
+    """Split `budget` by weight without giving anyone more than it demands.
+
+    `demands` maps a name to (demand, weight). Consumers that need less
+    than their weighted share get all of it and the rest is divided again
+    among the others (weighted max-min fairness).
+    """
+    shares: dict[str, float] = {}
+    pending = dict(demands)
+    while pending:
+        total_weight = sum(weight for _, weight in pending.values())
+        satisfied = {
+            name: demand
+            for name, (demand, weight) in pending.items()
+            if demand <= budget * weight / total_weight
+        }
+        if not satisfied:
+            for name, (_, weight) in pending.items():
+                shares[name] = budget * weight / total_weight
+            break
+        for name, demand in satisfied.items():
+            shares[name] = demand
+            budget -= demand
+            del pending[name]
+    return shares
+
+
+class PollScheduler:
+    """Set every coordinator's update interval from the remaining API quota.
+
+    Coordinators register with their profile interval as the base. Those
+    that spend api.nasa.gov quota (POLL_QUOTA_COSTS) share what is left
+    above a reserve until the quota resets, by POLL_PRIORITY_WEIGHTS. They
+    keep their base interval while the quota covers it and stretch as
+    `remaining` approaches RATE_LIMIT_DEGRADED_THRESHOLD. Intervals are
+    recomputed whenever the rate limiter sees new headers or a 429 and
+    apply from each coordinator's next scheduled poll. When entries share
+    an API key, each plans with its `share` of the budget.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        clock: Callable[[], datetime] | None = None,
+        share: Callable[[], float] | None = None,
+    ) -> None:
+        """Initialize poll scheduler."""
+        self.rate_limiter = rate_limiter
+        # Fraction of the quota this scheduler's entry may use when shared
+        self._share = share or (lambda: 1.0)
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        # name -> (coordinator, base interval seconds)
+        self._coordinators: dict[str, tuple[Any, float]] = {}
+        self._intervals: dict[str, float] = {}
+        # Longest interval each coordinator may stretch to, from the last plan
+        self._longest: dict[str, float] = {}
+        self._budget = 0.0
+        self._remove_listener = rate_limiter.add_listener(self.update)
+
+    def register(self, name: str, coordinator: Any) -> None:
+        """Schedule `coordinator`, taking its current interval as the base."""
+        base = coordinator.update_interval.total_seconds()
+        self._coordinators[name] = (coordinator, base)
+        self._intervals[name] = base
+
+    def stop(self) -> None:
+        """Stop following the rate limiter."""
+        self._remove_listener()
+
+    def plan(self) -> dict[str, float]:
+        """Return the interval in seconds each registered coordinator should use."""
+        now = self._clock()
+        limiter = self.rate_limiter
+        until_reset = limiter.seconds_until_reset(now)
+        remaining = limiter.remaining
+        if until_reset == 0:
+            # Reset already passed, the quota is full again
+            remaining, until_reset = limiter.limit, None
+        horizon = until_reset or QUOTA_WINDOW
+
+        # Small limits such as DEMO_KEY's keep a proportionally smaller reserve
+        reserve = min(RATE_LIMIT_DEGRADED_THRESHOLD, limiter.limit * POLL_RESERVE_FRACTION)
+        budget = max(remaining - reserve, 0) / horizon * self._share()
+        if limiter.seconds_in_backoff(now) > 0:
+            budget = 0.0
+        self._budget = budget
+
+        costs = {
+            name: POLL_QUOTA_COSTS[name]
+            for name in self._coordinators
+            if POLL_QUOTA_COSTS.get(name)
+        }
+        shares = allocate(
+            {
+                name: (cost / self._coordinators[name][1], POLL_PRIORITY_WEIGHTS.get(name, 1))
+                for name, cost in costs.items()
+            },
+            budget,
+        )
+
+        intervals = {}
+        for name, (_, base) in self._coordinators.items():
+            if name not in costs:
+                intervals[name] = self._longest[name] = base
+                continue
+            # Never poll slower than needed to see the reset, if it is known
+            longest = max(base, until_reset) if until_reset else base * POLL_MAX_STRETCH
+            self._longest[name] = longest
+            share = shares[name]
+            interval = costs[name] / share if share > 0 else longest
+            intervals[name] = min(max(interval, base), longest)
+        return intervals
+
+    def update(self) -> None:
+        """Recompute intervals and apply the ones that changed."""
+        for name, interval in self.plan().items():
+            coordinator, base = self._coordinators[name]
+            current = self._intervals[name]
+            # Ignore small drifts so intervals don't churn on every response,
+            # but always settle on the base or on waiting for the reset
+            if interval == current or (
+                abs(interval - current) <= current * INTERVAL_HYSTERESIS
+                and interval not in (base, self._longest[name])
+            ):
+                continue
+            _LOGGER.debug(
+                "Polling %s every %ss (base %ss, %s requests remaining)",
+                name,
+                round(interval),
+                round(base),
+                self.rate_limiter.remaining,
+            )
+            # Takes effect when the coordinator schedules its next poll
+            coordinator.update_interval = timedelta(seconds=round(interval))
+            self._intervals[name] = interval
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return the base and current interval of each coordinator."""
+        return {
+            "budget_per_hour": round(self._budget * 3600, 1),
+            "coordinators": {
+                name: {
+                    "base_interval": round(base),
+                    "interval": round(self._intervals[name]),
+                    "quota_cost": POLL_QUOTA_COSTS.get(name, 0),
+                }
+                for name, (_, base) in self._coordinators.items()
+            },
+        }
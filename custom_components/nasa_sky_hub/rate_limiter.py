@@ -2,7 +2,12 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -10,103 +15,487 @@ from .const import (
     PROFILE_AGGRESSIVE,
     PROFILE_BALANCED,
     PROFILE_CONSERVATIVE,
+    RATE_LIMIT_BURST,
     RATE_LIMIT_DEGRADED_THRESHOLD,
+    RATE_LIMIT_SAVE_DELAY,
     RATE_LIMIT_WARNING_THRESHOLD,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Lower values are admitted first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+# Priority and loop-time deadline of requests made in the current context,
+# so callers deep in a coordinator or service don't have to pass them along
+request_priority: ContextVar[int] = ContextVar(
+    "nasa_sky_hub_request_priority", default=PRIORITY_BACKGROUND
+)
+request_deadline: ContextVar[float | None] = ContextVar(
+    "nasa_sky_hub_request_deadline", default=None
+)
+
+
+class RateLimitTimeout(Exception):
+    """A request could not be admitted before its deadline."""
+
+
+class RequestTicket:
+    """Priority and deadline of one request shared by several callers.
+
+    Callers joining the request tighten the ticket; a request still queued
+    in a rate limiter then moves up the queue and expires earlier.
+    """
+
+    def __init__(self, priority: int, deadline: float | None) -> None:
+        """Initialize the ticket with the first caller's priority and deadline."""
+        self.priority = priority
+        self.deadline = deadline
+        # Limiter and future of the request while it is queued
+        self.queued: tuple[RateLimiter, asyncio.Future[None]] | None = None
+
+    def tighten(self, priority: int, deadline: float | None) -> None:
+        """Keep the higher priority and the earlier deadline."""
+        if deadline is None or (self.deadline is not None and self.deadline <= deadline):
+            deadline = self.deadline
+        priority = min(priority, self.priority)
+        if (priority, deadline) == (self.priority, self.deadline):
+            return
+        self.priority = priority
+        self.deadline = deadline
+        if self.queued is not None:
+            limiter, future = self.queued
+            limiter.requeue(future, priority, deadline)
+
+
+# Ticket of the shared request being made in the current context, if any
+request_ticket: ContextVar[RequestTicket | None] = ContextVar(
+    "nasa_sky_hub_request_ticket", default=None
+)
+
+
+@contextmanager
+def request_priority_scope(priority: int) -> Iterator[None]:
+    """Run the requests made inside the block at `priority`."""
+    token = request_priority.set(priority)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+@contextmanager
+def request_deadline_scope(timeout: float) -> Iterator[None]:
+    """Give the requests made inside the block `timeout` seconds to be admitted.
+
+    An earlier deadline set by an enclosing scope is kept.
+    """
+    deadline = asyncio.get_running_loop().time() + timeout
+    enclosing = request_deadline.get()
+    if enclosing is not None:
+        deadline = min(deadline, enclosing)
+    token = request_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        request_deadline.reset(token)
+
 
 class RateLimiter:
-    """Central rate limiter for NASA API requests."""
+    """Central rate limiter for NASA API requests.
+
+    A token bucket refilled at the hourly limit spreads requests out, and
+    server-reported exhaustion or a 429 backoff closes it entirely. Waiters
+    queue by priority and are woken by a loop timer, so no lock is held
+    while waiting and header updates are never blocked.
+    """
 
-    def __init__(self, profile: str = "balanced") -> None:
+    def __init__(
+        self,
+        profile: str = "balanced",
+        limit: int = 1000,
+        burst: int = RATE_LIMIT_BURST,
+        store: Any = None,
+    ) -> None:
         """Initialize rate limiter."""
         self.profile = profile
-        self.remaining = 1000  # Default limit
-        self.limit = 1000
+        # Persists quota and backoff state (a homeassistant.helpers.storage.Store)
+        self._store = store
+        self.remaining = limit  # Default limit
+        self.limit = limit
         self.reset_time: datetime | None = None
-        self._lock = asyncio.Lock()
         self._backoff_until: datetime | None = None
         self._consecutive_429s = 0
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated: float | None = None
+        # Heap of (priority, sequence, future); cancelled or expired futures are skipped
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = 0
+        # Deadline timers of queued requests
+        self._expiries: dict[asyncio.Future[None], asyncio.TimerHandle] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._listeners: list[Callable[[], None]] = []
+        # Send time of the request whose response last set `remaining`
+        self._remaining_sent_at: float | None = None
+        self.stats = {
+            "granted": 0,
+            "queued": 0,
+            "rejected": 0,
+            "max_wait_ms": 0.0,
+        }
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call `listener` whenever the quota or backoff changes; return a remover."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    async def async_load(self) -> None:
+        """Restore the quota and backoff state saved before a restart."""
+        if self._store is None:
+            return
+        try:
+            saved = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Failed to load rate limiter state: %s", err)
+            return
+        if not saved:
+            return
+        now = datetime.now(timezone.utc)
+        try:
+            saved_at = datetime.fromisoformat(saved["saved"])
+            reset_time = saved.get("reset_time")
+            backoff_until = saved.get("backoff_until")
+            self.limit = int(saved["limit"])
+            self.reset_time = datetime.fromisoformat(reset_time) if reset_time else None
+            self._consecutive_429s = int(saved.get("consecutive_429s", 0))
+            self._backoff_until = (
+                datetime.fromisoformat(backoff_until) if backoff_until else None
+            )
+            # Without a reset time the quota window is a rolling hour
+            window_over = (
+                self.reset_time <= now
+                if self.reset_time
+                else now - saved_at >= timedelta(hours=1)
+            )
+            self.remaining = self.limit if window_over else int(saved["remaining"])
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring invalid saved rate limiter state: %s", err)
+            return
+        if self._backoff_until is not None and self._backoff_until <= now:
+            self._backoff_until = None
+        _LOGGER.info(
+            "Restored rate limiter state: %s/%s remaining%s",
+            self.remaining,
+            self.limit,
+            f", backing off until {self._backoff_until}" if self._backoff_until else "",
+        )
+        self._notify()
+
+    def _as_stored(self) -> dict[str, Any]:
+        """Return the state to persist."""
+        return {
+            "remaining": self.remaining,
+            "limit": self.limit,
+            "reset_time": self.reset_time.isoformat() if self.reset_time else None,
+            "consecutive_429s": self._consecutive_429s,
+            "backoff_until": (
+                self._backoff_until.isoformat() if self._backoff_until else None
+            ),
+            "saved": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def _changed(self) -> None:
+        """Schedule a debounced save and tell listeners the quota changed."""
+        if self._store is not None:
+            self._store.async_delay_save(self._as_stored, RATE_LIMIT_SAVE_DELAY)
+        self._notify()
+
+    def _notify(self) -> None:
+        """Tell listeners the quota or backoff changed."""
+        for listener in list(self._listeners):
+            try:
+                listener()
+            except Exception:
+                _LOGGER.exception("Error in rate limiter listener")
+
+    def seconds_until_reset(self, now: datetime | None = None) -> float | None:
+        """Return the seconds until the server resets the quota, if it said."""
+        if self.reset_time is None:
+            return None
+        now = now or datetime.now(timezone.utc)
+        return max((self.reset_time - now).total_seconds(), 0.0)
+
+    def seconds_in_backoff(self, now: datetime | None = None) -> float:
+        """Return the seconds left of a 429 backoff, or 0."""
+        if self._backoff_until is None:
+            return 0.0
+        now = now or datetime.now(timezone.utc)
+        return max((self._backoff_until - now).total_seconds(), 0.0)
+
+    @property
+    def rate(self) -> float:
+        """Return the refill rate in requests per second."""
+        return max(self.limit, 1) / 3600
 
-    async def acquire(self) -> bool:
-        """Acquire permission to make a request."""
-        async with self._lock:
-            # Check if we're in backoff
-            now_utc = datetime.now(timezone.utc)
-            if self._backoff_until and now_utc < self._backoff_until:
-                wait_time = (self._backoff_until - now_utc).total_seconds()
-                _LOGGER.debug("Rate limiter in backoff, waiting %s seconds", wait_time)
-                await asyncio.sleep(wait_time)
-                self._backoff_until = None
-
-            # Check remaining requests
-            if self.remaining <= 0:
-                if self.reset_time and now_utc < self.reset_time:
-                    wait_time = (self.reset_time - now_utc).total_seconds()
-                    _LOGGER.warning(
-                        "Rate limit exhausted, waiting %s seconds until reset",
-                        wait_time,
-                    )
-                    await asyncio.sleep(wait_time)
-                else:
-                    # Reset expired, assume we have requests again
-                    self.remaining = self.limit
-
-            # Check thresholds (check higher threshold first)
-            if self.remaining < RATE_LIMIT_WARNING_THRESHOLD:
-                if self.remaining < RATE_LIMIT_DEGRADED_THRESHOLD:
-                    _LOGGER.warning(
-                        "Rate limit degraded: %s remaining (threshold: %s)",
-                        self.remaining,
-                        RATE_LIMIT_DEGRADED_THRESHOLD,
-                    )
-                else:
-                    _LOGGER.info(
-                        "Rate limit warning: %s remaining (threshold: %s)",
-                        self.remaining,
-                        RATE_LIMIT_WARNING_THRESHOLD,
-                    )
+    async def acquire(
+        self, priority: int | None = None, deadline: float | None = None
+    ) -> bool:
+        """Acquire permission to make a request.
 
+        `priority` and `deadline` (in loop time) default to the values set
+        in the current context, or to its request ticket's. Raises
+        RateLimitTimeout immediately if the request can't be admitted before
+        its deadline, or when the deadline passes while queued.
+        """
+        loop = asyncio.get_running_loop()
+        ticket = request_ticket.get()
+        if priority is None:
+            priority = ticket.priority if ticket is not None else request_priority.get()
+        if deadline is None:
+            deadline = ticket.deadline if ticket is not None else request_deadline.get()
+        now = loop.time()
+        self._refill(now)
+
+        ahead = self._waiters_ahead(priority)
+        if not ahead and self._tokens >= 1 and self._blocked_until(now) <= now:
+            self._grant()
             return True
 
-    async def record_response(self, headers: dict[str, Any]) -> None:
-        """Record rate limit information from response headers."""
-        async with self._lock:
-            if "X-RateLimit-Remaining" in headers:
-                try:
-                    self.remaining = int(headers["X-RateLimit-Remaining"])
-                except (ValueError, TypeError):
-                    pass
-
-            if "X-RateLimit-Limit" in headers:
-                try:
-                    self.limit = int(headers["X-RateLimit-Limit"])
-                except (ValueError, TypeError):
-                    pass
-
-            if "X-RateLimit-Reset" in headers:
-                try:
-                    reset_timestamp = int(headers["X-RateLimit-Reset"])
-                    self.reset_time = datetime.fromtimestamp(reset_timestamp, tz=timezone.utc)
-                except (ValueError, TypeError):
-                    pass
-
-            # Reset consecutive 429s on successful request
+        admission = self._admission_time(now, len(ahead))
+        if deadline is not None and admission > deadline:
+            self.stats["rejected"] += 1
+            raise RateLimitTimeout(
+                f"Rate limited for {admission - now:.0f}s, "
+                f"beyond the request deadline in {max(deadline - now, 0):.0f}s"
+            )
+
+        future: asyncio.Future[None] = loop.create_future()
+        self._sequence += 1
+        heapq.heappush(self._waiters, (priority, self._sequence, future))
+        self.stats["queued"] += 1
+        if deadline is not None:
+            self._expiries[future] = loop.call_at(deadline, self._expire, future)
+        if ticket is not None:
+            ticket.queued = (self, future)
+        self._schedule(loop)
+        _LOGGER.debug(
+            "Rate limiter queued request at priority %s, estimated wait %.1fs",
+            priority,
+            admission - now,
+        )
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Admitted just as the caller was cancelled: hand the token back
+            if future.done() and not future.cancelled():
+                self._tokens = min(self._tokens + 1, self.burst)
+                self._schedule(loop)
+            raise
+        finally:
+            if ticket is not None:
+                ticket.queued = None
+            if (expiry := self._expiries.pop(future, None)) is not None:
+                expiry.cancel()
+        waited_ms = (loop.time() - now) * 1000
+        self.stats["max_wait_ms"] = round(max(self.stats["max_wait_ms"], waited_ms), 1)
+        return True
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill."""
+        if self._updated is not None:
+            self._tokens = min(self._tokens + (now - self._updated) * self.rate, self.burst)
+        self._updated = now
+
+    def _to_loop_time(self, now: float, when: datetime) -> float:
+        """Convert a wall-clock datetime to loop time."""
+        return now + (when.timestamp() - time.time())
+
+    def _blocked_until(self, now: float) -> float:
+        """Return the loop time until which no request may start."""
+        blocked = now
+        if self._backoff_until is not None:
+            blocked = max(blocked, self._to_loop_time(now, self._backoff_until))
+        if self.remaining <= 0:
+            if self.reset_time and datetime.now(timezone.utc) < self.reset_time:
+                blocked = max(blocked, self._to_loop_time(now, self.reset_time))
+            else:
+                # Reset expired, assume we have requests again
+                self.remaining = self.limit
+        return blocked
+
+    def _prune(self) -> bool:
+        """Drop finished futures from the head of the queue; return whether any wait."""
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        return bool(self._waiters)
+
+    def _waiters_ahead(self, priority: int) -> list[asyncio.Future[None]]:
+        """Return the live waiters that would be admitted before `priority`."""
+        self._prune()
+        return [
+            future
+            for waiter_priority, _, future in self._waiters
+            if waiter_priority <= priority and not future.done()
+        ]
+
+    def _admission_time(self, now: float, ahead: int) -> float:
+        """Estimate when a request behind `ahead` waiters will be admitted."""
+        start = self._blocked_until(now)
+        tokens = min(self._tokens + (start - now) * self.rate, self.burst)
+        missing = ahead + 1 - tokens
+        return start if missing <= 0 else start + missing / self.rate
+
+    def _grant(self) -> None:
+        """Spend a token and report when the remaining quota is low."""
+        self._tokens -= 1
+        self.stats["granted"] += 1
+        # Check thresholds (check higher threshold first)
+        if self.remaining < RATE_LIMIT_WARNING_THRESHOLD:
+            if self.remaining < RATE_LIMIT_DEGRADED_THRESHOLD:
+                _LOGGER.warning(
+                    "Rate limit degraded: %s remaining (threshold: %s)",
+                    self.remaining,
+                    RATE_LIMIT_DEGRADED_THRESHOLD,
+                )
+            else:
+                _LOGGER.info(
+                    "Rate limit warning: %s remaining (threshold: %s)",
+                    self.remaining,
+                    RATE_LIMIT_WARNING_THRESHOLD,
+                )
+
+    def _dispatch(self) -> None:
+        """Admit queued requests in priority order while tokens allow."""
+        self._timer = None
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        self._refill(now)
+        while self._prune() and self._tokens >= 1 and self._blocked_until(now) <= now:
+            _, _, future = heapq.heappop(self._waiters)
+            self._grant()
+            future.set_result(None)
+        self._schedule(loop)
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Arm the timer for the next admission, or clear it when nobody waits."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._prune():
+            return
+        now = loop.time()
+        self._refill(now)
+        self._timer = loop.call_at(self._admission_time(now, 0), self._dispatch)
+
+    def requeue(
+        self, future: asyncio.Future[None], priority: int, deadline: float | None
+    ) -> None:
+        """Move a queued request to `priority` and `deadline`.
+
+        Fails the request at once if it can no longer be admitted in time.
+        """
+        if future.done():
+            return
+        sequence = 0
+        for idx, (_, waiter_sequence, waiter) in enumerate(self._waiters):
+            if waiter is future:
+                sequence = waiter_sequence
+                self._waiters[idx] = (priority, sequence, future)
+        heapq.heapify(self._waiters)
+        if deadline is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        self._refill(now)
+        ahead = sum(
+            1
+            for waiter_priority, waiter_sequence, waiter in self._waiters
+            if (waiter_priority, waiter_sequence) < (priority, sequence)
+            and not waiter.done()
+        )
+        if self._admission_time(now, ahead) > deadline:
+            self._expire(future)
+            return
+        if (expiry := self._expiries.get(future)) is None or expiry.when() > deadline:
+            if expiry is not None:
+                expiry.cancel()
+            self._expiries[future] = loop.call_at(deadline, self._expire, future)
+
+    def _expire(self, future: asyncio.Future[None]) -> None:
+        """Fail a queued request whose deadline passed."""
+        if not future.done():
+            self.stats["rejected"] += 1
+            future.set_exception(RateLimitTimeout("Request deadline passed while rate limited"))
+            # Disarm the admission timer if nobody else waits
+            self._reschedule()
+
+    def _reschedule(self) -> None:
+        """Re-arm the admission timer after the limits changed."""
+        if self._waiters:
+            self._schedule(asyncio.get_running_loop())
+
+    async def record_response(
+        self, headers: Any, sent_at: float | None = None, status: int | None = None
+    ) -> None:
+        """Record rate limit information from response headers.
+
+        `sent_at` is the loop time the request was sent. Concurrent requests
+        (possibly from several entries sharing the key) can answer out of
+        order, so a higher count from a request sent before the one that
+        set `remaining` is stale and ignored. `status` is the response's
+        HTTP status; anything but a 429 ends a streak of 429s.
+        """
+        if "X-RateLimit-Remaining" in headers:
+            try:
+                remaining = int(headers["X-RateLimit-Remaining"])
+            except (ValueError, TypeError):
+                pass
+            else:
+                stale = (
+                    sent_at is not None
+                    and self._remaining_sent_at is not None
+                    and sent_at < self._remaining_sent_at
+                    and remaining > self.remaining
+                )
+                if not stale:
+                    self.remaining = remaining
+                    if sent_at is not None:
+                        self._remaining_sent_at = max(sent_at, self._remaining_sent_at or sent_at)
+
+        if "X-RateLimit-Limit" in headers:
+            try:
+                self.limit = int(headers["X-RateLimit-Limit"])
+            except (ValueError, TypeError):
+                pass
+
+        if "X-RateLimit-Reset" in headers:
+            try:
+                reset_timestamp = int(headers["X-RateLimit-Reset"])
+                self.reset_time = datetime.fromtimestamp(reset_timestamp, tz=timezone.utc)
+            except (ValueError, TypeError):
+                pass
+
+        # Any other answer ends the streak; a 429 is counted by record_429
+        if status != 429:
             self._consecutive_429s = 0
+        self._reschedule()
+        self._changed()
 
     async def record_429(self) -> None:
         """Record a 429 Too Many Requests response."""
-        async with self._lock:
-            self._consecutive_429s += 1
-            # Exponential backoff: 2^consecutive_429s minutes, max 60 minutes
-            backoff_minutes = min(2 ** self._consecutive_429s, 60)
-            self._backoff_until = datetime.now(timezone.utc) + timedelta(minutes=backoff_minutes)
-            _LOGGER.warning(
-                "Rate limit 429 received, backing off for %s minutes",
-                backoff_minutes,
-            )
+        self._consecutive_429s += 1
+        # Exponential backoff: 2^consecutive_429s minutes, max 60 minutes
+        backoff_minutes = min(2 ** self._consecutive_429s, 60)
+        self._backoff_until = datetime.now(timezone.utc) + timedelta(minutes=backoff_minutes)
+        _LOGGER.warning(
+            "Rate limit 429 received, backing off for %s minutes",
+            backoff_minutes,
+        )
+        self._reschedule()
+        self._changed()
 
     def get_status(self) -> dict[str, Any]:
         """Get current rate limiter status."""
@@ -122,4 +511,8 @@ class RateLimiter:
             "backoff_until": (
                 self._backoff_until.isoformat() if self._backoff_until else None
             ),
+            "tokens": round(self._tokens, 2),
+            "burst": self.burst,
+            "waiting": sum(1 for _, _, future in self._waiters if not future.done()),
+            **self.stats,
         }
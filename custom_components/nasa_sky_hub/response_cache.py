@@ -0,0 +1,208 @@
+"""Size-bounded LRU cache for API responses with TTL and revalidation."""
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+from urllib.parse import urlencode
+
+from .const import RESPONSE_CACHE_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+# Parameters that never change the response and must not be persisted
+EXCLUDED_PARAMS = {"api_key"}
+
+
+def cache_key(url: str, params: dict[str, Any] | None) -> str:
+    """Return the cache key for a URL and its normalized query parameters."""
+    items = sorted(
+        (str(key), str(value))
+        for key, value in (params or {}).items()
+        if key not in EXCLUDED_PARAMS and value is not None
+    )
+    return f"{url}?{urlencode(items)}" if items else url
+
+
+class CacheEntry:
+    """One cached JSON response and its validators."""
+
+    __slots__ = ("data", "etag", "last_modified", "stored", "expires", "stale_until", "size")
+
+    def __init__(
+        self,
+        data: Any,
+        size: int,
+        expires: float,
+        stale_until: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        stored: float | None = None,
+    ) -> None:
+        """Initialize cache entry."""
+        self.data = data
+        self.size = size
+        self.expires = expires
+        self.stale_until = stale_until
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored = stored if stored is not None else time.time()
+
+    def is_fresh(self, now: float) -> bool:
+        """Return whether the entry can be served without revalidation."""
+        return now < self.expires
+
+    def is_usable(self, now: float) -> bool:
+        """Return whether the entry can be served while revalidating."""
+        return now < self.stale_until
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return If-None-Match/If-Modified-Since headers for revalidation."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable form for the disk backend."""
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CacheEntry:
+        """Rebuild an entry saved by `as_dict`."""
+        return cls(**data)
+
+
+class StoreCacheBackend:
+    """Persist cache entries through a homeassistant.helpers.storage.Store."""
+
+    def __init__(self, store: Any) -> None:
+        """Initialize backend."""
+        self._store = store
+
+    async def async_load(self) -> dict[str, dict[str, Any]]:
+        """Return the saved entries."""
+        data = await self._store.async_load()
+        return (data or {}).get("entries", {})
+
+    def schedule_save(self, entries: Any) -> None:
+        """Write entries after RESPONSE_CACHE_SAVE_DELAY, coalescing bursts of changes."""
+        self._store.async_delay_save(
+            lambda: {"entries": entries()}, RESPONSE_CACHE_SAVE_DELAY
+        )
+
+
+class ResponseCache:
+    """In-memory LRU of API responses bounded by total payload bytes."""
+
+    def __init__(self, max_bytes: int, backend: StoreCacheBackend | None = None) -> None:
+        """Initialize response cache."""
+        self.max_bytes = max_bytes
+        self._backend = backend
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._loaded = backend is None
+        self.stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "not_modified": 0,
+            "revalidations": 0,
+            "circuit_open_hits": 0,
+            "evictions": 0,
+            "bytes_served": 0,
+            "bytes_fetched": 0,
+        }
+
+    async def async_load(self) -> None:
+        """Warm the cache from the disk backend once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            saved = await self._backend.async_load()
+        except Exception as err:
+            _LOGGER.warning("Failed to load response cache: %s", err)
+            return
+        now = time.time()
+        for key, raw in saved.items():
+            try:
+                entry = CacheEntry.from_dict(raw)
+            except TypeError:
+                continue
+            if entry.is_usable(now):
+                self._insert(key, entry)
+        _LOGGER.debug("Loaded %s cached responses (%s bytes)", len(self._entries), self._bytes)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for `key`, marking it most recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Store `entry`, evicting least recently used entries beyond max_bytes."""
+        if entry.size > self.max_bytes:
+            self.discard(key)
+            return
+        self._insert(key, entry)
+        self._changed()
+
+    def touch(self, key: str, expires: float, stale_until: float) -> None:
+        """Extend an entry's lifetime after a 304 Not Modified."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.expires = expires
+            entry.stale_until = stale_until
+            self._changed()
+
+    def discard(self, key: str) -> None:
+        """Remove `key` if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+            self._changed()
+
+    def record_hit(self, entry: CacheEntry, stale: bool = False) -> None:
+        """Count a response served from the cache."""
+        self.stats["stale_hits" if stale else "hits"] += 1
+        self.stats["bytes_served"] += entry.size
+
+    def _insert(self, key: str, entry: CacheEntry) -> None:
+        """Insert without scheduling a save."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.stats["evictions"] += 1
+
+    def _changed(self) -> None:
+        """Schedule a disk write when a backend is configured."""
+        if self._backend is not None:
+            self._backend.schedule_save(
+                lambda: {key: entry.as_dict() for key, entry in self._entries.items()}
+            )
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return counters and current size."""
+        lookups = self.stats["hits"] + self.stats["stale_hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_ratio": (
+                round((self.stats["hits"] + self.stats["stale_hits"]) / lookups, 3)
+                if lookups
+                else None
+            ),
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "persistent": self._backend is not None,
+        }
@@ -0,0 +1,134 @@
+"""Compact, array-backed satellite catalog merged from CelesTrak groups."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+# TLE lines are always 69 characters; fixed-width bytes keep them compact
+TLE_LINE_DTYPE = "S69"
+
+
+def tle_epoch(line1: str) -> float:
+    """Return the TLE epoch as a sortable YYYYDDD.ddd float."""
+    year = int(line1[18:20])
+    year += 2000 if year < 57 else 1900
+    return year * 1000 + float(line1[20:32])
+
+
+class SatelliteCatalog:
+    """Satellite catalog stored as NumPy arrays sorted by NORAD ID."""
+
+    def __init__(
+        self,
+        norad_ids: np.ndarray,
+        epochs: np.ndarray,
+        line1: np.ndarray,
+        line2: np.ndarray,
+        names: np.ndarray,
+        groups: tuple[str, ...] = (),
+    ) -> None:
+        """Initialize catalog from pre-sorted arrays."""
+        self.norad_ids = norad_ids
+        self.epochs = epochs
+        self.line1 = line1
+        self.line2 = line2
+        self.names = names
+        self.groups = groups
+
+    @classmethod
+    def empty(cls) -> SatelliteCatalog:
+        """Return a catalog with no satellites."""
+        return cls.from_records([])
+
+    @classmethod
+    def from_records(
+        cls,
+        records: list[tuple[int, str, str, str]],
+        groups: tuple[str, ...] = (),
+    ) -> SatelliteCatalog:
+        """Build a catalog from (norad_id, name, line1, line2) records.
+
+        Duplicate NORAD IDs keep the record with the newest TLE epoch.
+        """
+        newest: dict[int, tuple[float, str, str, str]] = {}
+        for norad_id, name, line1, line2 in records:
+            try:
+                epoch = tle_epoch(line1)
+            except (ValueError, IndexError):
+                _LOGGER.debug("Skipping TLE with unreadable epoch for satellite %s", norad_id)
+                continue
+            current = newest.get(norad_id)
+            if current is None or epoch > current[0]:
+                newest[norad_id] = (epoch, name, line1, line2)
+
+        ids = sorted(newest)
+        rows = [newest[norad_id] for norad_id in ids]
+        return cls(
+            norad_ids=np.array(ids, dtype=np.int32),
+            epochs=np.array([row[0] for row in rows], dtype=np.float64),
+            line1=np.array([row[2] for row in rows], dtype=TLE_LINE_DTYPE),
+            line2=np.array([row[3] for row in rows], dtype=TLE_LINE_DTYPE),
+            names=np.array([row[1].encode() for row in rows], dtype=np.bytes_),
+            groups=groups,
+        )
+
+    def __len__(self) -> int:
+        """Return number of satellites."""
+        return len(self.norad_ids)
+
+    def _index(self, norad_id: int) -> int | None:
+        """Return the row of `norad_id`, or None if it is not in the catalog."""
+        idx = int(np.searchsorted(self.norad_ids, norad_id))
+        if idx < len(self.norad_ids) and self.norad_ids[idx] == norad_id:
+            return idx
+        return None
+
+    def __contains__(self, norad_id: object) -> bool:
+        """Return whether the NORAD ID is in the catalog."""
+        return (
+            isinstance(norad_id, (int, np.integer))
+            and self._index(int(norad_id)) is not None
+        )
+
+    def get(self, norad_id: int) -> tuple[str, str] | None:
+        """Return the TLE line pair for a NORAD ID."""
+        idx = self._index(norad_id)
+        if idx is None:
+            return None
+        return self.line1[idx].decode(), self.line2[idx].decode()
+
+    def epoch(self, norad_id: int) -> float | None:
+        """Return the TLE epoch for a NORAD ID."""
+        idx = self._index(norad_id)
+        if idx is None:
+            return None
+        return float(self.epochs[idx])
+
+    def name(self, norad_id: int) -> str:
+        """Return the satellite name for a NORAD ID."""
+        idx = self._index(norad_id)
+        if idx is None or not self.names[idx]:
+            return f"SAT-{norad_id}"
+        return self.names[idx].decode()
+
+    def records(self) -> Iterator[tuple[int, str, str, str]]:
+        """Iterate over (norad_id, name, line1, line2) records."""
+        for idx in range(len(self.norad_ids)):
+            yield (
+                int(self.norad_ids[idx]),
+                self.names[idx].decode(),
+                self.line1[idx].decode(),
+                self.line2[idx].decode(),
+            )
+
+    @property
+    def nbytes(self) -> int:
+        """Return memory used by the catalog arrays."""
+        return sum(
+            array.nbytes
+            for array in (self.norad_ids, self.epochs, self.line1, self.line2, self.names)
+        )
@@ -0,0 +1,188 @@
+"""Batched SGP4 propagation for whole satellite catalogs."""
+from __future__ import annotations
+
+import logging
+import math
+import sys
+from typing import Any, NamedTuple
+
+import numpy as np
+from sgp4.api import Satrec, SatrecArray
+from skyfield.sgp4lib import TEME, theta_GMST1982
+
+_LOGGER = logging.getLogger(__name__)
+
+# Slack added to the coarse horizon test; covers the geodetic/geocentric
+# vertical difference (< 0.2 deg) and the frame approximations it makes
+PREFILTER_MARGIN_DEG = 1.0
+
+EARTH_RADIUS_KM = 6378.137
+SUN_RADIUS_KM = 695700.0
+
+# Earth shadow states returned by earth_shadow()
+SHADOW_SUNLIT = 0
+SHADOW_PENUMBRA = 1
+SHADOW_UMBRA = 2
+SHADOW_NAMES = ("sunlit", "penumbra", "umbra")
+
+
+def earth_shadow(position_km: np.ndarray, sun_km: np.ndarray) -> np.ndarray:
+    """Classify geocentric positions (shape (n, 3)) against Earth's conical shadow.
+
+    `sun_km` is the geocentric Sun position in the same frame. Returns one
+    of SHADOW_SUNLIT, SHADOW_PENUMBRA or SHADOW_UMBRA per position.
+    """
+    sun_distance = np.sqrt(np.dot(sun_km, sun_km))
+    sun_dir = sun_km / sun_distance
+    # Distance behind the Earth along the anti-Sun axis, and off that axis
+    behind = -(position_km @ sun_dir)
+    off_axis = np.sqrt(
+        np.maximum(np.sum(position_km * position_km, axis=1) - behind * behind, 0.0)
+    )
+    umbra_angle = math.asin((SUN_RADIUS_KM - EARTH_RADIUS_KM) / sun_distance)
+    penumbra_angle = math.asin((SUN_RADIUS_KM + EARTH_RADIUS_KM) / sun_distance)
+    umbra_radius = EARTH_RADIUS_KM - behind * math.tan(umbra_angle)
+    penumbra_radius = EARTH_RADIUS_KM + behind * math.tan(penumbra_angle)
+
+    state = np.full(len(position_km), SHADOW_SUNLIT, dtype=np.int8)
+    night_side = behind > 0.0
+    state[night_side & (off_axis < penumbra_radius)] = SHADOW_PENUMBRA
+    state[night_side & (off_axis < umbra_radius)] = SHADOW_UMBRA
+    return state
+
+
+class TopocentricBatch(NamedTuple):
+    """Topocentric positions for every satellite in a batch at one instant."""
+
+    norad_ids: np.ndarray
+    altitude_deg: np.ndarray
+    azimuth_deg: np.ndarray
+    distance_km: np.ndarray
+    gcrs_km: np.ndarray
+    valid: np.ndarray
+    catalog_size: int
+
+
+class BatchPropagator:
+    """Propagate a whole TLE catalog with a single vectorized SGP4 call."""
+
+    def __init__(self, satrecs: list[Satrec], norad_ids: list[int]) -> None:
+        """Initialize batch propagator."""
+        self.norad_ids = np.asarray(norad_ids, dtype=np.int64)
+        self._array = SatrecArray(satrecs) if satrecs else None
+
+    @classmethod
+    def from_tles(cls, tles: dict[int, tuple[str, str]]) -> BatchPropagator:
+        """Build a propagator from a NORAD ID to TLE line pair mapping."""
+        satrecs = []
+        norad_ids = []
+        for norad_id, (line1, line2) in tles.items():
+            try:
+                satrecs.append(Satrec.twoline2rv(line1, line2))
+                norad_ids.append(norad_id)
+            except (ValueError, IndexError) as err:
+                _LOGGER.debug("Skipping unparsable TLE for satellite %s: %s", norad_id, err)
+        return cls(satrecs, norad_ids)
+
+    def __len__(self) -> int:
+        """Return number of satellites in the batch."""
+        return len(self.norad_ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Return memory used by the SGP4 records and the NORAD ID array."""
+        # SatrecArray is a variable-size object holding a copy of every record
+        array_bytes = sys.getsizeof(self._array) if self._array is not None else 0
+        return self.norad_ids.nbytes + array_bytes
+
+    def propagate_teme(self, t: Any) -> tuple[np.ndarray, np.ndarray]:
+        """Return TEME positions (km, shape (n, 3)) and a validity mask at time `t`.
+
+        Matches Skyfield's EarthSatellite convention of treating the TLE epoch
+        as UTC when handing the Julian date to SGP4.
+        """
+        if self._array is None:
+            return np.empty((0, 3)), np.empty(0, dtype=bool)
+        jd = np.array([t.whole])
+        fr = np.array([t.tai_fraction - t._leap_seconds() / 86400.0])
+        errors, positions, _ = self._array.sgp4(jd, fr)
+        return positions[:, 0, :], errors[:, 0] == 0
+
+    @staticmethod
+    def horizon_candidates(
+        teme_km: np.ndarray, t: Any, observer: Any, min_altitude_deg: float
+    ) -> np.ndarray:
+        """Return a mask of satellites that may be above `min_altitude_deg`.
+
+        Compares each satellite's angular distance from the observer's
+        zenith, seen from the Earth's centre, with the radius of the
+        circle on which a satellite at that distance sits exactly at
+        `min_altitude_deg`. The test is conservative: it may keep objects
+        below the limit but never drops one above it.
+        """
+        theta, _ = theta_GMST1982(t.whole, t.ut1_fraction)
+        cos_t = np.cos(theta)
+        sin_t = np.sin(theta)
+        x, y, z = teme_km[:, 0], teme_km[:, 1], teme_km[:, 2]
+        # Earth-fixed position, as in the pass predictor's fast path
+        ef_x = cos_t * x + sin_t * y
+        ef_y = -sin_t * x + cos_t * y
+        radius_km = np.sqrt(x * x + y * y + z * z)
+
+        observer_km = observer.itrs_xyz.km
+        observer_radius_km = np.sqrt(np.dot(observer_km, observer_km))
+        lat = observer.latitude.radians
+        lon = observer.longitude.radians
+        cos_zenith_angle = (
+            ef_x * np.cos(lat) * np.cos(lon)
+            + ef_y * np.cos(lat) * np.sin(lon)
+            + z * np.sin(lat)
+        ) / radius_km
+        zenith_angle = np.arccos(np.clip(cos_zenith_angle, -1.0, 1.0))
+
+        # Central angle at which a satellite at `radius_km` has elevation e:
+        # arccos(R cos(e) / r) - e
+        elevation = np.radians(min_altitude_deg)
+        horizon_radius = (
+            np.arccos(np.clip(observer_radius_km * np.cos(elevation) / radius_km, -1.0, 1.0))
+            - elevation
+        )
+        return zenith_angle <= horizon_radius + np.radians(PREFILTER_MARGIN_DEG)
+
+    def topocentric(
+        self, t: Any, observer: Any, min_altitude_deg: float | None = None
+    ) -> TopocentricBatch:
+        """Compute altitude, azimuth and range for satellites at time `t`.
+
+        Applies the same TEME -> GCRS -> observer horizon rotations that
+        Skyfield uses for ``(sat - observer).at(t).altaz()``, as matrix
+        products over the catalog. With `min_altitude_deg` the batch only
+        holds satellites that pass the coarse horizon test first.
+        """
+        teme_km, valid = self.propagate_teme(t)
+        norad_ids = self.norad_ids
+        if min_altitude_deg is not None and len(norad_ids):
+            keep = valid & self.horizon_candidates(teme_km, t, observer, min_altitude_deg)
+            teme_km = teme_km[keep]
+            valid = valid[keep]
+            norad_ids = norad_ids[keep]
+        # Row-vector form of Skyfield's mxv(_T(TEME.rotation_at(t)), r)
+        gcrs_km = teme_km @ TEME.rotation_at(t)
+        observer_km = observer.at(t).position.km
+        horizon_km = (gcrs_km - observer_km) @ observer.rotation_at(t).T
+
+        x, y, z = horizon_km[:, 0], horizon_km[:, 1], horizon_km[:, 2]
+        distance_km = np.sqrt(x * x + y * y + z * z)
+        altitude_deg = np.degrees(np.arctan2(z, np.hypot(x, y)))
+        azimuth_deg = np.degrees(np.arctan2(y, x) % (2 * np.pi))
+        valid = valid & np.isfinite(altitude_deg)
+
+        return TopocentricBatch(
+            norad_ids=norad_ids,
+            altitude_deg=altitude_deg,
+            azimuth_deg=azimuth_deg,
+            distance_km=distance_km,
+            gcrs_km=gcrs_km,
+            valid=valid,
+            catalog_size=len(self.norad_ids),
+        )
@@ -1,45 +1,163 @@
 """Satellite tracking using TLE data."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, NamedTuple
 
 import aiohttp
-from skyfield.api import EarthSatellite, load, wgs84
-
-from .const import CELESTRAK_TLE_URL, ISS_NORAD_ID
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import numpy as np
+from sgp4.api import Satrec
+from skyfield.api import EarthSatellite, wgs84
+
+from .const import CELESTRAK_GROUP_URL, DEFAULT_SATELLITE_GROUPS, ISS_NORAD_ID
+from .ephemeris import (
+    EphemerisError,
+    async_get_ephemeris,
+    async_get_timescale,
+    get_timescale,
+)
+from .pass_predictor import PassPredictor
+from .satellite_catalog import SatelliteCatalog
+from .satellite_propagation import (
+    SHADOW_NAMES,
+    SHADOW_UMBRA,
+    BatchPropagator,
+    earth_shadow,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sun altitude below which the observer's sky is dark enough to see
+# sunlit satellites (end of civil twilight)
+OBSERVER_DARK_SUN_ALTITUDE = -6.0
+
+# Parsed EarthSatellites kept for pass prediction; the visibility pass
+# only needs the batch propagator's SGP4 arrays
+PASS_SATELLITE_CACHE_SIZE = 32
+
+
+class ComputationCancelled(Exception):
+    """Raised inside a worker when a newer poll superseded the computation."""
+
+
+class SatelliteSnapshot(NamedTuple):
+    """Immutable view of the parsed TLE catalog used by one refresh cycle."""
+
+    catalog: SatelliteCatalog
+    # Parsed SGP4 record and TLE epoch per NORAD ID, reused by the next
+    # rebuild for every satellite whose epoch is unchanged
+    satrecs: dict[int, tuple[float, Satrec]]
+    propagator: BatchPropagator
+
+
+class VisibilityPass(NamedTuple):
+    """Satellites above the horizon and the pre-filter counters of one pass."""
+
+    satellites: list[dict[str, Any]]
+    prefilter: dict[str, Any]
+
 
 class SatelliteTracker:
     """Track satellites using TLE data."""
 
-    def __init__(self, latitude: float, longitude: float, elevation: float = 0.0) -> None:
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        elevation: float = 0.0,
+        hass: Any = None,
+        session_factory: Callable[[], Awaitable[aiohttp.ClientSession]] | None = None,
+        request_guard: Callable[[Callable[[], Awaitable[Any]]], Awaitable[Any]] | None = None,
+        store: Any = None,
+        groups: list[str] | None = None,
+        data_dir: str | None = None,
+    ) -> None:
         """Initialize satellite tracker."""
         self.latitude = latitude
         self.longitude = longitude
         self.elevation = elevation
-        self.tles: dict[int, tuple[str, str]] = {}
-        self.satellite_names: dict[int, str] = {}
+        self.hass = hass
+        # Local ephemeris/IERS data directory; nothing is downloaded
+        self.data_dir = data_dir or os.getcwd()
+        self._session_factory = session_factory
+        # Runs each download through CelesTrak's rate limiter and circuit breaker
+        self._request_guard = request_guard
+        # On-disk TLE cache (a homeassistant.helpers.storage.Store)
+        self._store = store
+        self._cache_loaded = False
+        self._refresh_task: asyncio.Task | None = None
+        self.groups = tuple(groups or DEFAULT_SATELLITE_GROUPS)
+        # Merged catalog plus the per-group catalogs and HTTP validators
+        self.catalog = SatelliteCatalog.empty()
+        self._group_catalogs: dict[str, SatelliteCatalog] = {}
+        self._group_validators: dict[str, dict[str, Any]] = {}
         self.tle_update_time: datetime | None = None
-        self.ts = load.timescale()
+        self.refresh_stats: dict[str, Any] = {}
+        self.ts = get_timescale()
         self.eph: Any = None  # Will be loaded lazily in executor
         self.observer = wgs84.latlon(latitude, longitude, elevation_m=elevation)
         self._eph_loaded = False
+        self._eph_error_logged = False
+        # Batch propagator, rebuilt only when a new TLE catalog is swapped in
+        self._snapshot: SatelliteSnapshot | None = None
+        # EarthSatellites used for pass prediction, keyed by NORAD ID and
+        # kept while their TLE epoch is unchanged
+        self._pass_satellites: dict[int, tuple[float, EarthSatellite]] = {}
+        # Guards the pass satellites and the counters below, which executor
+        # jobs update while the event loop reads them
+        self._cache_lock = threading.Lock()
+        self._cache_stats = {
+            "parsed": 0,
+            "reused": 0,
+            "dropped": 0,
+            "pass_parsed": 0,
+            "pass_reused": 0,
+            "pass_dropped": 0,
+        }
+        self._poll_parsed = 0
+        self._poll_parses_saved = 0
+        self.pass_predictor = PassPredictor(self.ts, self.observer)
 
     async def _ensure_eph_loaded(self, hass: Any) -> None:
         """Ensure ephemeris is loaded (in executor to avoid blocking)."""
         if self._eph_loaded:
             return
-        _LOGGER.debug("Loading ephemeris file in executor")
-        self.eph = await hass.async_add_executor_job(load, "de421.bsp")
+        try:
+            self.eph = await async_get_ephemeris(hass, self.data_dir)
+        except EphemerisError as err:
+            # Tracking works without it, only the eclipse state is unknown
+            if not self._eph_error_logged:
+                _LOGGER.error("Satellite eclipse state unavailable: %s", err)
+                self._eph_error_logged = True
+            return
+        self.ts = await async_get_timescale(hass, self.data_dir)
+        self.pass_predictor.ts = self.ts
         self._eph_loaded = True
-        _LOGGER.debug("Ephemeris file loaded")
+
+    async def _async_run_job(self, target: Any, *args: Any) -> Any:
+        """Run CPU-bound work in the executor so the event loop never stalls."""
+        if self.hass is None:
+            return target(*args)
+        return await self.hass.async_add_executor_job(target, *args)
 
     async def update_tles_if_needed(self, force: bool = False) -> None:
-        """Update TLE data if needed (cache for 24 hours)."""
+        """Update TLE data if needed (cache for 24 hours).
+
+        The first call warm-starts from the on-disk cache. When a cached
+        catalog is already available, stale data is refreshed in the
+        background so polls never wait on CelesTrak.
+        """
+        if not self._cache_loaded:
+            await self._async_load_cache()
+
         if (
             not force
             and self.tle_update_time
@@ -47,176 +165,514 @@ class SatelliteTracker:
         ):
             return
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(CELESTRAK_TLE_URL) as response:
-                    response.raise_for_status()
-                    lines = (await response.text()).strip().split("\n")
-
-            # Parse TLE format: name line, line 1, line 2
-            tles = {}
-            satellite_names = {}  # Store names separately
-            for i in range(0, len(lines) - 2, 3):
-                name = lines[i].strip()
-                line1 = lines[i + 1].strip()
-                line2 = lines[i + 2].strip()
-
-                # Extract NORAD ID from line 1 (positions 3-7)
-                try:
-                    norad_id = int(line1[2:7])
-                    tles[norad_id] = (line1, line2)
-                    satellite_names[norad_id] = name
-                except (ValueError, IndexError):
-                    continue
-
-            self.tles = tles
-            self.satellite_names = satellite_names
-            self.tle_update_time = datetime.now(timezone.utc)
-            _LOGGER.info("Updated TLE data: %s satellites", len(self.tles))
+        if not force and len(self.catalog) and self.hass is not None:
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = self.hass.async_create_task(
+                    self._async_fetch_tles_safe()
+                )
+            return
 
+        await self._async_fetch_tles_safe()
+
+    async def _async_fetch_tles_safe(self) -> None:
+        """Fetch TLEs, only raising when there is no catalog to fall back on."""
+        try:
+            await self._async_fetch_tles()
         except Exception as err:
             _LOGGER.error("Failed to update TLE data: %s", err)
-            if not self.tles:
+            if not len(self.catalog):
                 raise
 
-    async def get_visible_satellites(
-        self, time: datetime, min_elevation: float = 0.0
-    ) -> list[dict[str, Any]]:
-        """Get currently visible satellites."""
-        if not self.tles:
-            await self.update_tles_if_needed()
+    async def _async_fetch_tles(self) -> None:
+        """Download every configured group concurrently and merge the catalog."""
+        refresh_start = time.perf_counter()
+        if self._session_factory is not None:
+            session = await self._session_factory()
+        else:
+            session = async_get_clientsession(self.hass)
+        results = await self._async_download_groups(session)
+        fetch_ms = (time.perf_counter() - refresh_start) * 1000
+
+        changed = False
+        not_modified = []
+        failed = []
+        for group, result in zip(self.groups, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Failed to fetch TLE group %s: %s", group, result)
+                failed.append(group)
+            elif result is None:
+                # 304 Not Modified: the cached group is still current
+                not_modified.append(group)
+            else:
+                self._group_catalogs[group] = result
+                changed = True
+        if len(failed) == len(self.groups):
+            raise results[0]
+
+        merge_ms = 0.0
+        parse_ms = 0.0
+        if changed:
+            merge_start = time.perf_counter()
+            self.catalog = await self._async_run_job(self._merge_groups)
+            merge_ms = (time.perf_counter() - merge_start) * 1000
+            parse_start = time.perf_counter()
+            await self.async_snapshot()
+            parse_ms = (time.perf_counter() - parse_start) * 1000
+            _LOGGER.info(
+                "Updated TLE data: %s satellites from groups %s",
+                len(self.catalog),
+                ", ".join(self.groups),
+            )
+        else:
+            _LOGGER.debug("TLE data not modified since last fetch")
+
+        # Failed groups leave the catalog stale so the next poll retries them
+        if not failed:
+            self.tle_update_time = datetime.now(timezone.utc)
+        self.refresh_stats = {
+            "fetch_ms": round(fetch_ms, 1),
+            "merge_ms": round(merge_ms, 1),
+            "parse_ms": round(parse_ms, 1),
+            "total_ms": round((time.perf_counter() - refresh_start) * 1000, 1),
+            "not_modified_groups": not_modified,
+            "failed_groups": failed,
+            "last_refresh": datetime.now(timezone.utc).isoformat(),
+        }
+
+        await self._async_save_cache()
+
+    async def _async_download_groups(
+        self, session: aiohttp.ClientSession
+    ) -> list[SatelliteCatalog | Exception | None]:
+        """Download all configured groups concurrently."""
+        return await asyncio.gather(
+            *(self._async_download_group(session, group) for group in self.groups),
+            return_exceptions=True,
+        )
+
+    async def _async_download_group(
+        self, session: aiohttp.ClientSession, group: str
+    ) -> SatelliteCatalog | None:
+        """GET one CelesTrak group, returning None when the server answers 304."""
+        if self._request_guard is not None:
+            return await self._request_guard(
+                lambda: self._async_fetch_group(session, group)
+            )
+        return await self._async_fetch_group(session, group)
+
+    async def _async_fetch_group(
+        self, session: aiohttp.ClientSession, group: str
+    ) -> SatelliteCatalog | None:
+        """Make the conditional GET for one CelesTrak group."""
+        validators = self._group_validators.setdefault(group, {})
+        headers = {}
+        # Only revalidate groups we still hold a copy of
+        if group in self._group_catalogs:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        url = CELESTRAK_GROUP_URL.format(group=group)
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                validators["fetched"] = datetime.now(timezone.utc).isoformat()
+                return None
+            response.raise_for_status()
+            lines = (await response.text()).strip().split("\n")
+            validators["etag"] = response.headers.get("ETag")
+            validators["last_modified"] = response.headers.get("Last-Modified")
+            validators["fetched"] = datetime.now(timezone.utc).isoformat()
+
+        records = self._parse_tle_lines(lines)
+        _LOGGER.debug("Fetched %s TLEs for group %s", len(records), group)
+        return SatelliteCatalog.from_records(records, groups=(group,))
+
+    def _merge_groups(self) -> SatelliteCatalog:
+        """Merge group catalogs, keeping the newest epoch per NORAD ID."""
+        records = [
+            record
+            for group in self.groups
+            if group in self._group_catalogs
+            for record in self._group_catalogs[group].records()
+        ]
+        return SatelliteCatalog.from_records(records, groups=self.groups)
+
+    @staticmethod
+    def _parse_tle_lines(lines: list[str]) -> list[tuple[int, str, str, str]]:
+        """Parse three-line TLE format into (norad_id, name, line1, line2) records."""
+        # Parse TLE format: name line, line 1, line 2
+        records = []
+        for i in range(0, len(lines) - 2, 3):
+            name = lines[i].strip()
+            line1 = lines[i + 1].strip()
+            line2 = lines[i + 2].strip()
+
+            # Extract NORAD ID from line 1 (positions 3-7)
+            try:
+                norad_id = int(line1[2:7])
+            except (ValueError, IndexError):
+                continue
+            records.append((norad_id, name, line1, line2))
+        return records
 
-        visible = []
+    async def _async_load_cache(self) -> None:
+        """Warm-start the catalog from the on-disk TLE cache."""
+        self._cache_loaded = True
+        if self._store is None:
+            return
+        try:
+            cached = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Failed to load cached TLE data: %s", err)
+            return
+        if not cached:
+            return
+
+        cached_groups = cached.get("groups", {})
+        fetched_times = []
+        for group in self.groups:
+            entry = cached_groups.get(group)
+            if not entry or not entry.get("satellites"):
+                continue
+            self._group_catalogs[group] = SatelliteCatalog.from_records(
+                [tuple(record) for record in entry["satellites"]],
+                groups=(group,),
+            )
+            self._group_validators[group] = {
+                "etag": entry.get("etag"),
+                "last_modified": entry.get("last_modified"),
+                "fetched": entry.get("fetched"),
+            }
+            fetched_times.append(datetime.fromisoformat(entry["fetched"]))
+        if not self._group_catalogs:
+            return
+
+        self.catalog = await self._async_run_job(self._merge_groups)
+        # A configured group missing from the cache forces a refresh
+        if len(fetched_times) == len(self.groups):
+            self.tle_update_time = min(fetched_times)
+        await self.async_snapshot()
+        _LOGGER.info(
+            "Loaded %s cached satellites from groups %s",
+            len(self.catalog),
+            ", ".join(self._group_catalogs),
+        )
+
+    async def _async_save_cache(self) -> None:
+        """Persist every group catalog and its HTTP validators to disk."""
+        if self._store is None:
+            return
+        await self._store.async_save({
+            "groups": {
+                group: {
+                    **self._group_validators.get(group, {}),
+                    "satellites": [list(record) for record in catalog.records()],
+                }
+                for group, catalog in self._group_catalogs.items()
+            },
+        })
+
+    def _build_snapshot(
+        self,
+        catalog: SatelliteCatalog,
+        previous: SatelliteSnapshot | None,
+    ) -> SatelliteSnapshot:
+        """Parse a TLE catalog, reusing SGP4 records whose epoch is unchanged."""
+        old_satrecs = previous.satrecs if previous else {}
+        satrecs: dict[int, tuple[float, Satrec]] = {}
+        parsed = 0
+        reused = 0
+        for norad, epoch, line1, line2 in zip(
+            catalog.norad_ids, catalog.epochs, catalog.line1, catalog.line2
+        ):
+            norad_id = int(norad)
+            epoch = float(epoch)
+            cached = old_satrecs.get(norad_id)
+            if cached is not None and cached[0] == epoch:
+                satrecs[norad_id] = cached
+                reused += 1
+                continue
+            try:
+                satrecs[norad_id] = (
+                    epoch,
+                    Satrec.twoline2rv(line1.decode(), line2.decode()),
+                )
+                parsed += 1
+            except (ValueError, IndexError) as err:
+                _LOGGER.debug("Skipping unparsable TLE for satellite %s: %s", norad_id, err)
+        dropped = len(old_satrecs) - reused
+        propagator = BatchPropagator(
+            [satrec for _, satrec in satrecs.values()], list(satrecs)
+        )
+
+        # Drop pass-prediction satellites whose TLE changed or disappeared
+        with self._cache_lock:
+            stale = [
+                norad_id
+                for norad_id, (epoch, _) in self._pass_satellites.items()
+                if catalog.epoch(norad_id) != epoch
+            ]
+            for norad_id in stale:
+                del self._pass_satellites[norad_id]
+            self._cache_stats["pass_dropped"] += len(stale)
+            self._count_parses(parsed, reused)
+            self._cache_stats["dropped"] += dropped
+        _LOGGER.debug(
+            "Satellite propagator rebuilt: %s parsed, %s reused, %s dropped",
+            parsed,
+            reused,
+            dropped,
+        )
+        return SatelliteSnapshot(catalog=catalog, satrecs=satrecs, propagator=propagator)
+
+    def _pass_satellite(
+        self, snapshot: SatelliteSnapshot, norad_id: int
+    ) -> EarthSatellite | None:
+        """Return the EarthSatellite of one catalog entry, parsing it at most once per epoch."""
+        tle = snapshot.catalog.get(norad_id)
+        if tle is None:
+            return None
+        epoch = snapshot.catalog.epoch(norad_id)
+        with self._cache_lock:
+            cached = self._pass_satellites.get(norad_id)
+            if cached is not None and cached[0] == epoch:
+                self._count_parses(0, 1, "pass_")
+                return cached[1]
+        try:
+            sat = EarthSatellite(*tle, name=f"SAT-{norad_id}", ts=self.ts)
+        except (ValueError, IndexError) as err:
+            _LOGGER.debug("Skipping unparsable TLE for satellite %s: %s", norad_id, err)
+            return None
+        with self._cache_lock:
+            self._pass_satellites.pop(norad_id, None)
+            if len(self._pass_satellites) >= PASS_SATELLITE_CACHE_SIZE:
+                # Evict the least recently parsed satellite
+                del self._pass_satellites[next(iter(self._pass_satellites))]
+            self._pass_satellites[norad_id] = (epoch, sat)
+            self._count_parses(1, 0, "pass_")
+        return sat
+
+    async def async_snapshot(self) -> SatelliteSnapshot:
+        """Return the catalog snapshot, re-parsing in the executor if TLEs changed."""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.catalog is not self.catalog:
+            snapshot = await self._async_run_job(
+                self._build_snapshot, self.catalog, snapshot
+            )
+            self._snapshot = snapshot
+        return snapshot
+
+    def _count_parses(self, parsed: int, reused: int, prefix: str = "") -> None:
+        """Count TLE parses done and avoided; the caller holds the cache lock."""
+        self._cache_stats[f"{prefix}parsed"] += parsed
+        self._cache_stats[f"{prefix}reused"] += reused
+        self._poll_parsed += parsed
+        self._poll_parses_saved += reused
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return catalog size, memory footprint and last refresh timings."""
+        snapshot = self._snapshot
+        return {
+            "groups": list(self.groups),
+            "satellites": len(self.catalog),
+            "group_sizes": {
+                group: len(catalog) for group, catalog in self._group_catalogs.items()
+            },
+            "catalog_bytes": self.catalog.nbytes,
+            "propagator_bytes": snapshot.propagator.nbytes if snapshot else 0,
+            # Parsed records kept for the next rebuild, next to the
+            # propagator's own copy of them
+            "satrec_bytes": (
+                sum(sys.getsizeof(satrec) for _, satrec in snapshot.satrecs.values())
+                if snapshot
+                else 0
+            ),
+            "pass_satellites": len(self._pass_satellites),
+            "tle_update_time": (
+                self.tle_update_time.isoformat() if self.tle_update_time else None
+            ),
+            "refresh": self.refresh_stats,
+        }
+
+    def pop_cache_stats(self) -> dict[str, int]:
+        """Return satellite cache statistics and reset the per-poll counters."""
+        snapshot = self._snapshot
+        with self._cache_lock:
+            stats = {
+                **self._cache_stats,
+                "cached_satellites": len(snapshot.satrecs) if snapshot else 0,
+                "pass_satellites": len(self._pass_satellites),
+                "parsed_last_poll": self._poll_parsed,
+                "parses_saved_last_poll": self._poll_parses_saved,
+            }
+            self._poll_parsed = 0
+            self._poll_parses_saved = 0
+        return stats
+
+    def compute_visible_satellites(
+        self,
+        snapshot: SatelliteSnapshot,
+        time: datetime,
+        min_elevation: float = 0.0,
+    ) -> VisibilityPass:
+        """Compute visible satellites from a catalog snapshot (executor safe)."""
         # Ensure time is timezone-aware (Skyfield requirement)
         if time.tzinfo is None:
             time = time.replace(tzinfo=timezone.utc)
         t = self.ts.from_datetime(time)
 
-        for norad_id, (line1, line2) in self.tles.items():
-            try:
-                sat = EarthSatellite(line1, line2, name=f"SAT-{norad_id}", ts=self.ts)
-                difference = sat - self.observer
-                topocentric = difference.at(t)
-                alt, az, distance = topocentric.altaz()
-
-                if alt.degrees >= min_elevation:
-                    # Check if satellite is sunlit (simplified - always True if eph not loaded)
-                    is_sunlit = True
-                    if self.eph:
-                        try:
-                            is_sunlit = self._is_sunlit(sat, t)
-                        except Exception:
-                            is_sunlit = True
-
-                    # Get satellite name if available
-                    sat_name = self.satellite_names.get(norad_id, f"SAT-{norad_id}")
-                    visible.append({
-                        "norad_id": norad_id,
-                        "name": sat_name,
-                        "azimuth": az.degrees,
-                        "elevation": alt.degrees,
-                        "distance_km": distance.km,
-                        "sunlit": is_sunlit,
-                    })
-            except Exception as err:
-                _LOGGER.debug("Error calculating position for satellite %s: %s", norad_id, err)
-                continue
+        # Propagate the whole catalog in one vectorized SGP4 call; only
+        # objects passing the coarse horizon test get full alt/az math
+        batch = snapshot.propagator.topocentric(t, self.observer, min_elevation)
+        above = np.flatnonzero(batch.valid & (batch.altitude_deg >= min_elevation))
+        candidates = len(batch.norad_ids)
+        prefilter = {
+            "catalog": batch.catalog_size,
+            "candidates": candidates,
+            "visible": len(above),
+            "prune_ratio": (
+                round(1 - candidates / batch.catalog_size, 4)
+                if batch.catalog_size
+                else 0.0
+            ),
+        }
+
+        # One Sun position per timestamp, one shadow test for all satellites
+        shadow = None
+        observer_dark = None
+        if self.eph is not None and above.size:
+            sun_km = (self.eph["sun"] - self.eph["earth"]).at(t).position.km
+            shadow = earth_shadow(batch.gcrs_km[above], sun_km)
+            observer_km = self.observer.at(t).position.km
+            sun_x, sun_y, sun_z = (sun_km - observer_km) @ self.observer.rotation_at(t).T
+            sun_altitude = np.degrees(np.arctan2(sun_z, np.hypot(sun_x, sun_y)))
+            observer_dark = bool(sun_altitude < OBSERVER_DARK_SUN_ALTITUDE)
+
+        visible = []
+        for pos, idx in enumerate(above):
+            norad_id = int(batch.norad_ids[idx])
+            # Get satellite name if available
+            sat_name = snapshot.catalog.name(norad_id)
+            sat_data = {
+                "norad_id": norad_id,
+                "name": sat_name,
+                "azimuth": float(batch.azimuth_deg[idx]),
+                "elevation": float(batch.altitude_deg[idx]),
+                "distance_km": float(batch.distance_km[idx]),
+                "sunlit": None,
+                "eclipse": None,
+                "observable": None,
+            }
+            if shadow is not None:
+                # Penumbra still reflects sunlight, only the umbra hides a satellite
+                sunlit = bool(shadow[pos] != SHADOW_UMBRA)
+                sat_data["sunlit"] = sunlit
+                sat_data["eclipse"] = SHADOW_NAMES[shadow[pos]]
+                sat_data["observable"] = sunlit and observer_dark
+            visible.append(sat_data)
+
+        return VisibilityPass(visible, prefilter)
+
+    def compute_passes(
+        self,
+        snapshot: SatelliteSnapshot,
+        norad_id: int,
+        start_time: datetime,
+        max_hours: int = 24,
+        min_elevation: float = 0.0,
+    ) -> list[dict[str, Any]]:
+        """Compute every pass of one satellite from a catalog snapshot (executor safe)."""
+        sat = self._pass_satellite(snapshot, norad_id)
+        if sat is None:
+            return []
 
-        return visible
+        # Ensure start_time is timezone-aware (Skyfield requirement)
+        if start_time.tzinfo is None:
+            start_time = start_time.replace(tzinfo=timezone.utc)
 
-    def _is_sunlit(self, sat: EarthSatellite, t: Any) -> bool:
-        """Check if satellite is sunlit."""
-        if not self.eph:
-            return True
         try:
-            # Get satellite position
-            sat_pos = sat.at(t)
-            # Get sun position
-            sun_pos = self.eph["sun"].at(t)
-            # Vector from satellite to sun
-            vector = sun_pos.position.km - sat_pos.position.km
-            # Check if sun is above horizon from satellite's perspective
-            # Simplified: check if satellite is in sunlight
-            return True  # Simplified for now
-        except Exception:
-            return True
+            passes = self.pass_predictor.find_passes(
+                sat,
+                start_time,
+                start_time + timedelta(hours=max_hours),
+                min_altitude=min_elevation,
+            )
+        except Exception as err:
+            _LOGGER.error("Error calculating satellite passes: %s", err)
+            return []
+
+        # Get satellite name if available
+        sat_name = snapshot.catalog.name(norad_id)
+        return [
+            {"norad_id": norad_id, "name": sat_name, **sat_pass}
+            for sat_pass in passes
+        ]
+
+    def compute_poll(
+        self,
+        snapshot: SatelliteSnapshot,
+        time: datetime,
+        cancel: threading.Event,
+        norad_id: int = ISS_NORAD_ID,
+    ) -> dict[str, Any]:
+        """Run one refresh cycle's worth of computation (executor safe).
+
+        Raises ComputationCancelled between stages once `cancel` is set.
+        """
+        if cancel.is_set():
+            raise ComputationCancelled
+        satellites, prefilter = self.compute_visible_satellites(snapshot, time)
+        if cancel.is_set():
+            raise ComputationCancelled
+        passes = self.compute_passes(snapshot, norad_id, time)
+        return {
+            "satellites": satellites,
+            "next_pass": passes[0] if passes else None,
+            "prefilter": prefilter,
+        }
+
+    async def get_visible_satellites(
+        self, time: datetime, min_elevation: float = 0.0
+    ) -> list[dict[str, Any]]:
+        """Get currently visible satellites."""
+        if not len(self.catalog):
+            await self.update_tles_if_needed()
+        if self.hass is not None:
+            await self._ensure_eph_loaded(self.hass)
+        snapshot = await self.async_snapshot()
+        visibility = await self._async_run_job(
+            self.compute_visible_satellites, snapshot, time, min_elevation
+        )
+        return visibility.satellites
 
     async def get_next_pass(
         self, norad_id: int, start_time: datetime, max_hours: int = 24
     ) -> dict[str, Any] | None:
         """Get next satellite pass."""
-        if norad_id not in self.tles:
+        passes = await self.get_passes(norad_id, start_time, max_hours)
+        return passes[0] if passes else None
+
+    async def get_passes(
+        self,
+        norad_id: int,
+        start_time: datetime,
+        max_hours: int = 24,
+        min_elevation: float = 0.0,
+    ) -> list[dict[str, Any]]:
+        """Get every satellite pass within the next `max_hours`."""
+        if norad_id not in self.catalog:
             await self.update_tles_if_needed()
 
-        if norad_id not in self.tles:
-            return None
-
-        try:
-            # Ensure start_time is timezone-aware (Skyfield requirement)
-            if start_time.tzinfo is None:
-                start_time = start_time.replace(tzinfo=timezone.utc)
-            
-            line1, line2 = self.tles[norad_id]
-            sat = EarthSatellite(line1, line2, name=f"SAT-{norad_id}", ts=self.ts)
-
-            # Find next rise
-            t0 = self.ts.from_datetime(start_time)
-            t1 = self.ts.from_datetime(start_time + timedelta(hours=max_hours))
-
-            # Simple search for next pass above horizon
-            current = t0
-            step_hours = 0.1
-            while current.utc_datetime() < t1.utc_datetime():
-                difference = sat - self.observer
-                topocentric = difference.at(current)
-                alt, az, _ = topocentric.altaz()
-
-                if alt.degrees > 0:
-                    # Found rise, find set
-                    rise_time = current
-                    set_time = current
-                    while set_time.utc_datetime() < t1.utc_datetime():
-                        # Check altitude before incrementing to avoid 1-minute offset
-                        topocentric = difference.at(set_time)
-                        alt, az, _ = topocentric.altaz()
-                        if alt.degrees <= 0:
-                            # Satellite has set, use current set_time (not incremented)
-                            break
-                        # Increment only if still above horizon
-                        set_time = self.ts.from_datetime(
-                            set_time.utc_datetime() + timedelta(minutes=1)
-                        )
-
-                    max_alt = 0
-                    max_alt_time = rise_time
-                    check_time = rise_time
-                    while check_time.utc_datetime() < set_time.utc_datetime():
-                        topocentric = difference.at(check_time)
-                        alt, az, _ = topocentric.altaz()
-                        if alt.degrees > max_alt:
-                            max_alt = alt.degrees
-                            max_alt_time = check_time
-                        check_time = self.ts.from_datetime(
-                            check_time.utc_datetime() + timedelta(minutes=1)
-                        )
-
-                    # Get satellite name if available
-                    sat_name = self.satellite_names.get(norad_id, f"SAT-{norad_id}")
-                    return {
-                        "norad_id": norad_id,
-                        "name": sat_name,
-                        "rise_time": rise_time.utc_datetime().isoformat(),
-                        "set_time": set_time.utc_datetime().isoformat(),
-                        "max_elevation": max_alt,
-                        "max_elevation_time": max_alt_time.utc_datetime().isoformat(),
-                        "duration_minutes": int((set_time.utc_datetime() - rise_time.utc_datetime()).total_seconds() / 60),
-                    }
-
-                current = self.ts.from_datetime(
-                    current.utc_datetime() + timedelta(hours=step_hours)
-                )
-
-        except Exception as err:
-            _LOGGER.error("Error calculating next pass: %s", err)
-
-        return None
+        if norad_id not in self.catalog:
+            return []
+
+        snapshot = await self.async_snapshot()
+        return await self._async_run_job(
+            self.compute_passes,
+            snapshot,
+            norad_id,
+            start_time,
+            max_hours,
+            min_elevation,
+        )
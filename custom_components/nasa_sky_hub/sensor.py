@@ -17,6 +17,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    CONF_DATA_DIR,
+    CONF_SATELLITE_GROUPS,
+    DEFAULT_SATELLITE_GROUPS,
     DOMAIN,
     MODULE_APOD,
     MODULE_ASTEROIDS,
@@ -103,6 +106,11 @@ SKY_SENSORS = [
         name="Sidereal Time",
         icon="mdi:clock-outline",
     ),
+    SensorEntityDescription(
+        key="moon_phase",
+        name="Moon Phase",
+        icon="mdi:moon-waxing-crescent",
+    ),
 ]
 
 ASTEROID_SENTRY_SENSORS = [
@@ -190,6 +198,8 @@ async def async_setup_entry(
     location = data["location"]
     enabled_modules = data.get("enabled_modules", [])
     profile = entry.data.get("profile", PROFILE_BALANCED)
+    # Ephemeris and IERS files are read from here, defaulting to the config dir
+    data_dir = entry.options.get(CONF_DATA_DIR) or hass.config.config_dir
 
     # CRITICAL: Double-check modules are enabled (kitten safety!)
     if not enabled_modules:
@@ -266,7 +276,16 @@ async def async_setup_entry(
             hass,
             api_client,
             location,
+            entry.entry_id,
             update_interval=DEFAULT_INTERVALS[profile][MODULE_SATELLITES],
+            groups=[
+                group.strip()
+                for group in entry.options.get(
+                    CONF_SATELLITE_GROUPS, ",".join(DEFAULT_SATELLITE_GROUPS)
+                ).split(",")
+                if group.strip()
+            ],
+            data_dir=data_dir,
         )
         # Create entities immediately - NO API CALLS during setup!
         # Coordinator will refresh automatically on its update_interval
@@ -283,6 +302,7 @@ async def async_setup_entry(
             hass,
             location,
             update_interval=DEFAULT_INTERVALS[profile][MODULE_SKY],
+            data_dir=data_dir,
         )
         # Create entities immediately - NO API CALLS during setup!
         # Coordinator will refresh automatically on its update_interval
@@ -350,6 +370,12 @@ async def async_setup_entry(
         _LOGGER.error("KITTEN SAVE: NeoWs sensors added immediately - KITTENS ARE SAFE!")
         # Coordinator will refresh automatically on its update_interval - no API call during setup!
 
+    # Intervals follow the remaining quota from here on, starting at the profile's
+    poll_scheduler = data["poll_scheduler"]
+    for name, coordinator in data["coordinators"].items():
+        poll_scheduler.register(name, coordinator)
+    poll_scheduler.update()
+
     _LOGGER.error("KITTEN SAVE: Total entities created: %s", len(entities))
     # Log entity details for diagnostics - CRITICAL for kittens!
     for entity in entities:
@@ -531,8 +557,14 @@ class SatelliteSensor(BaseSensor):
         data = self.coordinator.data
         if data is None:
             return {}
+        satellites = data.get("satellites", [])
         attrs = {
-            "satellites": data.get("satellites", []),
+            # Highest 20 only; the full list exceeds the recorder's 16 KB attribute limit
+            "satellites": sorted(
+                satellites, key=lambda sat: sat["elevation"], reverse=True
+            )[:20],
+            "visible_count": len(satellites),
+            "satellites_observable": data.get("satellites_observable", 0),
             "iss_overhead": data.get("iss_overhead", False),
         }
         if data.get("iss_data"):
@@ -564,6 +596,8 @@ class SkySensor(BaseSensor):
             return int(level * 100)
         elif key == "sidereal_time":
             return data.get("sidereal_time", "")
+        elif key == "moon_phase":
+            return data.get("moon", {}).get("phase")
         return None
 
     @property
@@ -575,8 +609,32 @@ class SkySensor(BaseSensor):
         attrs = {}
         if self.entity_description.key == "brightest_object":
             attrs["brightest_object"] = data.get("brightest_object", {})
+            attrs["brightest_stars"] = data.get("brightest_stars", [])
+            attrs["naked_eye_stars"] = data.get("naked_eye_stars", 0)
+            attrs["planets"] = data.get("planets", [])
         elif self.entity_description.key == "visible_constellations":
             attrs["constellations"] = data.get("visible_constellations", [])
+            # Area fractions are measured above CONSTELLATION_MIN_ALTITUDE (10 deg)
+            attrs["area_above_10deg"] = data.get("constellation_visibility", {})
+        elif self.entity_description.key == "darkness_level":
+            attrs["moonlight"] = data.get("moonlight", 0.0)
+            attrs["upcoming_transitions"] = data.get("upcoming_transitions", [])
+            # Flat next_<event> timestamps for template triggers
+            for event, time in data.get("next_transitions", {}).items():
+                attrs[f"next_{event}"] = time
+        elif self.entity_description.key == "moon_phase":
+            moon = data.get("moon", {})
+            for attr in (
+                "illumination",
+                "magnitude",
+                "phase_angle",
+                "elongation",
+                "altitude",
+                "azimuth",
+                "above_horizon",
+            ):
+                if attr in moon:
+                    attrs[attr] = moon[attr]
         return attrs
 
 
@@ -6,8 +6,10 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DOMAIN, MODULE_SATELLITES, RATE_LIMIT_INTERACTIVE_DEADLINE
+from .rate_limiter import request_deadline_scope
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -109,7 +111,9 @@ async def async_prefetch_apod_range(hass: HomeAssistant, call: ServiceCall) -> N
         while current <= end:
             date_str = current.strftime("%Y-%m-%d")
             try:
-                await api_client.get_apod(date=date_str)
+                # Per date, so a long range is not cut off by one shared deadline
+                with request_deadline_scope(RATE_LIMIT_INTERACTIVE_DEADLINE):
+                    await api_client.get_apod(date=date_str)
                 _LOGGER.info("Prefetched APOD for %s", date_str)
             except Exception as err:
                 _LOGGER.error("Failed to prefetch APOD for %s: %s", date_str, err)
@@ -128,10 +132,30 @@ async def async_calculate_satellite_passes(hass: HomeAssistant, call: ServiceCal
         _LOGGER.error("norad_id required")
         return
 
+    if not entry_id:
+        # Use first entry if not specified
+        entries = hass.config_entries.async_entries(DOMAIN)
+        if not entries:
+            _LOGGER.error("No NASA Sky Hub config entries found")
+            return
+        entry_id = entries[0].entry_id
+
     data = hass.data[DOMAIN].get(entry_id)
     if not data:
         _LOGGER.error("Config entry not found: %s", entry_id)
         return
 
-    # This would use the satellite tracker to calculate passes
+    coordinator = data.get("coordinators", {}).get(MODULE_SATELLITES)
+    if coordinator is None:
+        _LOGGER.error("Satellites module not enabled for entry %s", entry_id)
+        return
+
     _LOGGER.info("Calculating passes for satellite %s over next %s hours", norad_id, hours)
+    passes = await coordinator.tracker.get_passes(
+        int(norad_id), dt_util.utcnow(), max_hours=int(hours)
+    )
+    _LOGGER.info("Found %s passes for satellite %s", len(passes), norad_id)
+    hass.bus.async_fire(
+        f"{DOMAIN}_satellite_passes",
+        {"entry_id": entry_id, "norad_id": int(norad_id), "passes": passes},
+    )
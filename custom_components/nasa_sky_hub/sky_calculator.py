@@ -2,25 +2,55 @@
 from __future__ import annotations
 
 import logging
+import math
+import os
 from datetime import datetime, timezone
-from math import asin, cos, degrees, radians, sin
 from typing import Any
 
-from skyfield.api import load, wgs84
+from skyfield.api import wgs84
+
+from .constellations import ConstellationGrid, load_constellation_grid
+from .ephemeris import async_get_ephemeris, async_get_timescale, get_timescale
+from .sky_snapshot import SkySnapshot
+from .solar_system import PLANETS, moon_phase_name
+from .star_catalog import StarCatalog, StarPositions, load_star_catalog
+from .twilight import STATE_NIGHT, TwilightSchedule
 
 _LOGGER = logging.getLogger(__name__)
 
+# Constellations are judged above horizon haze, by the share of their area
+CONSTELLATION_MIN_ALTITUDE = 10.0
+CONSTELLATION_VISIBLE_FRACTION = 0.5
+
+# Moonlight scales with the Moon's flux relative to a full Moon and reaches
+# its full effect 30 degrees up; a high full Moon removes 60% of darkness
+FULL_MOON_MAGNITUDE = -12.7
+MOONLIGHT_FULL_ALTITUDE = 30.0
+MOONLIGHT_MAX_PENALTY = 0.6
+
 
 class SkyCalculator:
     """Calculate sky visibility conditions."""
 
-    def __init__(self, latitude: float, longitude: float, elevation: float = 0.0) -> None:
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        elevation: float = 0.0,
+        data_dir: str | None = None,
+    ) -> None:
         """Initialize sky calculator."""
         self.latitude = latitude
         self.longitude = longitude
         self.elevation = elevation
-        self.ts = load.timescale()
+        # Local ephemeris/IERS data directory; nothing is downloaded
+        self.data_dir = data_dir or os.getcwd()
+        self.ts = get_timescale()
         self.eph: Any = None  # Will be loaded lazily in executor
+        self.stars: StarCatalog | None = None
+        self.constellations: ConstellationGrid | None = None
+        # Cached twilight/moon events, rebuilt about once a day
+        self.twilight: TwilightSchedule | None = None
         self.observer = wgs84.latlon(latitude, longitude, elevation_m=elevation)
         self._eph_loaded = False
 
@@ -28,186 +58,221 @@ class SkyCalculator:
         """Ensure ephemeris is loaded (in executor to avoid blocking)."""
         if self._eph_loaded:
             return
-        _LOGGER.debug("Loading ephemeris file in executor")
-        self.eph = await hass.async_add_executor_job(load, "de421.bsp")
+        self.eph = await async_get_ephemeris(hass, self.data_dir)
+        self.ts = await async_get_timescale(hass, self.data_dir)
+        self.stars = await hass.async_add_executor_job(load_star_catalog)
+        self.constellations = await hass.async_add_executor_job(load_constellation_grid)
         self._eph_loaded = True
-        _LOGGER.debug("Ephemeris file loaded")
-
-        # Bright stars (simplified catalog)
-        self.bright_stars = [
-            {"name": "Sirius", "ra": 6.7525, "dec": -16.7161, "mag": -1.46},
-            {"name": "Canopus", "ra": 6.3992, "dec": -52.6956, "mag": -0.74},
-            {"name": "Arcturus", "ra": 14.2610, "dec": 19.1824, "mag": -0.05},
-            {"name": "Vega", "ra": 18.6156, "dec": 38.7837, "mag": 0.03},
-            {"name": "Capella", "ra": 5.2782, "dec": 45.9980, "mag": 0.08},
-            {"name": "Rigel", "ra": 5.2423, "dec": -8.2016, "mag": 0.18},
-            {"name": "Procyon", "ra": 7.6550, "dec": 5.2249, "mag": 0.40},
-            {"name": "Betelgeuse", "ra": 5.9195, "dec": 7.4071, "mag": 0.45},
-        ]
 
-        # Major constellations (simplified)
-        self.constellations = [
-            {"name": "Orion", "ra": 5.5, "dec": 5.0},
-            {"name": "Ursa Major", "ra": 11.0, "dec": 50.0},
-            {"name": "Cassiopeia", "ra": 1.0, "dec": 60.0},
-            {"name": "Cygnus", "ra": 20.5, "dec": 45.0},
-            {"name": "Lyra", "ra": 18.8, "dec": 36.8},
-            {"name": "Scorpius", "ra": 16.9, "dec": -30.0},
-            {"name": "Leo", "ra": 10.7, "dec": 13.0},
-            {"name": "Taurus", "ra": 4.5, "dec": 16.5},
-        ]
+    def snapshot(self, time: datetime) -> SkySnapshot:
+        """Evaluate the shared per-tick sky state (blocking, run in executor)."""
+        return SkySnapshot.compute(self.ts, self.eph, self.observer, time)
 
-    def get_sidereal_time(self, time: datetime) -> str:
+    def get_sidereal_time(self, snapshot: SkySnapshot) -> str:
         """Calculate local sidereal time."""
-        # Ensure time is timezone-aware (Skyfield requirement)
-        if time.tzinfo is None:
-            time = time.replace(tzinfo=timezone.utc)
-        t = self.ts.from_datetime(time)
-        lst = self.observer.lst_hours_at(t)
+        lst = snapshot.lst_hours
         hours = int(lst)
         minutes = int((lst - hours) * 60)
         seconds = int(((lst - hours) * 60 - minutes) * 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
-    def is_astronomical_night(self, time: datetime) -> bool:
-        """Check if it's astronomical night (sun 18° below horizon)."""
+    def update_twilight_schedule(self, time: datetime) -> TwilightSchedule | None:
+        """Rebuild the twilight schedule once it no longer covers the next day."""
         if not self.eph:
-            return False
+            return None
         # Ensure time is timezone-aware (Skyfield requirement)
         if time.tzinfo is None:
             time = time.replace(tzinfo=timezone.utc)
-        t = self.ts.from_datetime(time)
-        try:
-            # Convert sun from barycentric to geocentric, then compute topocentric
-            earth_bary = self.eph["earth"].at(t)
-            sun_bary = self.eph["sun"].at(t)
-            sun_geocentric = sun_bary - earth_bary
-            obs_geocentric = self.observer.at(t)
-            topocentric = sun_geocentric - obs_geocentric
-            sun_alt, _, _ = topocentric.altaz()
-            return sun_alt.degrees < -18.0
-        except Exception as err:
-            _LOGGER.debug("Error calculating astronomical night: %s", err)
+        if self.twilight is None or not self.twilight.covers(time):
+            self.twilight = TwilightSchedule.compute(self.ts, self.eph, self.observer, time)
+            _LOGGER.debug("Twilight schedule rebuilt until %s", self.twilight.end)
+        return self.twilight
+
+    def _cached_twilight(self, time: datetime) -> TwilightSchedule | None:
+        """Return the twilight schedule if it can answer lookups at `time`."""
+        if self.twilight is not None and self.twilight.covers(time):
+            return self.twilight
+        return None
+
+    def get_upcoming_transitions(self, snapshot: SkySnapshot) -> list[dict[str, str]]:
+        """Get twilight and moon events of the next 24 hours."""
+        schedule = self._cached_twilight(snapshot.time)
+        return schedule.upcoming(snapshot.time) if schedule else []
+
+    def get_next_transitions(self, snapshot: SkySnapshot) -> dict[str, str]:
+        """Get the next time of each twilight and moon event."""
+        schedule = self._cached_twilight(snapshot.time)
+        return schedule.next_events(snapshot.time) if schedule else {}
+
+    def is_astronomical_night(self, snapshot: SkySnapshot) -> bool:
+        """Check if it's astronomical night (sun 18° below horizon)."""
+        schedule = self._cached_twilight(snapshot.time)
+        if schedule is not None:
+            return schedule.state_at(snapshot.time) == STATE_NIGHT
+        if snapshot.sun_altitude_deg is None:
             return False
+        return snapshot.sun_altitude_deg < -18.0
 
-    def get_darkness_level(self, time: datetime) -> float:
-        """Get darkness level (0.0 = daylight, 1.0 = darkest)."""
-        if not self.eph:
+    def get_moonlight(self, snapshot: SkySnapshot) -> float:
+        """Get moonlight strength (0.0 = none, 1.0 = full Moon high in the sky)."""
+        bodies = snapshot.bodies
+        moon = bodies.index("moon") if bodies is not None else None
+        if moon is None or bodies.altitude_deg[moon] <= 0:
             return 0.0
-        # Ensure time is timezone-aware (Skyfield requirement)
-        if time.tzinfo is None:
-            time = time.replace(tzinfo=timezone.utc)
-        t = self.ts.from_datetime(time)
-        try:
-            # Convert sun from barycentric to geocentric, then compute topocentric
-            earth_bary = self.eph["earth"].at(t)
-            sun_bary = self.eph["sun"].at(t)
-            sun_geocentric = sun_bary - earth_bary
-            obs_geocentric = self.observer.at(t)
-            topocentric = sun_geocentric - obs_geocentric
-            sun_alt, _, _ = topocentric.altaz()
-        except Exception as err:
-            _LOGGER.debug("Error calculating darkness level: %s", err)
+        flux = 10 ** (-0.4 * (float(bodies.magnitude[moon]) - FULL_MOON_MAGNITUDE))
+        height = math.sin(math.radians(float(bodies.altitude_deg[moon])))
+        return min(flux, 1.0) * min(height / math.sin(math.radians(MOONLIGHT_FULL_ALTITUDE)), 1.0)
+
+    def get_darkness_level(self, snapshot: SkySnapshot) -> float:
+        """Get darkness level (0.0 = daylight, 1.0 = darkest), dimmed by moonlight."""
+        moonlight = self.get_moonlight(snapshot)
+        return self.get_sun_darkness_level(snapshot) * (1.0 - MOONLIGHT_MAX_PENALTY * moonlight)
+
+    def get_sun_darkness_level(self, snapshot: SkySnapshot) -> float:
+        """Get darkness level from the Sun alone (0.0 = daylight, 1.0 = darkest)."""
+        schedule = self._cached_twilight(snapshot.time)
+        if schedule is not None:
+            return schedule.darkness_level(snapshot.time)
+        sun_alt = snapshot.sun_altitude_deg
+        if sun_alt is None:
             return 0.0
 
         # Map sun altitude to darkness level
-        if sun_alt.degrees > 0:
+        if sun_alt > 0:
             return 0.0
-        elif sun_alt.degrees > -6:
+        elif sun_alt > -6:
             # Civil twilight
             return 0.3
-        elif sun_alt.degrees > -12:
+        elif sun_alt > -12:
             # Nautical twilight
             return 0.6
-        elif sun_alt.degrees > -18:
+        elif sun_alt > -18:
             # Astronomical twilight
             return 0.8
         else:
             # Astronomical night
             return 1.0
 
-    def get_visible_constellations(self, time: datetime) -> list[str]:
-        """Get list of currently visible constellations."""
-        visible = []
-        # Ensure time is timezone-aware (Skyfield requirement)
-        if time.tzinfo is None:
-            time = time.replace(tzinfo=timezone.utc)
-        t = self.ts.from_datetime(time)
-
-        for const in self.constellations:
-            # Convert RA/Dec to altitude using the correct formula
-            # Formula: sin(altitude) = sin(dec) * sin(lat) + cos(dec) * cos(lat) * cos(HA)
-            lst_hours = self.observer.lst_hours_at(t)
-            ha = lst_hours - const["ra"]
-            dec_rad = radians(const["dec"])
-            lat_rad = radians(self.latitude)
-            ha_rad = radians(ha * 15)
-
-            sin_alt = sin(dec_rad) * sin(lat_rad) + cos(dec_rad) * cos(lat_rad) * cos(ha_rad)
-            # Clamp sin_alt to valid range [-1, 1] and use asin (not acos!)
-            sin_alt = max(-1, min(1, sin_alt))
-            alt = degrees(asin(sin_alt))
-
-            # Check if constellation is visible:
-            # 1. Must be above horizon (alt > 10 degrees to avoid horizon haze)
-            # 2. Must be physically possible to see from this latitude
-            #    (max altitude = 90 - |latitude - declination|)
-            max_possible_alt = 90 - abs(self.latitude - const["dec"])
-            
-            if alt > 10 and max_possible_alt > 10:
-                visible.append(const["name"])
-
-        return visible
-
-    def get_brightest_object(self, time: datetime) -> dict[str, Any]:
+    def get_constellation_visibility(
+        self, snapshot: SkySnapshot, min_altitude: float = CONSTELLATION_MIN_ALTITUDE
+    ) -> dict[str, float]:
+        """Get the area fraction of all 88 constellations above `min_altitude`."""
+        if self.constellations is None:
+            return {}
+        return self.constellations.visibility(snapshot.rotation, min_altitude)
+
+    def get_visible_constellations(self, visibility: dict[str, float]) -> list[str]:
+        """Get list of currently visible constellations.
+
+        A constellation counts as visible when at least half of its area
+        is more than 10 degrees up, clear of horizon haze.
+        """
+        return [
+            name
+            for name, fraction in visibility.items()
+            if fraction >= CONSTELLATION_VISIBLE_FRACTION
+        ]
+
+    def get_moon(self, snapshot: SkySnapshot) -> dict[str, Any]:
+        """Get the Moon's phase, illumination, magnitude and position."""
+        bodies = snapshot.bodies
+        moon = bodies.index("moon") if bodies is not None else None
+        if moon is None:
+            return {}
+        return {
+            **bodies.describe(moon),
+            "phase": moon_phase_name(bodies.moon_elongation_deg),
+            "elongation": round(bodies.moon_elongation_deg, 1),
+            "above_horizon": bool(bodies.altitude_deg[moon] > 0),
+        }
+
+    def get_visible_planets(self, snapshot: SkySnapshot) -> list[dict[str, Any]]:
+        """Get planets above the horizon, brightest first."""
+        bodies = snapshot.bodies
+        if bodies is None:
+            return []
+        planets = [
+            bodies.describe(idx)
+            for idx, name in enumerate(bodies.names)
+            if name in PLANETS and bodies.altitude_deg[idx] > 0
+        ]
+        return sorted(planets, key=lambda planet: planet["magnitude"])
+
+    def get_brightest_object(
+        self,
+        snapshot: SkySnapshot,
+        stars: StarPositions | None = None,
+        planets: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
         """Get brightest object currently visible."""
-        # Ensure time is timezone-aware (Skyfield requirement)
-        if time.tzinfo is None:
-            time = time.replace(tzinfo=timezone.utc)
-        t = self.ts.from_datetime(time)
         brightest = None
         max_mag = float("inf")
 
-        # Check moon
-        if not self.eph:
-            return {"name": "None", "type": "none", "magnitude": 0}
-        try:
-            # Convert moon from barycentric to geocentric, then compute topocentric
-            earth_bary = self.eph["earth"].at(t)
-            moon_bary = self.eph["moon"].at(t)
-            moon_geocentric = moon_bary - earth_bary
-            obs_geocentric = self.observer.at(t)
-            topocentric = moon_geocentric - obs_geocentric
-            moon_alt, _, _ = topocentric.altaz()
-        except Exception as err:
-            _LOGGER.debug("Error calculating moon position: %s", err)
-            moon_alt = None
-        if moon_alt and moon_alt.degrees > 0:
-            # Moon is very bright
-            moon_mag = -12.6  # Full moon magnitude
-            if moon_mag < max_mag:
-                max_mag = moon_mag
-                brightest = {"name": "Moon", "type": "moon", "magnitude": moon_mag}
-
-        # Check bright stars
-        for star in self.bright_stars:
-            lst_hours = self.observer.lst_hours_at(t)
-            ha = lst_hours - star["ra"]
-            dec_rad = radians(star["dec"])
-            lat_rad = radians(self.latitude)
-            ha_rad = radians(ha * 15)
-
-            sin_alt = sin(dec_rad) * sin(lat_rad) + cos(dec_rad) * cos(lat_rad) * cos(ha_rad)
-            sin_alt = max(-1, min(1, sin_alt))
-            alt = degrees(asin(sin_alt))
-
-            if alt > 10 and star["mag"] < max_mag:
-                max_mag = star["mag"]
+        # Check moon, with its magnitude for the current phase and distance
+        bodies = snapshot.bodies
+        moon = bodies.index("moon") if bodies is not None else None
+        if moon is not None and bodies.altitude_deg[moon] > 0:
+            max_mag = round(float(bodies.magnitude[moon]), 2)
+            brightest = {
+                "name": "Moon",
+                "type": "moon",
+                "magnitude": max_mag,
+                "altitude": float(bodies.altitude_deg[moon]),
+            }
+
+        # Check planets (sorted brightest first)
+        if planets is None:
+            planets = self.get_visible_planets(snapshot)
+        if planets and planets[0]["magnitude"] < max_mag:
+            planet = planets[0]
+            max_mag = planet["magnitude"]
+            brightest = {
+                "name": planet["name"],
+                "type": "planet",
+                "magnitude": planet["magnitude"],
+                "altitude": planet["altitude"],
+            }
+
+        # Check bright stars (catalog is sorted brightest first)
+        if self.stars is not None:
+            if stars is None:
+                stars = self.get_star_positions(snapshot)
+            candidates = self.stars.brightest(stars, 1, min_altitude=10)
+            if candidates and candidates[0]["magnitude"] < max_mag:
+                star = candidates[0]
                 brightest = {
                     "name": star["name"],
                     "type": "star",
-                    "magnitude": star["mag"],
-                    "altitude": alt,
+                    "magnitude": star["magnitude"],
+                    "altitude": star["altitude"],
                 }
 
         return brightest or {"name": "None", "type": "none", "magnitude": 0}
+
+    def get_star_positions(self, snapshot: SkySnapshot) -> StarPositions:
+        """Compute altitude/azimuth of the whole star catalog in one pass."""
+        return self.stars.positions(snapshot.rotation)
+
+    def get_brightest_stars(
+        self, positions: StarPositions, count: int = 5, min_altitude: float = 10.0
+    ) -> list[dict[str, Any]]:
+        """Get the brightest stars above `min_altitude`."""
+        if self.stars is None:
+            return []
+        return self.stars.brightest(positions, count, min_altitude)
+
+    def get_stars_above(
+        self, positions: StarPositions, min_altitude: float
+    ) -> list[dict[str, Any]]:
+        """Get naked-eye stars above `min_altitude`, brightest first."""
+        if self.stars is None:
+            return []
+        return self.stars.above(positions, min_altitude)
+
+    def get_naked_eye_star_count(
+        self, positions: StarPositions, min_altitude: float = 0.0
+    ) -> int:
+        """Count stars above the horizon that are visible to the naked eye."""
+        if self.stars is None:
+            return 0
+        return self.stars.naked_eye_count(positions, min_altitude)
@@ -0,0 +1,63 @@
+"""Per-tick sky state shared by every sky calculation."""
+from __future__ import annotations
+
+import logging
+import time as time_module
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
+
+from .solar_system import BodyPositions, compute_bodies
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SkySnapshot:
+    """Time, observer, sidereal time and solar system bodies computed once per tick."""
+
+    def __init__(self, time: datetime) -> None:
+        """Initialize an empty snapshot; use `compute` to fill it."""
+        # Ensure time is timezone-aware (Skyfield requirement)
+        if time.tzinfo is None:
+            time = time.replace(tzinfo=timezone.utc)
+        self.time = time
+        self.t: Any = None
+        self.lst_hours = 0.0
+        # GCRS -> local horizon rotation, shared by stars and constellations
+        self.rotation: np.ndarray | None = None
+        # Sun, Moon and bright planets; None if the positions failed
+        self.bodies: BodyPositions | None = None
+        self.sun_altitude_deg: float | None = None
+        self.moon_altitude_deg: float | None = None
+        # Milliseconds spent per stage, in execution order
+        self.timings: dict[str, float] = {}
+
+    @classmethod
+    def compute(cls, ts: Any, eph: Any, observer: Any, time: datetime) -> SkySnapshot:
+        """Evaluate everything the sky calculations share (blocking, run in executor)."""
+        snapshot = cls(time)
+        with snapshot.stage("time"):
+            snapshot.t = t = ts.from_datetime(snapshot.time)
+            snapshot.lst_hours = float(observer.lst_hours_at(t))
+            snapshot.rotation = observer.rotation_at(t)
+        with snapshot.stage("bodies"):
+            try:
+                snapshot.bodies = bodies = compute_bodies(eph, t, observer, snapshot.rotation)
+            except Exception as err:
+                _LOGGER.debug("Error calculating solar system positions: %s", err)
+            else:
+                snapshot.sun_altitude_deg = float(bodies.altitude_deg[bodies.index("sun")])
+                snapshot.moon_altitude_deg = float(bodies.altitude_deg[bodies.index("moon")])
+        return snapshot
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block and record it under `name` in `timings`."""
+        start = time_module.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round((time_module.perf_counter() - start) * 1000, 3)
@@ -0,0 +1,156 @@
+"""Vectorized Sun, Moon and planet geometry and brightness for one instant."""
+from __future__ import annotations
+
+import logging
+import math
+from typing import Any, NamedTuple
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+# Ephemeris target per body; planets with moons use their system barycenter.
+# compute_bodies relies on the Sun and Moon coming first; callers look
+# bodies up by name with BodyPositions.index()
+BODY_TARGETS = {
+    "sun": "sun",
+    "moon": "moon",
+    "venus": "venus barycenter",
+    "mars": "mars barycenter",
+    "jupiter": "jupiter barycenter",
+    "saturn": "saturn barycenter",
+}
+PLANETS = ("venus", "mars", "jupiter", "saturn")
+
+# V = H + 5 log10(r * delta) + c1*a + c2*a^2 + c3*a^3 + c4*a^4, with the
+# phase angle a in degrees and distances in au (Explanatory Supplement to
+# the Astronomical Almanac; Allen's lunar law scaled to H at 1 au)
+MAGNITUDE_MODELS = {
+    "moon": (0.21, (0.026, 0.0, 0.0, 4.0e-9)),
+    "venus": (-4.40, (0.0009, 2.39e-4, -6.5e-7, 0.0)),
+    "mars": (-1.52, (0.016, 0.0, 0.0, 0.0)),
+    "jupiter": (-9.40, (0.005, 0.0, 0.0, 0.0)),
+    "saturn": (-8.88, (0.044, 0.0, 0.0, 0.0)),
+}
+SUN_MAGNITUDE = -26.74
+
+# Mean obliquity of the ecliptic at J2000, for the Moon's phase longitude
+OBLIQUITY_J2000_DEG = 23.4392911
+
+# Phase names by elongation east of the Sun, 45 degree sectors from New Moon
+MOON_PHASES = (
+    "New Moon",
+    "Waxing Crescent",
+    "First Quarter",
+    "Waxing Gibbous",
+    "Full Moon",
+    "Waning Gibbous",
+    "Last Quarter",
+    "Waning Crescent",
+)
+
+
+class BodyPositions(NamedTuple):
+    """Topocentric geometry and brightness of solar system bodies at one instant."""
+
+    names: tuple[str, ...]
+    altitude_deg: np.ndarray
+    azimuth_deg: np.ndarray
+    distance_au: np.ndarray
+    phase_angle_deg: np.ndarray
+    illuminated_fraction: np.ndarray
+    magnitude: np.ndarray
+    # Moon's ecliptic longitude east of the Sun: 0 new, 180 full
+    moon_elongation_deg: float
+
+    def index(self, name: str) -> int | None:
+        """Return the array index of `name`, or None if it was not computed."""
+        return self.names.index(name) if name in self.names else None
+
+    def describe(self, idx: int) -> dict[str, Any]:
+        """Return the attribute dict for one body."""
+        return {
+            "name": self.names[idx].capitalize(),
+            "magnitude": round(float(self.magnitude[idx]), 2),
+            "altitude": float(self.altitude_deg[idx]),
+            "azimuth": float(self.azimuth_deg[idx]),
+            "illumination": round(float(self.illuminated_fraction[idx]) * 100, 1),
+            "phase_angle": round(float(self.phase_angle_deg[idx]), 1),
+        }
+
+
+def moon_phase_name(elongation_deg: float) -> str:
+    """Return the conventional phase name for the Moon's elongation."""
+    return MOON_PHASES[int(((elongation_deg + 22.5) % 360.0) // 45.0)]
+
+
+def compute_bodies(
+    eph: Any, t: Any, observer: Any, rotation: np.ndarray
+) -> BodyPositions:
+    """Compute every body's horizontal position, phase and magnitude in one pass.
+
+    Barycentric positions are read once per body and all geometry is done
+    on a stacked (n, 3) array using the snapshot's GCRS -> horizon
+    `rotation`. Light time and aberration are ignored, as elsewhere in the
+    sky calculations.
+    """
+    names = []
+    positions = []
+    for name, target in BODY_TARGETS.items():
+        try:
+            positions.append(eph[target].at(t).position.au)
+        except (KeyError, ValueError) as err:
+            if name in ("sun", "moon"):
+                raise
+            _LOGGER.debug("Skipping %s, not in ephemeris: %s", name, err)
+            continue
+        names.append(name)
+    bodies = np.array(positions)
+
+    observer_bary = eph["earth"].at(t).position.au + observer.at(t).position.au
+    topocentric = bodies - observer_bary
+    distance = np.sqrt(np.einsum("ij,ij->i", topocentric, topocentric))
+    x, y, z = (topocentric / distance[:, None] @ rotation.T).T
+    altitude_deg = np.degrees(np.arcsin(np.clip(z, -1.0, 1.0)))
+    azimuth_deg = np.degrees(np.arctan2(y, x) % (2 * np.pi))
+
+    # Phase angle: Sun - body - observer
+    to_sun = bodies[0] - bodies
+    sun_distance = np.sqrt(np.einsum("ij,ij->i", to_sun, to_sun))
+    cos_phase = np.einsum("ij,ij->i", to_sun, -topocentric) / np.maximum(
+        sun_distance * distance, 1e-30
+    )
+    phase_angle_deg = np.degrees(np.arccos(np.clip(cos_phase, -1.0, 1.0)))
+    phase_angle_deg[0] = 0.0
+    illuminated_fraction = (1.0 + np.cos(np.radians(phase_angle_deg))) / 2.0
+
+    # The Sun (index 0) has no model and keeps its fixed magnitude
+    models = [MAGNITUDE_MODELS[name] for name in names[1:]]
+    absolute = np.array([model[0] for model in models])
+    coefficients = np.array([model[1] for model in models])
+    alpha = phase_angle_deg[1:, None] ** np.arange(1, 5)
+    magnitude = np.empty(len(names))
+    magnitude[0] = SUN_MAGNITUDE
+    magnitude[1:] = (
+        absolute
+        + 5.0 * np.log10(sun_distance[1:] * distance[1:])
+        + (coefficients * alpha).sum(axis=1)
+    )
+
+    # Moon's elongation in ecliptic longitude, which orders the phases
+    epsilon = math.radians(OBLIQUITY_J2000_DEG)
+    sun_moon = topocentric[:2]
+    ecliptic_y = sun_moon[:, 1] * math.cos(epsilon) + sun_moon[:, 2] * math.sin(epsilon)
+    longitude = np.degrees(np.arctan2(ecliptic_y, sun_moon[:, 0]))
+    moon_elongation_deg = float((longitude[1] - longitude[0]) % 360.0)
+
+    return BodyPositions(
+        tuple(names),
+        altitude_deg,
+        azimuth_deg,
+        distance,
+        phase_angle_deg,
+        illuminated_fraction,
+        magnitude,
+        moon_elongation_deg,
+    )
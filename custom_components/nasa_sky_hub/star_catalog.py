@@ -0,0 +1,129 @@
+"""Vectorized bright-star catalog for sky visibility queries."""
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import numpy as np
+from skyfield.named_stars import named_star_dict
+
+_LOGGER = logging.getLogger(__name__)
+
+STAR_CATALOG_FILE = Path(__file__).parent / "data" / "hipparcos_bright.csv"
+
+# Faintest magnitude visible to the naked eye under a dark sky
+NAKED_EYE_LIMIT = 6.0
+
+_LOCK = threading.Lock()
+_catalog: StarCatalog | None = None
+
+
+class StarPositions(NamedTuple):
+    """Horizontal coordinates of every catalog star at one instant."""
+
+    altitude_deg: np.ndarray
+    azimuth_deg: np.ndarray
+
+
+class StarCatalog:
+    """Bright stars held as NumPy arrays, sorted from brightest to faintest."""
+
+    def __init__(
+        self,
+        hip: np.ndarray,
+        vmag: np.ndarray,
+        unit_vectors: np.ndarray,
+        names: list[str],
+    ) -> None:
+        """Initialize star catalog from magnitude-sorted arrays."""
+        self.hip = hip
+        self.vmag = vmag
+        # ICRS unit vectors, shape (n, 3)
+        self.unit_vectors = unit_vectors
+        self.names = names
+
+    @classmethod
+    def from_csv(cls, path: Path = STAR_CATALOG_FILE) -> StarCatalog:
+        """Load the packaged hip,ra_deg,dec_deg,vmag catalog."""
+        hip, ra_deg, dec_deg, vmag = np.loadtxt(
+            path, delimiter=",", comments="#", skiprows=4, unpack=True
+        )
+        order = np.argsort(vmag, kind="stable")
+        hip = hip[order].astype(np.int32)
+        ra = np.radians(ra_deg[order])
+        dec = np.radians(dec_deg[order])
+        unit_vectors = np.column_stack([
+            np.cos(dec) * np.cos(ra),
+            np.cos(dec) * np.sin(ra),
+            np.sin(dec),
+        ])
+        star_names = {number: name for name, number in named_star_dict.items()}
+        names = [star_names.get(int(number), f"HIP {number}") for number in hip]
+        return cls(hip, vmag[order], unit_vectors, names)
+
+    def __len__(self) -> int:
+        """Return number of stars."""
+        return len(self.hip)
+
+    def positions(self, rotation: np.ndarray) -> StarPositions:
+        """Compute altitude and azimuth of every star with one rotation.
+
+        `rotation` is the observer's GCRS -> horizon matrix
+        (`observer.rotation_at(t)`), which carries precession, nutation and
+        sidereal time, so it is computed once per timestamp.
+        Proper motion, aberration and refraction are ignored.
+        """
+        x, y, z = (self.unit_vectors @ rotation.T).T
+        altitude_deg = np.degrees(np.arcsin(np.clip(z, -1.0, 1.0)))
+        azimuth_deg = np.degrees(np.arctan2(y, x) % (2 * np.pi))
+        return StarPositions(altitude_deg, azimuth_deg)
+
+    def _describe(self, positions: StarPositions, idx: int) -> dict[str, Any]:
+        """Return the attribute dict for one star."""
+        return {
+            "name": self.names[idx],
+            "hip": int(self.hip[idx]),
+            "magnitude": float(self.vmag[idx]),
+            "altitude": float(positions.altitude_deg[idx]),
+            "azimuth": float(positions.azimuth_deg[idx]),
+        }
+
+    def brightest(
+        self, positions: StarPositions, count: int = 1, min_altitude: float = 0.0
+    ) -> list[dict[str, Any]]:
+        """Return the `count` brightest stars above `min_altitude`."""
+        above = np.flatnonzero(positions.altitude_deg > min_altitude)[:count]
+        return [self._describe(positions, idx) for idx in above]
+
+    def above(
+        self,
+        positions: StarPositions,
+        min_altitude: float,
+        limiting_magnitude: float = NAKED_EYE_LIMIT,
+    ) -> list[dict[str, Any]]:
+        """Return stars above `min_altitude`, brightest first."""
+        mask = (positions.altitude_deg > min_altitude) & (self.vmag <= limiting_magnitude)
+        return [self._describe(positions, idx) for idx in np.flatnonzero(mask)]
+
+    def naked_eye_count(
+        self,
+        positions: StarPositions,
+        min_altitude: float = 0.0,
+        limiting_magnitude: float = NAKED_EYE_LIMIT,
+    ) -> int:
+        """Count stars above `min_altitude` no fainter than `limiting_magnitude`."""
+        return int(np.count_nonzero(
+            (positions.altitude_deg > min_altitude) & (self.vmag <= limiting_magnitude)
+        ))
+
+
+def load_star_catalog() -> StarCatalog:
+    """Return the process-wide star catalog (blocking on first call, run in executor)."""
+    global _catalog
+    with _LOCK:
+        if _catalog is None:
+            _catalog = StarCatalog.from_csv()
+            _LOGGER.debug("Loaded %s bright stars", len(_catalog))
+        return _catalog
@@ -0,0 +1,121 @@
+"""Daily twilight and moonrise schedule with bisect lookups."""
+from __future__ import annotations
+
+import bisect
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from skyfield import almanac
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hours of events computed per rebuild; rebuilt once less than a day remains
+SCHEDULE_HOURS = 48
+SCHEDULE_MIN_LOOKAHEAD = timedelta(hours=24)
+
+# States of skyfield.almanac.dark_twilight_day
+STATE_NIGHT = 0
+STATE_ASTRONOMICAL = 1
+STATE_NAUTICAL = 2
+STATE_CIVIL = 3
+STATE_DAY = 4
+
+# Darkness level per twilight state (0.0 = daylight, 1.0 = darkest)
+DARKNESS_LEVELS = (1.0, 0.8, 0.6, 0.3, 0.0)
+
+# Event names, indexed by the state entered
+DAWN_EVENTS = (None, "astronomical_dawn", "nautical_dawn", "civil_dawn", "sunrise")
+DUSK_EVENTS = ("astronomical_dusk", "nautical_dusk", "civil_dusk", "sunset", None)
+
+
+class TwilightSchedule:
+    """Twilight transitions and moon events over a fixed window."""
+
+    def __init__(
+        self,
+        start: datetime,
+        end: datetime,
+        initial_state: int,
+        transitions: list[tuple[datetime, int]],
+        events: list[tuple[datetime, str]],
+    ) -> None:
+        """Initialize schedule from precomputed, time-sorted events."""
+        self.start = start
+        self.end = end
+        self.initial_state = initial_state
+        self._transition_times = [moment for moment, _ in transitions]
+        self._transition_states = [state for _, state in transitions]
+        self._event_times = [moment for moment, _ in events]
+        self._event_names = [name for _, name in events]
+
+    @classmethod
+    def compute(
+        cls, ts: Any, eph: Any, observer: Any, start: datetime, hours: int = SCHEDULE_HOURS
+    ) -> TwilightSchedule:
+        """Root-find every twilight transition, moonrise and moonset in the window."""
+        end = start + timedelta(hours=hours)
+        t0 = ts.from_datetime(start)
+        t1 = ts.from_datetime(end)
+
+        twilight = almanac.dark_twilight_day(eph, observer)
+        initial_state = int(twilight(t0))
+        times, states = almanac.find_discrete(t0, t1, twilight)
+
+        transitions = []
+        events = []
+        previous = initial_state
+        for moment, state in zip(times.utc_datetime(), states):
+            state = int(state)
+            transitions.append((moment, state))
+            name = DAWN_EVENTS[state] if state > previous else DUSK_EVENTS[state]
+            if name:
+                events.append((moment, name))
+            previous = state
+
+        topos = eph["earth"] + observer
+        for finder, name in (
+            (almanac.find_risings, "moonrise"),
+            (almanac.find_settings, "moonset"),
+        ):
+            moon_times, crossed = finder(topos, eph["moon"], t0, t1)
+            events.extend(
+                (moment, name)
+                for moment, ok in zip(moon_times.utc_datetime(), crossed)
+                if ok
+            )
+
+        events.sort(key=lambda event: event[0])
+        return cls(start, end, initial_state, transitions, events)
+
+    def covers(self, moment: datetime) -> bool:
+        """Return whether lookups at `moment` can be answered for the next day."""
+        return self.start <= moment and moment + SCHEDULE_MIN_LOOKAHEAD <= self.end
+
+    def state_at(self, moment: datetime) -> int:
+        """Return the dark_twilight_day state at `moment`."""
+        idx = bisect.bisect_right(self._transition_times, moment)
+        return self._transition_states[idx - 1] if idx else self.initial_state
+
+    def darkness_level(self, moment: datetime) -> float:
+        """Return the darkness level at `moment`."""
+        return DARKNESS_LEVELS[self.state_at(moment)]
+
+    def upcoming(
+        self, moment: datetime, within: timedelta = SCHEDULE_MIN_LOOKAHEAD
+    ) -> list[dict[str, str]]:
+        """Return events after `moment` within the lookahead, soonest first."""
+        first = bisect.bisect_right(self._event_times, moment)
+        last = bisect.bisect_right(self._event_times, moment + within)
+        return [
+            {"event": self._event_names[idx], "time": self._event_times[idx].isoformat()}
+            for idx in range(first, last)
+        ]
+
+    def next_events(self, moment: datetime) -> dict[str, str]:
+        """Return the next time of every event type after `moment`."""
+        upcoming: dict[str, str] = {}
+        for idx in range(bisect.bisect_right(self._event_times, moment), len(self._event_times)):
+            upcoming.setdefault(self._event_names[idx], self._event_times[idx].isoformat())
+        return upcoming
+
@@ -0,0 +1 @@
+"""Tests for the NASA Sky Hub integration."""
@@ -0,0 +1,52 @@
+"""Shared helpers for NASA Sky Hub tests and benchmarks."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import numpy as np
+from sgp4.api import WGS72, Satrec
+from sgp4.exporter import export_tle
+
+ISS_TLE = (
+    "1 25544U 98067A   26289.50000000  .00016717  00000-0  10270-3 0  9005",
+    "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.50000000 00004",
+)
+
+# Fixed instant near the ISS TLE epoch so results don't drift with the date
+REFERENCE_TIME = datetime(2026, 10, 17, 2, 0, tzinfo=timezone.utc)
+
+# Julian date of SGP4's 1949-12-31 epoch, from which sgp4init counts days
+SGP4_EPOCH_JD = 2433281.5
+
+
+def synthetic_tles(count: int, seed: int = 1) -> dict[int, tuple[str, str]]:
+    """Return `count` random LEO/MEO TLEs plus the ISS, keyed by NORAD ID.
+
+    Orbits share the ISS TLE epoch and have random inclination, node,
+    anomaly, eccentricity and mean motion, so catalogs of any size can be
+    built without network access.
+    """
+    rng = np.random.default_rng(seed)
+    iss = Satrec.twoline2rv(*ISS_TLE)
+    epoch = iss.jdsatepoch + iss.jdsatepochF - SGP4_EPOCH_JD
+    tles = {}
+    for idx in range(count):
+        satrec = Satrec()
+        satrec.sgp4init(
+            WGS72,
+            "i",
+            10000 + idx,
+            epoch,
+            1e-4,  # bstar
+            0.0,  # ndot
+            0.0,  # nddot
+            rng.uniform(0.0, 0.02),  # eccentricity
+            rng.uniform(0.0, 2 * np.pi),  # argument of perigee
+            rng.uniform(0.0, 3.0),  # inclination
+            rng.uniform(0.0, 2 * np.pi),  # mean anomaly
+            rng.uniform(0.04, 0.068),  # mean motion, rad/min
+            rng.uniform(0.0, 2 * np.pi),  # right ascension of the node
+        )
+        tles[10000 + idx] = export_tle(satrec)
+    tles[25544] = ISS_TLE
+    return tles
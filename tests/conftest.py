@@ -0,0 +1,4 @@
+"""Fixtures for NASA Sky Hub tests."""
+from __future__ import annotations
+
+pytest_plugins = "pytest_homeassistant_custom_component"
@@ -0,0 +1,144 @@
+"""Tests for the NASA API client against a local stand-in server."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from aiohttp import web
+import pytest
+
+from custom_components.nasa_sky_hub import api_client as api_client_module
+from custom_components.nasa_sky_hub.api_client import NASAApiClient, NASAApiError
+from custom_components.nasa_sky_hub.circuit_breaker import STATE_OPEN
+from custom_components.nasa_sky_hub.const import CIRCUIT_FAILURE_THRESHOLD, HOST_NASA_API
+from custom_components.nasa_sky_hub.rate_limiter import (
+    PRIORITY_INTERACTIVE,
+    RateLimiter,
+    RateLimitTimeout,
+    request_deadline_scope,
+    request_priority_scope,
+)
+
+
+@pytest.fixture
+async def rate_limited_server(socket_enabled, aiohttp_server):
+    """Serve api.nasa.gov stand-in answering every request with a 429."""
+    requests: list[web.Request] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        requests.append(request)
+        return web.json_response(
+            {"error": {"code": "OVER_RATE_LIMIT"}},
+            status=429,
+            headers={"X-RateLimit-Limit": "1000", "X-RateLimit-Remaining": "0"},
+        )
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    server = await aiohttp_server(app)
+    server.requests = requests
+    return server
+
+
+async def test_consecutive_429s_open_circuit(hass, rate_limited_server, monkeypatch, caplog):
+    """N 429s in a row open the host's circuit and later calls fail fast."""
+    monkeypatch.setattr(
+        api_client_module, "NASA_API_BASE", str(rate_limited_server.make_url("")).rstrip("/")
+    )
+    client = NASAApiClient("DEMO_KEY", RateLimiter(), hass)
+    breaker = client.breakers[HOST_NASA_API]
+
+    # Sent together, before the first 429 puts the limiter into backoff
+    results = await asyncio.gather(
+        *(
+            client.get_donki_flr(f"2024-01-0{day}", f"2024-01-0{day}")
+            for day in range(1, CIRCUIT_FAILURE_THRESHOLD + 1)
+        ),
+        return_exceptions=True,
+    )
+
+    for result in results:
+        assert isinstance(result, NASAApiError)
+        assert result.status == 429
+        assert str(result) == "Rate limit exceeded"
+    assert breaker.state == STATE_OPEN
+    assert breaker.get_status()["consecutive_failures"] == CIRCUIT_FAILURE_THRESHOLD
+    assert not [
+        record for record in caplog.records
+        if record.levelno >= logging.ERROR and "Unexpected error" in record.getMessage()
+    ]
+
+    with pytest.raises(NASAApiError, match="unavailable after repeated failures"):
+        await client.get_donki_flr("2024-01-09", "2024-01-09")
+    assert len(rate_limited_server.requests) == CIRCUIT_FAILURE_THRESHOLD
+
+    await client.async_close()
+
+
+async def test_concurrent_429s_escalate_backoff(hass, rate_limited_server, monkeypatch):
+    """Each 429 answer extends the streak rather than restarting it."""
+    monkeypatch.setattr(
+        api_client_module, "NASA_API_BASE", str(rate_limited_server.make_url("")).rstrip("/")
+    )
+    limiter = RateLimiter()
+    client = NASAApiClient("DEMO_KEY", limiter, hass)
+
+    await asyncio.gather(
+        client.get_donki_flr("2024-01-01", "2024-01-01"),
+        client.get_donki_cme("2024-01-01", "2024-01-01"),
+        client.get_donki_gst("2024-01-01", "2024-01-01"),
+        return_exceptions=True,
+    )
+
+    # Third 429 in a row: 2^3 minutes
+    assert limiter.seconds_in_backoff() / 60 == pytest.approx(8, abs=0.1)
+
+    await client.async_close()
+
+
+async def test_single_flight_joiner_raises_priority(hass):
+    """An interactive caller joining a queued background request speeds it up."""
+    # Ten tokens a second and no burst, so each waiter is admitted in turn
+    limiter = RateLimiter(limit=36000, burst=1)
+    client = NASAApiClient("DEMO_KEY", limiter, hass)
+    await limiter.acquire()
+    order: list[str] = []
+
+    async def request(name: str) -> str:
+        await limiter.acquire()
+        order.append(name)
+        return name
+
+    poll = asyncio.create_task(request("other poll"))
+    background = asyncio.create_task(client._single_flight("apod", lambda: request("apod")))
+    await asyncio.sleep(0)
+    with request_priority_scope(PRIORITY_INTERACTIVE):
+        joined = await client._single_flight("apod", lambda: request("apod"))
+
+    assert joined == "apod"
+    assert order == ["apod"]
+    assert await background == "apod"
+    await poll
+    assert order == ["apod", "other poll"]
+    assert client.get_coalescing_stats()["coalesced"] == 1
+
+    await client.async_close()
+
+
+async def test_single_flight_joiner_keeps_strictest_deadline(hass):
+    """A joiner's earlier deadline applies to the shared request."""
+    # One token a second and no burst
+    limiter = RateLimiter(limit=3600, burst=1)
+    client = NASAApiClient("DEMO_KEY", limiter, hass)
+    await limiter.acquire()
+
+    background = asyncio.create_task(client._single_flight("apod", limiter.acquire))
+    await asyncio.sleep(0)
+    with request_deadline_scope(0.1), pytest.raises(RateLimitTimeout):
+        await client._single_flight("apod", limiter.acquire)
+
+    with pytest.raises(RateLimitTimeout):
+        await background
+    assert limiter.stats["rejected"] == 1
+
+    await client.async_close()
@@ -0,0 +1,53 @@
+"""Tests for ephemeris file verification."""
+from __future__ import annotations
+
+import hashlib
+import logging
+
+import pytest
+
+from custom_components.nasa_sky_hub.ephemeris import (
+    CHECKSUM_FILE,
+    EphemerisError,
+    _read_checksums,
+    _verify,
+)
+
+
+def _write(path, content: bytes) -> str:
+    """Write `content` to `path` and return its SHA-256."""
+    path.write_bytes(content)
+    return hashlib.sha256(content).hexdigest()
+
+
+def test_checksum_file_extends_known_kernels(tmp_path) -> None:
+    """A kernel listed in SHA256SUMS verifies; a corrupted one is rejected."""
+    digest = _write(tmp_path / "de440s.bsp", b"kernel")
+    (tmp_path / CHECKSUM_FILE).write_text(f"{digest}  de440s.bsp\n")
+    checksums = _read_checksums(str(tmp_path))
+
+    assert "de421.bsp" in checksums
+    assert _verify(str(tmp_path / "de440s.bsp"), checksums) == "verified"
+    _write(tmp_path / "de440s.bsp", b"corrupted")
+    with pytest.raises(EphemerisError):
+        _verify(str(tmp_path / "de440s.bsp"), checksums)
+
+
+def test_checksum_file_cannot_replace_known_digest(tmp_path) -> None:
+    """SHA256SUMS cannot vouch for a de421.bsp that differs from the JPL file."""
+    digest = _write(tmp_path / "de421.bsp", b"not the JPL kernel")
+    (tmp_path / CHECKSUM_FILE).write_text(f"{digest}  de421.bsp\n")
+
+    with pytest.raises(EphemerisError):
+        _verify(str(tmp_path / "de421.bsp"), _read_checksums(str(tmp_path)))
+
+
+def test_unknown_kernel_logs_a_warning(tmp_path, caplog) -> None:
+    """A kernel with no known digest is used but reported as unverified."""
+    _write(tmp_path / "custom.bsp", b"kernel")
+
+    with caplog.at_level(logging.WARNING):
+        state = _verify(str(tmp_path / "custom.bsp"), _read_checksums(str(tmp_path)))
+
+    assert state == "unverified"
+    assert "Cannot verify" in caplog.text
@@ -0,0 +1,80 @@
+"""Tests comparing the pass predictor with a brute-force altitude grid."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from skyfield.api import EarthSatellite, wgs84
+
+from custom_components.nasa_sky_hub.ephemeris import get_timescale
+from custom_components.nasa_sky_hub.pass_predictor import PassPredictor
+
+from .common import REFERENCE_TIME, synthetic_tles
+
+WINDOW_HOURS = 24
+# Reference altitudes are sampled every 2 s, so crossings are known to 1 s;
+# the predictor's GMST1982 Earth-fixed frame adds a few milliseconds
+GRID_SECONDS = 2.0
+TIME_TOLERANCE_SECONDS = GRID_SECONDS / 2 + 0.05
+PEAK_TOLERANCE_DEG = 1e-3
+
+
+def _reference_passes(
+    satellite: EarthSatellite, observer, ts, min_altitude: float
+) -> tuple[list[tuple[float, float]], np.ndarray]:
+    """Return (rise, set) offsets from a fine Skyfield altitude grid, and the grid."""
+    start = ts.from_datetime(REFERENCE_TIME)
+    offsets = np.arange(0.0, WINDOW_HOURS * 3600 + GRID_SECONDS, GRID_SECONDS)
+    times = ts.tt_jd(start.whole, start.tt_fraction + offsets / 86400)
+    altitude = (satellite - observer).at(times).altaz()[0].degrees - min_altitude
+
+    above = altitude > 0
+    crossings = np.flatnonzero(above[:-1] != above[1:])
+    midpoints = offsets[crossings] + GRID_SECONDS / 2
+    rises = [t for t, idx in zip(midpoints, crossings) if not above[idx]]
+    sets = [t for t, idx in zip(midpoints, crossings) if above[idx]]
+    if above[0]:
+        rises.insert(0, 0.0)
+    if above[-1]:
+        sets.append(offsets[-1])
+    return list(zip(rises, sets)), altitude + min_altitude
+
+
+def _offset(moment: str) -> float:
+    """Return seconds from the reference time to an ISO timestamp."""
+    return (datetime.fromisoformat(moment) - REFERENCE_TIME).total_seconds()
+
+
+@pytest.mark.parametrize("min_altitude", [0.0, 10.0])
+def test_passes_match_brute_force_grid(min_altitude: float) -> None:
+    """Every pass is found, with rise/set and culmination matching the fine grid."""
+    ts = get_timescale()
+    observer = wgs84.latlon(40.0, -75.0)
+    predictor = PassPredictor(ts, observer)
+    tles = synthetic_tles(7, seed=7)
+
+    total = 0
+    for norad_id, lines in tles.items():
+        satellite = EarthSatellite(*lines, ts=ts)
+        expected, altitude = _reference_passes(satellite, observer, ts, min_altitude)
+        passes = predictor.find_passes(
+            satellite,
+            REFERENCE_TIME,
+            REFERENCE_TIME + timedelta(hours=WINDOW_HOURS),
+            min_altitude=min_altitude,
+        )
+
+        assert len(passes) == len(expected), norad_id
+        for found, (rise, set_) in zip(passes, expected):
+            assert _offset(found["rise_time"]) == pytest.approx(rise, abs=TIME_TOLERANCE_SECONDS)
+            assert _offset(found["set_time"]) == pytest.approx(set_, abs=TIME_TOLERANCE_SECONDS)
+            # The refined culmination is at least as high as any grid sample
+            grid_peak = altitude[
+                int(rise // GRID_SECONDS) : int(set_ // GRID_SECONDS) + 2
+            ].max()
+            assert found["max_elevation"] >= grid_peak - PEAK_TOLERANCE_DEG
+            assert found["max_elevation"] - grid_peak < 0.1
+        total += len(passes)
+
+    assert total > 10
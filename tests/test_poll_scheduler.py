@@ -0,0 +1,289 @@
+"""Deterministic time-simulation tests for the quota-aware poll scheduler."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.nasa_sky_hub.const import (
+    DEFAULT_INTERVALS,
+    MODULE_APOD,
+    MODULE_SKY,
+    MODULE_SPACE_WEATHER,
+    POLL_MAX_STRETCH,
+    POLL_QUOTA_COSTS,
+    PROFILE_AGGRESSIVE,
+    RATE_LIMIT_DEGRADED_THRESHOLD,
+)
+from custom_components.nasa_sky_hub.poll_scheduler import PollScheduler, allocate
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+NEOWS = "asteroids_neows"
+BASES = {
+    MODULE_SPACE_WEATHER: DEFAULT_INTERVALS[PROFILE_AGGRESSIVE][MODULE_SPACE_WEATHER],
+    MODULE_APOD: DEFAULT_INTERVALS[PROFILE_AGGRESSIVE][MODULE_APOD],
+    NEOWS: DEFAULT_INTERVALS[PROFILE_AGGRESSIVE]["asteroids"],
+    MODULE_SKY: DEFAULT_INTERVALS[PROFILE_AGGRESSIVE][MODULE_SKY],
+}
+
+
+class FakeClock:
+    """Simulated wall clock."""
+
+    def __init__(self) -> None:
+        """Start at START."""
+        self.now = START
+
+    def __call__(self) -> datetime:
+        """Return the simulated time."""
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+        self.now += timedelta(seconds=seconds)
+
+
+class FakeRateLimiter:
+    """The quota state PollScheduler reads, with a fixed hourly window."""
+
+    def __init__(self, clock: FakeClock, limit: int = 1000) -> None:
+        """Start a full quota window at the clock's time."""
+        self.clock = clock
+        self.limit = limit
+        self.remaining = limit
+        self.reset_time: datetime | None = clock() + timedelta(hours=1)
+        self.backoff_until: datetime | None = None
+        self.listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Register a quota change listener."""
+        self.listeners.append(listener)
+        return lambda: self.listeners.remove(listener)
+
+    def seconds_until_reset(self, now: datetime) -> float | None:
+        """Return the seconds until the reset time, if known."""
+        if self.reset_time is None:
+            return None
+        return max((self.reset_time - now).total_seconds(), 0.0)
+
+    def seconds_in_backoff(self, now: datetime) -> float:
+        """Return the seconds left of a backoff."""
+        if self.backoff_until is None:
+            return 0.0
+        return max((self.backoff_until - now).total_seconds(), 0.0)
+
+    def spend(self, count: int) -> bool:
+        """Spend quota like a response reporting X-RateLimit-Remaining would."""
+        if self.remaining < count:
+            return False
+        self.remaining -= count
+        self.notify()
+        return True
+
+    def notify(self) -> None:
+        """Tell listeners the quota changed."""
+        for listener in list(self.listeners):
+            listener()
+
+
+class FakeCoordinator:
+    """Polls every update_interval, taking the interval when the next poll is scheduled."""
+
+    def __init__(self, interval: float) -> None:
+        """Initialize with the profile interval."""
+        self.update_interval = timedelta(seconds=interval)
+        self.next_poll = 0.0
+
+
+def _scheduler(
+    limiter: FakeRateLimiter, clock: FakeClock, share: Callable[[], float] | None = None
+) -> tuple[PollScheduler, dict[str, FakeCoordinator]]:
+    """Return a scheduler with the aggressive profile's coordinators registered."""
+    scheduler = PollScheduler(limiter, clock=clock, share=share)
+    coordinators = {name: FakeCoordinator(base) for name, base in BASES.items()}
+    for name, coordinator in coordinators.items():
+        scheduler.register(name, coordinator)
+    return scheduler, coordinators
+
+
+def test_allocate_weighted_max_min() -> None:
+    """Small demands are met in full and the rest is split by weight."""
+    shares = allocate({"a": (1.0, 1), "b": (10.0, 1), "c": (10.0, 3)}, 9.0)
+
+    assert shares["a"] == pytest.approx(1.0)
+    assert shares["b"] == pytest.approx(2.0)
+    assert shares["c"] == pytest.approx(6.0)
+    assert sum(shares.values()) == pytest.approx(9.0)
+
+
+def test_full_quota_keeps_base_intervals() -> None:
+    """With plenty of quota every coordinator polls at its profile interval."""
+    clock = FakeClock()
+    scheduler, _ = _scheduler(FakeRateLimiter(clock), clock)
+
+    assert scheduler.plan() == pytest.approx(BASES)
+
+
+def test_stretch_near_degraded_threshold() -> None:
+    """Intervals grow as remaining falls and wait for the reset below the reserve."""
+    clock = FakeClock()
+    limiter = FakeRateLimiter(clock)
+    scheduler, _ = _scheduler(limiter, clock)
+    clock.advance(600)
+    until_reset = 3000
+
+    previous = scheduler.plan()[MODULE_SPACE_WEATHER]
+    assert previous == BASES[MODULE_SPACE_WEATHER]
+    for remaining in (60, 58, 56):
+        limiter.remaining = remaining
+        interval = scheduler.plan()[MODULE_SPACE_WEATHER]
+        assert interval > previous
+        previous = interval
+
+    limiter.remaining = RATE_LIMIT_DEGRADED_THRESHOLD
+    intervals = scheduler.plan()
+    for name in POLL_QUOTA_COSTS:
+        assert intervals[name] == pytest.approx(max(BASES[name], until_reset))
+    # Coordinators that don't use the quota are never stretched
+    assert intervals[MODULE_SKY] == BASES[MODULE_SKY]
+
+
+def test_stretch_without_reset_time_is_capped() -> None:
+    """Without a reported reset, stretching stops at POLL_MAX_STRETCH."""
+    clock = FakeClock()
+    limiter = FakeRateLimiter(clock)
+    limiter.reset_time = None
+    limiter.remaining = 0
+    scheduler, _ = _scheduler(limiter, clock)
+
+    intervals = scheduler.plan()
+
+    assert intervals[MODULE_SPACE_WEATHER] == BASES[MODULE_SPACE_WEATHER] * POLL_MAX_STRETCH
+
+
+def test_shrink_back_after_reset() -> None:
+    """Once the reset time passes the quota counts as full again."""
+    clock = FakeClock()
+    limiter = FakeRateLimiter(clock)
+    limiter.remaining = 0
+    scheduler, coordinators = _scheduler(limiter, clock)
+    scheduler.update()
+    assert coordinators[MODULE_SPACE_WEATHER].update_interval > timedelta(
+        seconds=BASES[MODULE_SPACE_WEATHER]
+    )
+
+    clock.advance(3600)
+    scheduler.update()
+
+    assert coordinators[MODULE_SPACE_WEATHER].update_interval == timedelta(
+        seconds=BASES[MODULE_SPACE_WEATHER]
+    )
+
+
+def test_backoff_leaves_no_budget() -> None:
+    """During a 429 backoff quota users wait for the reset, however much remains."""
+    clock = FakeClock()
+    limiter = FakeRateLimiter(clock)
+    limiter.backoff_until = clock() + timedelta(minutes=2)
+    scheduler, _ = _scheduler(limiter, clock)
+
+    intervals = scheduler.plan()
+
+    assert scheduler.get_diagnostics()["budget_per_hour"] == 0
+    assert intervals[MODULE_SPACE_WEATHER] == pytest.approx(3600)
+    assert intervals[NEOWS] == pytest.approx(3600)
+
+    clock.advance(121)
+    assert scheduler.plan()[MODULE_SPACE_WEATHER] == BASES[MODULE_SPACE_WEATHER]
+
+
+def test_shared_key_splits_budget() -> None:
+    """Entries sharing a key each plan with their share of the budget."""
+    clock = FakeClock()
+    limiter = FakeRateLimiter(clock)
+    limiter.remaining = 80
+    alone, _ = _scheduler(limiter, clock)
+    shared, _ = _scheduler(limiter, clock, share=lambda: 0.5)
+
+    alone_plan = alone.plan()
+    shared_plan = shared.plan()
+
+    assert shared.get_diagnostics()["budget_per_hour"] == pytest.approx(
+        alone.get_diagnostics()["budget_per_hour"] / 2, abs=0.1
+    )
+    assert shared_plan[MODULE_SPACE_WEATHER] > alone_plan[MODULE_SPACE_WEATHER]
+    # Two entries at half the budget together spend no more than one alone
+    spend = 2 * sum(POLL_QUOTA_COSTS[name] / shared_plan[name] for name in POLL_QUOTA_COSTS)
+    assert spend <= alone.get_diagnostics()["budget_per_hour"] / 3600 + 1e-9
+
+
+def _simulate(
+    limit: int, external: dict[int, int], hours: int = 4, entries: int = 1
+) -> dict[str, list]:
+    """Run the scheduler second by second against a fixed-window quota.
+
+    `external` maps an hour to requests another user of the key makes in
+    that hour's first 10 minutes. Returns per-hour polls, denied poll
+    requests and the lowest remaining count.
+    """
+    clock = FakeClock()
+    limiter = FakeRateLimiter(clock, limit)
+    schedulers = [
+        _scheduler(limiter, clock, share=lambda: 1 / entries) for _ in range(entries)
+    ]
+    polls = [0] * hours
+    denied = [0] * hours
+    lowest = [limit] * hours
+    for second in range(hours * 3600):
+        hour = second // 3600
+        if clock() >= limiter.reset_time:
+            limiter.remaining = limit
+            limiter.reset_time += timedelta(hours=1)
+            limiter.notify()
+        into_hour = second % 3600
+        if into_hour < 600 and external.get(hour):
+            # Spread evenly over the burst, several per second if need be
+            burst = external[hour]
+            for _ in range((into_hour + 1) * burst // 600 - into_hour * burst // 600):
+                limiter.spend(1)
+        for _, coordinators in schedulers:
+            for name, coordinator in coordinators.items():
+                if coordinator.next_poll > second:
+                    continue
+                coordinator.next_poll = second + coordinator.update_interval.total_seconds()
+                cost = POLL_QUOTA_COSTS.get(name, 0)
+                if not cost:
+                    continue
+                polls[hour] += 1
+                if not limiter.spend(cost):
+                    denied[hour] += 1
+        lowest[hour] = min(lowest[hour], limiter.remaining)
+        clock.advance(1)
+    return {"polls": polls, "denied": denied, "lowest": lowest}
+
+
+@pytest.mark.parametrize("entries", [1, 2])
+@pytest.mark.parametrize(
+    "limit, external",
+    [
+        # Another user of a personal key burns through most of two hours
+        (1000, {1: 960, 2: 600}),
+        # DEMO_KEY-sized quota with a burst of outside use
+        (30, {1: 20}),
+    ],
+)
+def test_simulation_never_runs_out_of_quota(
+    entries: int, limit: int, external: dict[int, int]
+) -> None:
+    """Bursts of outside use stretch polling instead of exhausting the quota."""
+    result = _simulate(limit, external, entries=entries)
+
+    assert result["denied"] == [0, 0, 0, 0]
+    # Polling slows in the busy hour and recovers in the quiet last one
+    assert result["polls"][1] < result["polls"][3]
+
+
+def test_simulation_is_deterministic() -> None:
+    """The same inputs always produce the same schedule."""
+    assert _simulate(limit=30, external={1: 20}) == _simulate(limit=30, external={1: 20})
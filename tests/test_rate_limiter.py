@@ -0,0 +1,130 @@
+"""Tests for the rate limiter's 429 backoff, persisted state and request queue."""
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.helpers.storage import Store
+import pytest
+
+from custom_components.nasa_sky_hub.const import (
+    RATE_LIMIT_STORAGE_KEY,
+    RATE_LIMIT_STORAGE_VERSION,
+)
+from custom_components.nasa_sky_hub.rate_limiter import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    RateLimiter,
+    RateLimitTimeout,
+    RequestTicket,
+    request_deadline,
+    request_deadline_scope,
+    request_ticket,
+)
+
+HEADERS_429 = {"X-RateLimit-Limit": "1000", "X-RateLimit-Remaining": "0"}
+
+
+async def _answer_429(limiter: RateLimiter) -> float:
+    """Record a 429 the way the API client does; return the backoff in minutes."""
+    await limiter.record_response(HEADERS_429, status=429)
+    await limiter.record_429()
+    return limiter.seconds_in_backoff() / 60
+
+
+async def test_consecutive_429s_back_off_exponentially() -> None:
+    """Each 429 in a row doubles the backoff."""
+    limiter = RateLimiter()
+
+    backoffs = [await _answer_429(limiter) for _ in range(4)]
+
+    assert backoffs == pytest.approx([2, 4, 8, 16], abs=0.1)
+
+
+async def test_other_response_ends_429_streak() -> None:
+    """A response that isn't a 429 starts the next backoff from 2 minutes again."""
+    limiter = RateLimiter()
+    await _answer_429(limiter)
+    await _answer_429(limiter)
+
+    await limiter.record_response({"X-RateLimit-Remaining": "10"}, status=200)
+
+    assert await _answer_429(limiter) == pytest.approx(2, abs=0.1)
+
+
+async def test_429_streak_survives_restart(hass, hass_storage) -> None:
+    """The streak is saved, so backoff keeps escalating after a restart."""
+    key = f"{RATE_LIMIT_STORAGE_KEY}.test"
+    limiter = RateLimiter(store=Store(hass, RATE_LIMIT_STORAGE_VERSION, key))
+    assert await _answer_429(limiter) == pytest.approx(2, abs=0.1)
+    assert await _answer_429(limiter) == pytest.approx(4, abs=0.1)
+
+    # Pending saves are flushed when Home Assistant shuts down
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"]["consecutive_429s"] == 2
+
+    restored = RateLimiter(store=Store(hass, RATE_LIMIT_STORAGE_VERSION, key))
+    await restored.async_load()
+
+    assert restored.seconds_in_backoff() / 60 == pytest.approx(4, abs=0.1)
+    assert await _answer_429(restored) == pytest.approx(8, abs=0.1)
+    assert await _answer_429(restored) == pytest.approx(16, abs=0.1)
+
+
+async def _queue(limiter: RateLimiter, order: list[str], name: str, **kwargs) -> None:
+    """Wait for admission and record the order requests got in."""
+    await limiter.acquire(**kwargs)
+    order.append(name)
+
+
+async def test_deadline_scope_keeps_enclosing_deadline() -> None:
+    """A nested scope can only make the deadline earlier."""
+    loop = asyncio.get_running_loop()
+    with request_deadline_scope(5):
+        outer = request_deadline.get()
+        with request_deadline_scope(60):
+            assert request_deadline.get() == outer
+        with request_deadline_scope(1):
+            assert request_deadline.get() < outer
+    assert request_deadline.get() is None
+    assert outer == pytest.approx(loop.time() + 5, abs=0.5)
+
+
+async def test_tightened_ticket_moves_up_the_queue() -> None:
+    """A queued request whose ticket gains a higher priority is admitted first."""
+    # Ten tokens a second and no burst, so each waiter is admitted in turn
+    limiter = RateLimiter(limit=36000, burst=1)
+    await limiter.acquire()
+    order: list[str] = []
+    first = asyncio.create_task(_queue(limiter, order, "first", priority=PRIORITY_BACKGROUND))
+    ticket = RequestTicket(PRIORITY_BACKGROUND, None)
+    token = request_ticket.set(ticket)
+    shared = asyncio.create_task(_queue(limiter, order, "shared"))
+    request_ticket.reset(token)
+    await asyncio.sleep(0)
+    assert ticket.queued is not None
+
+    ticket.tighten(PRIORITY_INTERACTIVE, None)
+    await asyncio.gather(first, shared)
+
+    assert order == ["shared", "first"]
+    assert ticket.queued is None
+
+
+async def test_tightened_deadline_fails_fast() -> None:
+    """A queued request fails at once when a joiner's deadline can't be met."""
+    limiter = RateLimiter(limit=3600, burst=1)
+    await limiter.acquire()
+    ticket = RequestTicket(PRIORITY_BACKGROUND, None)
+    token = request_ticket.set(ticket)
+    shared = asyncio.create_task(limiter.acquire())
+    request_ticket.reset(token)
+    await asyncio.sleep(0)
+
+    # The next token is a second away
+    ticket.tighten(PRIORITY_BACKGROUND, asyncio.get_running_loop().time() + 0.1)
+
+    with pytest.raises(RateLimitTimeout):
+        await asyncio.wait_for(shared, 0.05)
+    assert limiter.stats["rejected"] == 1
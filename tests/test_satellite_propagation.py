@@ -0,0 +1,210 @@
+"""Tests comparing batched SGP4 propagation with Skyfield's per-object path."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from skyfield.api import EarthSatellite, wgs84
+
+from custom_components.nasa_sky_hub.ephemeris import get_timescale
+from custom_components.nasa_sky_hub.satellite_catalog import SatelliteCatalog
+from custom_components.nasa_sky_hub.satellite_propagation import (
+    EARTH_RADIUS_KM,
+    SHADOW_PENUMBRA,
+    SHADOW_SUNLIT,
+    SHADOW_UMBRA,
+    BatchPropagator,
+    earth_shadow,
+)
+from custom_components.nasa_sky_hub.satellite_tracker import (
+    OBSERVER_DARK_SUN_ALTITUDE,
+    SatelliteTracker,
+)
+
+from .common import REFERENCE_TIME, synthetic_tles
+
+# Both paths apply the same rotations; only float rounding differs
+ANGLE_TOLERANCE_DEG = 1e-7
+DISTANCE_TOLERANCE_KM = 1e-6
+
+AU_KM = 149_597_870.7
+
+
+class FixedSunEphemeris:
+    """Ephemeris stand-in that puts the Sun at one fixed geocentric position."""
+
+    def __init__(self, sun_km: np.ndarray) -> None:
+        """Initialize with the Sun's geocentric GCRS position in km."""
+        self.sun_km = sun_km
+
+    def __getitem__(self, name: str) -> FixedSunEphemeris:
+        """Return the ephemeris itself for "sun" and "earth"."""
+        return self
+
+    def __sub__(self, other: FixedSunEphemeris) -> FixedSunEphemeris:
+        """Return the Earth -> Sun vector, which is the ephemeris itself."""
+        return self
+
+    def at(self, t) -> SimpleNamespace:
+        """Return the fixed Sun position."""
+        return SimpleNamespace(position=SimpleNamespace(km=self.sun_km))
+
+
+@pytest.fixture(name="ts")
+def ts_fixture():
+    """Return Skyfield's built-in timescale."""
+    return get_timescale()
+
+
+@pytest.mark.parametrize("latitude, longitude", [(40.0, -75.0), (-33.9, 18.4), (78.2, 15.6)])
+def test_batch_matches_earth_satellite(ts, latitude, longitude) -> None:
+    """Alt/az/range of the whole batch match EarthSatellite.at() per object."""
+    tles = synthetic_tles(300)
+    observer = wgs84.latlon(latitude, longitude)
+    t = ts.from_datetime(REFERENCE_TIME)
+
+    batch = BatchPropagator.from_tles(tles).topocentric(t, observer)
+
+    assert batch.valid.all()
+    for idx, norad_id in enumerate(batch.norad_ids):
+        satellite = EarthSatellite(*tles[int(norad_id)], ts=ts)
+        alt, az, distance = (satellite - observer).at(t).altaz()
+        assert batch.altitude_deg[idx] == pytest.approx(alt.degrees, abs=ANGLE_TOLERANCE_DEG)
+        # Compare azimuths across the 0/360 wrap
+        assert (batch.azimuth_deg[idx] - az.degrees + 180) % 360 - 180 == pytest.approx(
+            0, abs=ANGLE_TOLERANCE_DEG
+        )
+        assert batch.distance_km[idx] == pytest.approx(distance.km, abs=DISTANCE_TOLERANCE_KM)
+
+
+@pytest.mark.parametrize(
+    "latitude, longitude, elevation_m",
+    [
+        (89.9, 0.0, 0.0),  # North pole
+        (-78.5, 106.9, 3500.0),  # Antarctic plateau
+        (0.0, -78.5, 0.0),  # Equator
+        (-23.0, -67.8, 5100.0),  # Atacama high site
+        (27.99, 86.93, 8849.0),  # Everest summit
+    ],
+)
+@pytest.mark.parametrize("min_altitude", [0.0, 10.0, 45.0, 80.0])
+def test_prefilter_never_drops_visible_objects(
+    ts, latitude, longitude, elevation_m, min_altitude
+) -> None:
+    """Every object the unfiltered pass puts above `min_altitude` survives the pre-filter."""
+    propagator = BatchPropagator.from_tles(synthetic_tles(2000, seed=7))
+    observer = wgs84.latlon(latitude, longitude, elevation_m=elevation_m)
+
+    for hours in range(0, 24, 2):
+        t = ts.from_datetime(REFERENCE_TIME + timedelta(hours=hours, minutes=7 * hours))
+        everything = propagator.topocentric(t, observer)
+        filtered = propagator.topocentric(t, observer, min_altitude)
+
+        up = everything.valid & (everything.altitude_deg >= min_altitude)
+        assert set(everything.norad_ids[up]) <= set(filtered.norad_ids)
+        # Objects that pass the filter get the unfiltered result
+        rows = np.searchsorted(everything.norad_ids, filtered.norad_ids)
+        np.testing.assert_allclose(
+            filtered.altitude_deg, everything.altitude_deg[rows], rtol=0, atol=1e-9
+        )
+
+
+def test_empty_catalog(ts) -> None:
+    """An empty catalog propagates to empty arrays."""
+    batch = BatchPropagator.from_tles({}).topocentric(
+        ts.from_datetime(REFERENCE_TIME), wgs84.latlon(0.0, 0.0)
+    )
+
+    assert len(batch.norad_ids) == 0
+    assert np.size(batch.altitude_deg) == 0
+
+
+async def test_concurrent_passes_keep_their_own_counters() -> None:
+    """Visibility passes running side by side each return their own pre-filter counters."""
+    tracker = SatelliteTracker(40.0, -75.0)
+    tracker.catalog = SatelliteCatalog.from_records(
+        [(norad_id, "", *tle) for norad_id, tle in synthetic_tles(500).items()]
+    )
+    snapshot = await tracker.async_snapshot()
+    elevations = [0.0, 30.0] * 4
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda elevation: tracker.compute_visible_satellites(
+                    snapshot, REFERENCE_TIME, elevation
+                ),
+                elevations,
+            )
+        )
+
+    assert len({result.prefilter["visible"] for result in results}) == 2
+    for result in results:
+        assert result.prefilter["visible"] == len(result.satellites)
+
+
+def test_earth_shadow_classifies_fixed_positions() -> None:
+    """Points on the anti-Sun axis, at the shadow's edge and on the day side."""
+    sun_km = np.array([AU_KM, 0.0, 0.0])
+    positions = np.array(
+        [
+            [-7000.0, 0.0, 0.0],  # behind the Earth on the axis
+            [-7000.0, EARTH_RADIUS_KM + 2.0, 0.0],  # just outside the umbra cone
+            [-7000.0, 0.0, EARTH_RADIUS_KM + 100.0],  # clear of the penumbra
+            [7000.0, 0.0, 0.0],  # day side
+            [0.0, 7000.0, 0.0],  # terminator
+        ]
+    )
+
+    state = earth_shadow(positions, sun_km)
+
+    assert state.tolist() == [
+        SHADOW_UMBRA,
+        SHADOW_PENUMBRA,
+        SHADOW_SUNLIT,
+        SHADOW_SUNLIT,
+        SHADOW_SUNLIT,
+    ]
+
+
+@pytest.mark.parametrize(
+    "sun_altitude, observer_dark",
+    [
+        (-90.0, True),
+        (OBSERVER_DARK_SUN_ALTITUDE - 1.0, True),
+        (OBSERVER_DARK_SUN_ALTITUDE + 1.0, False),
+        (45.0, False),
+    ],
+)
+async def test_observable_needs_sunlit_satellite_and_dark_sky(
+    ts, sun_altitude, observer_dark
+) -> None:
+    """A satellite is observable only when sunlit and the Sun is below the dark limit."""
+    tracker = SatelliteTracker(40.0, -75.0)
+    tracker.catalog = SatelliteCatalog.from_records(
+        [(norad_id, "", *tle) for norad_id, tle in synthetic_tles(1000).items()]
+    )
+    snapshot = await tracker.async_snapshot()
+    t = ts.from_datetime(REFERENCE_TIME)
+    # Sun due north at `sun_altitude`, turned from the horizon frame into GCRS
+    altitude = np.radians(sun_altitude)
+    direction = np.array([np.cos(altitude), 0.0, np.sin(altitude)])
+    sun_km = tracker.observer.at(t).position.km + AU_KM * (
+        tracker.observer.rotation_at(t).T @ direction
+    )
+    tracker.eph = FixedSunEphemeris(sun_km)
+
+    satellites, _ = tracker.compute_visible_satellites(snapshot, REFERENCE_TIME)
+
+    assert satellites
+    for sat in satellites:
+        assert sat["sunlit"] == (sat["eclipse"] != "umbra")
+        assert sat["observable"] == (sat["sunlit"] and observer_dark)
+    if sun_altitude == -90.0:
+        # At local midnight low satellites sit in the umbra, high ones catch the Sun
+        assert {sat["sunlit"] for sat in satellites} == {True, False}
+    if observer_dark:
+        assert any(sat["observable"] for sat in satellites)
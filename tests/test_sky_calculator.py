@@ -0,0 +1,35 @@
+"""Tests for the sky calculator's solar system lookups."""
+from __future__ import annotations
+
+import numpy as np
+
+from custom_components.nasa_sky_hub.sky_calculator import SkyCalculator
+from custom_components.nasa_sky_hub.sky_snapshot import SkySnapshot
+from custom_components.nasa_sky_hub.solar_system import BodyPositions
+
+from .common import REFERENCE_TIME
+
+
+def test_moon_is_found_by_name() -> None:
+    """Moon readings come from the Moon's row wherever it sits in the arrays."""
+    snapshot = SkySnapshot(REFERENCE_TIME)
+    # Venus placed between the Sun and the Moon, with very different values
+    snapshot.bodies = BodyPositions(
+        names=("sun", "venus", "moon"),
+        altitude_deg=np.array([-40.0, -10.0, 35.0]),
+        azimuth_deg=np.array([0.0, 90.0, 180.0]),
+        distance_au=np.array([1.0, 0.7, 0.0026]),
+        phase_angle_deg=np.array([0.0, 60.0, 5.0]),
+        illuminated_fraction=np.array([1.0, 0.75, 0.99]),
+        magnitude=np.array([-26.74, -4.2, -12.6]),
+        moon_elongation_deg=175.0,
+    )
+    calculator = SkyCalculator(40.0, -75.0)
+
+    moon = calculator.get_moon(snapshot)
+    assert moon["name"] == "Moon"
+    assert moon["altitude"] == 35.0
+    assert moon["above_horizon"] is True
+    assert moon["phase"] == "Full Moon"
+    # A nearly full Moon 35 degrees up lights the sky almost fully
+    assert calculator.get_moonlight(snapshot) > 0.8
@@ -0,0 +1,73 @@
+"""Tests for the DONKI event index of the space weather coordinator."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.nasa_sky_hub.const import DONKI_RESYNC_HOURS
+from custom_components.nasa_sky_hub.coordinators.space_weather import (
+    SpaceWeatherCoordinator,
+)
+
+
+class DonkiFeed:
+    """Stand-in API client serving whatever flares are currently published."""
+
+    def __init__(self) -> None:
+        """Initialize the feed with no events."""
+        self.flares: list[dict[str, str]] = []
+        self.queries: list[tuple[str, str]] = []
+
+    async def get_donki_flr(self, start_date: str, end_date: str) -> list[dict[str, str]]:
+        """Return the published flares that began on or after `start_date`."""
+        self.queries.append((start_date, end_date))
+        return [flare for flare in self.flares if flare["beginTime"][:10] >= start_date]
+
+    async def get_donki_cme(self, start_date: str, end_date: str) -> list[dict[str, str]]:
+        """Return no CMEs."""
+        return []
+
+    async def get_donki_gst(self, start_date: str, end_date: str) -> list[dict[str, str]]:
+        """Return no storms."""
+        return []
+
+
+def _flare(flare_id: str, begin: datetime) -> dict[str, str]:
+    """Return a DONKI flare record."""
+    return {
+        "flrID": flare_id,
+        "beginTime": begin.strftime("%Y-%m-%dT%H:%MZ"),
+        "classType": "C1.0",
+    }
+
+
+def _flare_ids(coordinator: SpaceWeatherCoordinator) -> list[str]:
+    """Return the IDs of the indexed flares in time order."""
+    return [flare["flrID"] for flare in coordinator._sorted_events("flares")]
+
+
+async def test_full_resync_drops_retracted_events(hass, freezer) -> None:
+    """Incremental polls keep indexed events; a full resync mirrors DONKI."""
+    now = datetime.now(timezone.utc)
+    feed = DonkiFeed()
+    feed.flares = [
+        _flare("old", now - timedelta(days=2)),
+        _flare("recent", now - timedelta(hours=1)),
+    ]
+    coordinator = SpaceWeatherCoordinator(hass, feed)
+
+    await coordinator._async_update_data()
+    assert _flare_ids(coordinator) == ["old", "recent"]
+
+    # DONKI retracts the old flare; the incremental poll does not ask for it
+    feed.flares = feed.flares[1:]
+    freezer.tick(timedelta(minutes=30))
+    await coordinator._async_update_data()
+    assert feed.queries[-1][0] > feed.queries[0][0]
+    assert _flare_ids(coordinator) == ["old", "recent"]
+
+    freezer.tick(timedelta(hours=DONKI_RESYNC_HOURS))
+    await coordinator._async_update_data()
+    assert _flare_ids(coordinator) == ["recent"]
+    stats = coordinator.get_diagnostics()["flares"]
+    assert stats["full_window"] is True
+    assert stats["removed"] == 1
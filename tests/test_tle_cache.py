@@ -0,0 +1,218 @@
+"""Tests for the TLE caches: the on-disk catalog, against a local CelesTrak stand-in, and parsed satellites."""
+from __future__ import annotations
+
+from functools import partial
+
+from aiohttp import web
+from homeassistant.helpers.storage import Store
+import pytest
+
+from custom_components.nasa_sky_hub import satellite_tracker as satellite_tracker_module
+from custom_components.nasa_sky_hub.api_client import NASAApiClient
+from custom_components.nasa_sky_hub.const import (
+    HOST_CELESTRAK,
+    TLE_STORAGE_KEY,
+    TLE_STORAGE_VERSION,
+)
+from custom_components.nasa_sky_hub.rate_limiter import RateLimiter
+from custom_components.nasa_sky_hub.satellite_catalog import SatelliteCatalog
+from custom_components.nasa_sky_hub.satellite_tracker import SatelliteTracker
+
+from .common import ISS_TLE, REFERENCE_TIME, synthetic_tles
+
+GROUPS = ["stations", "visual"]
+LAST_MODIFIED = "Sat, 17 Oct 2026 00:00:00 GMT"
+
+
+def _group_text(tles: dict[int, tuple[str, str]]) -> str:
+    """Return TLEs in CelesTrak's three-line format."""
+    return "\n".join(
+        f"SAT {norad_id}\n{line1}\n{line2}" for norad_id, (line1, line2) in tles.items()
+    )
+
+
+@pytest.fixture
+async def celestrak_server(socket_enabled, aiohttp_server):
+    """Serve two TLE groups with validators, answering 304 when they match."""
+    tles = list(synthetic_tles(9, seed=3).items())
+    groups = {
+        "stations": _group_text(dict(tles[:5])),
+        "visual": _group_text(dict(tles[4:])),
+    }
+    requests: list[dict] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        group = request.query["GROUP"]
+        etag = f'"{group}-v1"'
+        requests.append({
+            "group": group,
+            "if_none_match": request.headers.get("If-None-Match"),
+            "if_modified_since": request.headers.get("If-Modified-Since"),
+            "peer": request.transport.get_extra_info("peername"),
+        })
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304)
+        return web.Response(
+            text=groups[group], headers={"ETag": etag, "Last-Modified": LAST_MODIFIED}
+        )
+
+    app = web.Application()
+    app.router.add_get("/gp.php", handler)
+    server = await aiohttp_server(app)
+    server.requests = requests
+    server.satellites = len(tles)
+    return server
+
+
+@pytest.fixture
+def celestrak_url(celestrak_server, monkeypatch):
+    """Point the tracker's group URL at the stand-in server."""
+    monkeypatch.setattr(
+        satellite_tracker_module,
+        "CELESTRAK_GROUP_URL",
+        str(celestrak_server.make_url("/gp.php")) + "?GROUP={group}&FORMAT=tle",
+    )
+
+
+@pytest.fixture
+async def api_client(hass):
+    """Return an API client whose pooled session the tracker shares."""
+    client = NASAApiClient("DEMO_KEY", RateLimiter(), hass)
+    yield client
+    await client.async_close()
+
+
+def _tracker(
+    hass, api_client: NASAApiClient, entry_id: str = "entry", groups: list[str] = GROUPS
+) -> SatelliteTracker:
+    """Return a tracker wired up the way SatelliteCoordinator does it."""
+    return SatelliteTracker(
+        40.0,
+        -75.0,
+        hass=hass,
+        session_factory=api_client.async_get_session,
+        request_guard=partial(api_client.async_call_host, HOST_CELESTRAK),
+        store=Store(hass, TLE_STORAGE_VERSION, f"{TLE_STORAGE_KEY}.{entry_id}"),
+        groups=groups,
+    )
+
+
+async def test_conditional_fetch_reuses_catalog(
+    hass, api_client, celestrak_server, celestrak_url
+):
+    """A refresh sends the validators back and a 304 keeps the parsed catalog."""
+    tracker = _tracker(hass, api_client)
+
+    await tracker.update_tles_if_needed()
+    assert len(tracker.catalog) == celestrak_server.satellites
+    assert all(request["if_none_match"] is None for request in celestrak_server.requests)
+    catalog = tracker.catalog
+    snapshot = await tracker.async_snapshot()
+
+    await tracker.update_tles_if_needed(force=True)
+
+    revalidations = celestrak_server.requests[len(GROUPS):]
+    assert sorted(request["group"] for request in revalidations) == GROUPS
+    for request in revalidations:
+        assert request["if_none_match"] == f'"{request["group"]}-v1"'
+        assert request["if_modified_since"] == LAST_MODIFIED
+    assert tracker.refresh_stats["not_modified_groups"] == GROUPS
+    assert tracker.catalog is catalog
+    assert await tracker.async_snapshot() is snapshot
+
+
+async def test_warm_start_from_store(
+    hass, hass_storage, api_client, celestrak_server, celestrak_url
+):
+    """A restarted tracker loads the cached catalog without downloading it."""
+    await _tracker(hass, api_client).update_tles_if_needed()
+    requests = len(celestrak_server.requests)
+    cached = hass_storage[f"{TLE_STORAGE_KEY}.entry"]["data"]["groups"]
+    assert sorted(cached) == GROUPS
+    assert cached["stations"]["etag"] == '"stations-v1"'
+
+    restarted = _tracker(hass, api_client)
+    await restarted.update_tles_if_needed()
+
+    assert len(celestrak_server.requests) == requests
+    assert len(restarted.catalog) == celestrak_server.satellites
+    snapshot = await restarted.async_snapshot()
+    assert len(snapshot.propagator) == celestrak_server.satellites
+    assert restarted.tle_update_time is not None
+
+    # Revalidation after the restart still sends the cached validators
+    await restarted.update_tles_if_needed(force=True)
+    assert all(
+        request["if_none_match"] is not None
+        for request in celestrak_server.requests[requests:]
+    )
+
+
+async def test_entries_keep_their_own_cache(
+    hass, hass_storage, api_client, celestrak_server, celestrak_url
+):
+    """Entries tracking different groups warm-start from their own cached groups."""
+    await _tracker(hass, api_client, "entry_a", ["stations"]).update_tles_if_needed()
+    await _tracker(hass, api_client, "entry_b", ["visual"]).update_tles_if_needed()
+    requests = len(celestrak_server.requests)
+    assert list(hass_storage[f"{TLE_STORAGE_KEY}.entry_a"]["data"]["groups"]) == ["stations"]
+    assert list(hass_storage[f"{TLE_STORAGE_KEY}.entry_b"]["data"]["groups"]) == ["visual"]
+
+    for entry_id, group, satellites in (("entry_a", "stations", 5), ("entry_b", "visual", 6)):
+        restarted = _tracker(hass, api_client, entry_id, [group])
+        await restarted.update_tles_if_needed()
+        assert len(restarted.catalog) == satellites
+
+    assert len(celestrak_server.requests) == requests
+
+
+async def test_downloads_share_the_client_session(
+    hass, api_client, celestrak_server, celestrak_url
+):
+    """TLE downloads use the API client's session and its kept-alive connections."""
+    tracker = _tracker(hass, api_client)
+
+    await tracker.update_tles_if_needed()
+    session = await api_client.async_get_session()
+    first_peers = {request["peer"] for request in celestrak_server.requests}
+    await tracker.update_tles_if_needed(force=True)
+
+    assert not session.closed
+    assert await api_client.async_get_session() is session
+    later_peers = {request["peer"] for request in celestrak_server.requests[len(GROUPS):]}
+    assert later_peers <= first_peers
+    # Every download went through CelesTrak's rate limiter
+    granted = api_client.rate_limiters[HOST_CELESTRAK].stats["granted"]
+    assert granted == len(celestrak_server.requests)
+
+
+async def test_parsed_tles_reused_per_epoch() -> None:
+    """A catalog swap and pass prediction only parse TLEs whose epoch changed."""
+    tles = synthetic_tles(20)
+    tracker = SatelliteTracker(40.0, -75.0)
+    tracker.catalog = SatelliteCatalog.from_records(
+        [(norad_id, "", *tle) for norad_id, tle in tles.items()]
+    )
+    snapshot = await tracker.async_snapshot()
+
+    tracker.compute_passes(snapshot, 25544, REFERENCE_TIME, max_hours=1)
+    tracker.compute_passes(snapshot, 25544, REFERENCE_TIME, max_hours=1)
+    stats = tracker.pop_cache_stats()
+    assert (stats["parsed"], stats["reused"], stats["dropped"]) == (21, 0, 0)
+    assert (stats["pass_parsed"], stats["pass_reused"]) == (1, 1)
+    assert (stats["parsed_last_poll"], stats["parses_saved_last_poll"]) == (22, 1)
+
+    # A newer ISS TLE is the only record parsed again
+    tles[25544] = (ISS_TLE[0].replace("26289.50000000", "26290.50000000"), ISS_TLE[1])
+    tracker.catalog = SatelliteCatalog.from_records(
+        [(norad_id, "", *tle) for norad_id, tle in tles.items()]
+    )
+    previous = snapshot
+    snapshot = await tracker.async_snapshot()
+    tracker.compute_passes(snapshot, 25544, REFERENCE_TIME, max_hours=1)
+    stats = tracker.pop_cache_stats()
+    assert (stats["parsed"], stats["reused"], stats["dropped"]) == (22, 20, 1)
+    assert (stats["pass_parsed"], stats["pass_dropped"]) == (2, 1)
+    assert (stats["parsed_last_poll"], stats["parses_saved_last_poll"]) == (2, 20)
+    assert snapshot.satrecs[10000] is previous.satrecs[10000]
+    assert snapshot.satrecs[25544] is not previous.satrecs[25544]